@@ -0,0 +1,37 @@
+import time
+
+from rectapy import RectaPy
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+
+SETUP = """
+var a = array(range(1000000));
+var b = array(range(1000000));
+"""
+
+VECTOR = """
+var c = a + b;
+"""
+
+LOOP = """
+var c = array(1000000);
+for i in range(1000000) {
+  c[i] = a[i] + b[i];
+}
+"""
+
+
+def measure(rectapy: RectaPy, code: str) -> float:
+    start = time.perf_counter()
+    rectapy.run(code)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    for engine in ENGINES:
+        rectapy = RectaPy(engine)
+        rectapy.run(SETUP)
+
+        vector = min(measure(rectapy, VECTOR) for _ in range(5))
+        loop = measure(rectapy, LOOP)
+        print(f'{engine}: a + b {vector * 1000:.1f}ms, element loop {loop * 1000:.1f}ms ({loop / vector:.0f}x)')
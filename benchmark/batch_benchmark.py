@@ -0,0 +1,47 @@
+import io
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+from rectapy.batch import batch
+
+SCRIPT = """
+fun fib(n) {
+  if n < 2 {
+    return n;
+  }
+  return fib(n - 1) + fib(n - 2);
+}
+
+print fib(%d);
+"""
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+
+    try:
+        filenames = []
+        for index in range(400):
+            filename = os.path.join(directory, f'script{index}.recta')
+            with open(filename, 'w') as f:
+                f.write(SCRIPT % (10 + index % 5))
+            filenames.append(filename)
+
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            for filename in filenames:
+                RectaPy(cache=False).run_file(filename)
+        serial = time.perf_counter() - start
+        print(f'serial: {serial:.3f}s ({len(filenames) / serial:.0f} scripts/s)')
+
+        for workers in (2, os.cpu_count()):
+            start = time.perf_counter()
+            for _ in batch(filenames, workers=workers, cache=False):
+                pass
+            elapsed = time.perf_counter() - start
+            print(f'{workers} workers: {elapsed:.3f}s ({len(filenames) / elapsed:.0f} scripts/s)')
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,38 @@
+import time
+
+from rectapy import RectaPy, Budget
+
+LOOP = """
+fun step(total, i) {
+  return total + i * 2 - 1;
+}
+
+var total = 0;
+var i = 0;
+while i < 100000 {
+  total = step(total, i);
+  i = i + 1;
+}
+"""
+
+BUDGETS = {
+    'none': None,
+    'statements': Budget(statements=10 ** 9),
+    'all': Budget(statements=10 ** 9, seconds=3600, depth=1000, environments=10 ** 9, string_length=10 ** 9,
+                  array_length=10 ** 9),
+}
+
+if __name__ == '__main__':
+    baseline = None
+
+    for name, budget in BUDGETS.items():
+        timings = []
+        for _ in range(7):
+            rectapy = RectaPy('tree')
+            start = time.perf_counter()
+            rectapy.run(LOOP, budget=budget)
+            timings.append(time.perf_counter() - start)
+
+        elapsed = min(timings)
+        baseline = baseline or elapsed
+        print(f'{name}: {elapsed:.3f}s ({(elapsed / baseline - 1) * 100:+.1f}%)')
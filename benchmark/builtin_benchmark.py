@@ -0,0 +1,56 @@
+import time
+
+from rectapy import RectaPy
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+
+SQRT_RECTA = """
+fun root(x) {
+  var guess = x / 2 + 1;
+  var i = 0;
+  while i < 20 {
+    guess = (guess + x / guess) / 2;
+    i = i + 1;
+  }
+  return guess;
+}
+
+var total = 0;
+for i in range(20000) total = total + root(i);
+"""
+
+SQRT_NATIVE = """
+var total = 0;
+for i in range(20000) total = total + sqrt(i);
+"""
+
+SUM_RECTA = """
+var total = 0;
+for i in range(200000) total = total + i;
+"""
+
+SUM_NATIVE = """
+var total = sum(range(200000));
+"""
+
+WORKLOADS = {
+    'sqrt': (SQRT_RECTA, SQRT_NATIVE),
+    'sum': (SUM_RECTA, SUM_NATIVE),
+}
+
+
+def measure(engine: str, code: str) -> float:
+    rectapy = RectaPy(engine)
+
+    start = time.perf_counter()
+    rectapy.run(code)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    for workload, (recta, native) in WORKLOADS.items():
+        for engine in ENGINES:
+            interpreted = measure(engine, recta)
+            builtin = measure(engine, native)
+            print(f'{workload} {engine}: recta {interpreted * 1000:.1f}ms, native {builtin * 1000:.1f}ms '
+                  f'({interpreted / builtin:.1f}x)')
@@ -0,0 +1,62 @@
+import io
+import os
+import shutil
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+from rectapy.cache import CACHE_DIRECTORY
+
+FUNCTION = """fun f%d(a, b) {
+  var c = a * %d + b;
+  if c > 100 {
+    return c - 1;
+  }
+  return c + 1;
+}
+"""
+
+
+def generate(lines: int) -> str:
+    chunks = []
+    size = 0
+    i = 0
+    while size < lines:
+        chunk = FUNCTION % (i, i) + f'var v{i} = f{i}({i}, 2);\n'
+        chunks.append(chunk)
+        size += chunk.count('\n')
+        i += 1
+
+    return ''.join(chunks)
+
+
+def measure(filename: str, cache: bool) -> float:
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        RectaPy(cache=cache).run_file(filename)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, 'generated.recta')
+
+    try:
+        with open(filename, 'w') as f:
+            f.write(generate(5000))
+
+        uncached = min(measure(filename, False) for _ in range(5))
+
+        cold = []
+        for _ in range(5):
+            shutil.rmtree(os.path.join(directory, CACHE_DIRECTORY), ignore_errors=True)
+            cold.append(measure(filename, True))
+
+        warm = min(measure(filename, True) for _ in range(5))
+
+        print(f'no cache: {uncached:.3f}s')
+        print(f'cold: {min(cold):.3f}s')
+        print(f'warm: {warm:.3f}s ({uncached / warm:.1f}x)')
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,29 @@
+import time
+
+from rectapy import RectaPy
+
+CALLS = {
+    0: ('fun f() { return 1; }', 'f()'),
+    1: ('fun f(a) { return a; }', 'f(i)'),
+    3: ('fun f(a, b, c) { return a; }', 'f(i, i, i)'),
+}
+
+LOOP = """
+%s
+var i = 0;
+while i < 50000 {
+  %s;
+  i = i + 1;
+}
+"""
+
+if __name__ == '__main__':
+    for arguments, (function, call) in CALLS.items():
+        timings = []
+        for _ in range(9):
+            rectapy = RectaPy('tree')
+            start = time.perf_counter()
+            rectapy.run(LOOP % (function, call))
+            timings.append(time.perf_counter() - start)
+
+        print(f'{arguments} arguments: {min(timings):.3f}s (best of 9)')
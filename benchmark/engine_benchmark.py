@@ -0,0 +1,46 @@
+import time
+
+from rectapy import RectaPy
+
+FIBONACCI = """
+fun fibonacci(n) {
+  if n <= 1 {
+    return n;
+  }
+  return fibonacci(n - 2) + fibonacci(n - 1);
+}
+
+fibonacci(25);
+"""
+
+LOOP = """
+var total = 0;
+var i = 0;
+while i < 200000 {
+  total = total + i * 2 - 1;
+  i = i + 1;
+}
+"""
+
+WORKLOADS = {
+    'fibonacci(25)': FIBONACCI,
+    'loop(200000)': LOOP,
+}
+
+
+def measure(engine: str, code: str) -> float:
+    rectapy = RectaPy(engine)
+
+    start = time.perf_counter()
+    rectapy.run(code)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    for workload, code in WORKLOADS.items():
+        baseline = measure('tree', code)
+        print(f'{workload} tree: {baseline:.3f}s')
+
+        for engine in ('vm', 'closure', 'py'):
+            elapsed = measure(engine, code)
+            print(f'{workload} {engine}: {elapsed:.3f}s ({baseline / elapsed:.1f}x)')
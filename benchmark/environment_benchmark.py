@@ -0,0 +1,32 @@
+import time
+import tracemalloc
+
+from rectapy import RectaPy, Environment
+
+FIBONACCI = """
+fun fibonacci(n) {
+  if n <= 1 {
+    return n;
+  }
+  return fibonacci(n - 2) + fibonacci(n - 1);
+}
+
+fibonacci(22);
+"""
+
+FRAMES = 10000
+
+if __name__ == '__main__':
+    timings = []
+    for _ in range(5):
+        rectapy = RectaPy()
+        start = time.perf_counter()
+        rectapy.run(FIBONACCI)
+        timings.append(time.perf_counter() - start)
+    print(f'fibonacci(22): {min(timings):.3f}s (best of 5)')
+
+    tracemalloc.start()
+    frames = [Environment(None, [float(i), 1.0, 2.0]) for i in range(FRAMES)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'environment with 3 locals: {current / FRAMES:.0f} bytes')
@@ -0,0 +1,32 @@
+import time
+
+from rectapy import RectaPy
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+
+FOR = """
+var total = 0;
+for i in range(1000000) {
+  total = total + i;
+}
+"""
+
+WHILE = """
+var total = 0;
+var i = 0;
+while i < 1000000 {
+  total = total + i;
+  i = i + 1;
+}
+"""
+
+if __name__ == '__main__':
+    for engine in ENGINES:
+        timings = {}
+        for name, code in (('while', WHILE), ('for', FOR)):
+            start = time.perf_counter()
+            RectaPy(engine).run(code)
+            timings[name] = time.perf_counter() - start
+
+        speedup = timings['while'] / timings['for']
+        print(f'{engine}: while {timings["while"]:.3f}s, for {timings["for"]:.3f}s ({speedup:.2f}x)')
@@ -0,0 +1,45 @@
+import io
+import time
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+PROGRAM = """
+fun fib(n) {
+  if n < 2 {
+    return n;
+  }
+  return fib(n - 1) + fib(n - 2);
+}
+
+print fib(20);
+"""
+
+EVENTS = {
+    'none': (),
+    'statement': ('statement',),
+    'calls': ('enter', 'exit'),
+    'all': ('statement', 'enter', 'exit', 'environment'),
+}
+
+
+def ignore(*arguments):
+    pass
+
+
+if __name__ == '__main__':
+    for name, events in EVENTS.items():
+        timings = []
+        for _ in range(5):
+            rectapy = RectaPy('tree')
+            for event in events:
+                rectapy.interpreter.listen(event, ignore)
+
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                rectapy.run(PROGRAM)
+            timings.append(time.perf_counter() - start)
+
+        print(f'{name}: {min(timings):.3f}s')
+
+    print(rectapy.interpreter.counters())
@@ -0,0 +1,40 @@
+import time
+
+from rectapy import Lexer, RegexLexer
+
+BLOCK = """
+// accumulate a running total
+fun step%d(total, value) {
+  var scaled = value * 2.5 - 1;
+  if scaled >= 10 and total != null {
+    return total + scaled;
+  }
+  print "step" + 'done';
+  return total;
+}
+"""
+
+
+def generate(size: int) -> str:
+    chunks = []
+    length = 0
+    i = 0
+    while length < size:
+        chunk = BLOCK % i
+        chunks.append(chunk)
+        length += len(chunk)
+        i += 1
+
+    return ''.join(chunks)
+
+
+if __name__ == '__main__':
+    source = generate(4 * 1024 * 1024)
+    print(f'source: {len(source) / 1024 / 1024:.1f} MB')
+
+    for lexer_class in (Lexer, RegexLexer):
+        start = time.perf_counter()
+        tokens = lexer_class(source).lex()
+        elapsed = time.perf_counter() - start
+
+        print(f'{lexer_class.__name__}: {elapsed:.3f}s ({len(tokens) / elapsed / 1e6:.2f}M tokens/s)')
@@ -0,0 +1,40 @@
+import io
+import time
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+FIBONACCI = """
+fun fibonacci(n) {
+  if n <= 1 {
+    return n;
+  }
+  return fibonacci(n - 2) + fibonacci(n - 1);
+}
+
+print fibonacci(%d);
+"""
+
+
+def measure(n: int, memoize: int) -> float:
+    rectapy = RectaPy(memoize=memoize)
+
+    output = io.StringIO()
+
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        rectapy.run(FIBONACCI % n)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    for n in (15, 20, 25):
+        plain = measure(n, 0)
+        memoized = measure(n, 4096)
+        print(f'fibonacci({n}): plain {plain * 1000:.1f}ms, memoized {memoized * 1000:.1f}ms '
+              f'({plain / memoized:.0f}x)')
+
+    rectapy = RectaPy(memoize=4096)
+    with redirect_stdout(io.StringIO()):
+        rectapy.run(FIBONACCI % 500)
+    print(f'fibonacci(500) memoized: {rectapy.interpreter.memo.stats()}')
@@ -0,0 +1,58 @@
+import gc
+import tracemalloc
+
+from rectapy import RegexLexer, Parser, expression as expr, statement as stmt
+
+BLOCK = """
+fun step%d(total, value) {
+  var scaled = value * 2.5 - 1;
+  if scaled >= 10 and total != null {
+    return total + scaled;
+  }
+  while total < 100 {
+    total = total + step(value, "step");
+  }
+  return total;
+}
+"""
+
+
+def count_nodes(statements) -> int:
+    seen = set()
+    pending = list(statements)
+
+    while pending:
+        node = pending.pop()
+        if node is None or id(node) in seen:
+            continue
+        seen.add(id(node))
+
+        for value in (getattr(node, name, None) for name in dir(node) if not name.startswith('_')):
+            if isinstance(value, (expr.Expression, stmt.Statement)):
+                pending.append(value)
+            elif isinstance(value, list):
+                pending.extend(item for item in value if isinstance(item, (expr.Expression, stmt.Statement)))
+
+    return len(seen)
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, after - before
+
+
+if __name__ == '__main__':
+    source = ''.join(BLOCK % i for i in range(5000))
+
+    tokens, token_bytes = measure(lambda: RegexLexer(source).lex())
+    print(f'tokens: {len(tokens)}, {token_bytes / len(tokens):.1f} bytes/token')
+
+    statements, node_bytes = measure(lambda: Parser(tokens).parse())
+    nodes = count_nodes(statements)
+    print(f'nodes: {nodes}, {node_bytes / nodes:.1f} bytes/node')
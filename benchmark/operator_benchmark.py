@@ -0,0 +1,23 @@
+import time
+
+from rectapy import RectaPy
+
+LOOP = """
+var i = 0;
+var total = 0;
+while i < 100000 {
+  total = total + i * 2 - i / 4;
+  i = i + 1;
+}
+"""
+
+if __name__ == '__main__':
+    for engine in ('tree', 'closure'):
+        timings = []
+        for _ in range(5):
+            rectapy = RectaPy(engine)
+            start = time.perf_counter()
+            rectapy.run(LOOP)
+            timings.append(time.perf_counter() - start)
+
+        print(f'{engine}: {min(timings):.3f}s (best of 5)')
@@ -0,0 +1,36 @@
+import io
+import time
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, Profiler
+
+PROGRAM = """
+fun fib(n) {
+  if n < 2 {
+    return n;
+  }
+  return fib(n - 1) + fib(n - 2);
+}
+
+print fib(20);
+"""
+
+
+def measure(profile: bool) -> float:
+    timings = []
+    for _ in range(5):
+        rectapy = RectaPy('tree', profiler=Profiler() if profile else None)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            rectapy.run(PROGRAM)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+if __name__ == '__main__':
+    plain = measure(False)
+    profiled = measure(True)
+
+    print(f'plain: {plain:.3f}s')
+    print(f'profiled: {profiled:.3f}s ({profiled / plain:.2f}x)')
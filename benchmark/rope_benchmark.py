@@ -0,0 +1,46 @@
+import io
+import time
+from contextlib import redirect_stdout
+
+import rectapy.type.rope
+from rectapy import RectaPy
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+
+BUILD = """
+var piece = "0123456789";
+var text = "";
+for i in range(%d) {
+  text = text + piece;
+}
+print len(text);
+print substring(text, 0, 10);
+"""
+
+
+def measure(engine: str, pieces: int) -> float:
+    rectapy = RectaPy(engine)
+
+    output = io.StringIO()
+
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        rectapy.run(BUILD % pieces)
+    elapsed = time.perf_counter() - start
+
+    assert output.getvalue() == f'{pieces * 10:g}\n0123456789\n', output.getvalue()
+    return elapsed
+
+
+if __name__ == '__main__':
+    for engine in ENGINES:
+        print(f'{engine} rope, 1000000 pieces: {measure(engine, 1000000):.3f}s')
+
+    threshold = rectapy.type.rope.ROPE_THRESHOLD
+    rectapy.type.rope.ROPE_THRESHOLD = float('inf')
+
+    try:
+        for engine in ENGINES:
+            print(f'{engine} flat, 50000 pieces: {measure(engine, 50000):.3f}s')
+    finally:
+        rectapy.type.rope.ROPE_THRESHOLD = threshold
@@ -0,0 +1,59 @@
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+GLOBAL = 'total = total + %d * 2 - (%d / 4);\n'
+LOCAL = '{ var a = %d * 2; var b = a - (%d / 4); total = total + b; }\n'
+
+
+def generate(filename: str, statement: str, statements: int) -> None:
+    with open(filename, 'w') as f:
+        f.write('var total = 0;\n')
+        for i in range(statements):
+            f.write(statement % (i, i))
+        f.write('print total;\n')
+
+
+def measure(run):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return elapsed, peak, output.getvalue().split()[0]
+
+
+def stream(filename: str) -> None:
+    with open(filename, 'r') as f:
+        RectaPy(cache=False).run_stream(f)
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, 'generated.recta')
+
+    try:
+        for kind, statement in (('globals', GLOBAL), ('locals', LOCAL)):
+            for statements in (2000, 20000):
+                generate(filename, statement, statements)
+                size = os.path.getsize(filename) / 1024 / 1024
+                print(f'{kind}, {statements} statements, source {size:.1f} MB')
+
+                for name, run in (('file', lambda: RectaPy(cache=False).run_file(filename)),
+                                  ('stream', lambda: stream(filename))):
+                    elapsed, peak, output = measure(run)
+                    print(f'  {name}: {elapsed:.3f}s, peak {peak / 1024 / 1024:.1f} MB, result {output}')
+    finally:
+        os.remove(filename)
+        os.rmdir(directory)
@@ -0,0 +1,53 @@
+import time
+
+from rectapy import RectaPy
+
+ITERATIONS = 2000
+DEPTHS = (1, 10, 25, 50)
+
+READS = 'x + x + x + x + x + x + x + x'
+LITERALS = '1 + 1 + 1 + 1 + 1 + 1 + 1 + 1'
+
+
+def nested(depth: int, body: str, scoped: bool) -> str:
+    return ('{ var pad = 0; ' if scoped else '{ ') * depth + body + ' }' * depth
+
+
+def loop(depth: int, expression: str, scoped: bool) -> str:
+    return nested(depth, f'var i = 0; while i < {ITERATIONS} {{ y = {expression}; i = i + 1; }}', scoped)
+
+
+def global_program(depth: int, expression: str, scoped: bool = False) -> str:
+    return f'var x = 1; var y = 0; {loop(depth, expression, scoped)}'
+
+
+def local_program(depth: int, expression: str, scoped: bool = False) -> str:
+    return f'fun main() {{ var x = 1; var y = 0; {loop(depth, expression, scoped)} }} main();'
+
+
+def scoped_local_program(depth: int, expression: str) -> str:
+    return local_program(depth, expression, scoped=True)
+
+
+def elapsed(code: str) -> float:
+    timings = []
+    for _ in range(5):
+        rectapy = RectaPy()
+        start = time.perf_counter()
+        rectapy.run(code)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def measure(program, depth: int) -> float:
+    reads = elapsed(program(depth, READS)) - elapsed(program(depth, LITERALS))
+    return reads / (ITERATIONS * 8) * 1e9
+
+
+if __name__ == '__main__':
+    # Blocks that declare nothing get no scope, so only the last column pays one hop per enclosing block.
+    print(f'{"depth":>5} {"global read":>12} {"local read":>12} {"local, scoped blocks":>21}')
+    for depth in DEPTHS:
+        print(f'{depth:>5} {measure(global_program, depth):>10.0f}ns {measure(local_program, depth):>10.0f}ns '
+              f'{measure(scoped_local_program, depth):>19.0f}ns')
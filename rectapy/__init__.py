@@ -1,10 +1,20 @@
+__version__ = '0.1.0'
+
 from .exception import *
+from .budget import Budget
 
 from .token import *
 from .parser import *
-from .environment import Environment
+from .environment import Environment, GlobalEnvironment
 from .type import *
+from .memo import MemoCache
 from .interpreter import Interpreter
 from .resolver import Resolver
+from .optimizer import Optimizer
+from .vm import VM
+from .closure import ClosureInterpreter
+from .transpiler import PyInterpreter
+from .cache import Program, ProgramCache
+from .profiler import Profiler, ProfilingInterpreter
 
-from .rectapy import RectaPy
+from .rectapy import RectaPy, Snapshot
@@ -1,17 +1,72 @@
+import argparse
 import sys
 
-from rectapy import RectaPy
+from rectapy import RectaPy, Profiler, batch
+from rectapy.interpreter import MAX_DEPTH
+from rectapy.memo import MEMO_SIZE
+from rectapy.rectapy import ENGINES
 
 
 def main() -> None:
-    rectapy = RectaPy()
-    if len(sys.argv) == 1:
+    if sys.argv[1:2] == ['batch']:
+        sys.exit(batch.main(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(prog='rectapy')
+    parser.add_argument('filename', nargs='?')
+    parser.add_argument('--backend', choices=ENGINES, default='tree',
+                        help='execution engine (default: tree)')
+    parser.add_argument('--no-optimize', dest='optimize', action='store_false',
+                        help='skip constant folding and dead-branch elimination')
+    parser.add_argument('--dump-ast', action='store_true',
+                        help='print the syntax tree before and after optimization to stderr')
+    parser.add_argument('--max-depth', type=int, default=MAX_DEPTH,
+                        help='maximum depth of nested Recta function calls (default: %(default)s)')
+    parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help='do not read or write parsed programs in __rectacache__')
+    parser.add_argument('--stream', action='store_true',
+                        help='execute each top-level statement as soon as it is parsed')
+    parser.add_argument('--strict', action='store_true',
+                        help='raise an error on mismatched operand types instead of producing null')
+    parser.add_argument('--profile', action='store_true',
+                        help='print a per-function and per-statement profile to stderr (tree engine only)')
+    parser.add_argument('--profile-output', default='recta.collapsed',
+                        help='file receiving the collapsed stacks of --profile (default: %(default)s)')
+    parser.add_argument('--memoize', type=int, nargs='?', const=MEMO_SIZE, default=0, metavar='SIZE',
+                        help='cache results of pure and memoize-annotated functions in an LRU of SIZE entries '
+                             '(default: %(const)s) and print hit statistics to stderr (tree engine only)')
+    arguments = parser.parse_args()
+
+    if arguments.profile and arguments.backend != 'tree':
+        parser.error('--profile requires --backend=tree')
+
+    if arguments.memoize < 0:
+        parser.error('--memoize SIZE must not be negative')
+
+    if arguments.memoize and arguments.backend != 'tree':
+        parser.error('--memoize requires --backend=tree')
+
+    profiler = Profiler() if arguments.profile else None
+    rectapy = RectaPy(arguments.backend, optimize=arguments.optimize, dump_ast=arguments.dump_ast,
+                      strict=arguments.strict, max_depth=arguments.max_depth, cache=arguments.cache,
+                      profiler=profiler, memoize=arguments.memoize)
+    if arguments.filename is None:
         rectapy.run_prompt()
-    elif len(sys.argv) == 2:
-        rectapy.run_file(sys.argv[1])
+    elif arguments.stream:
+        with open(arguments.filename, 'r') as f:
+            rectapy.run_stream(f)
     else:
-        print('Usage: rectapy [filename]')
-        exit(64)
+        rectapy.run_file(arguments.filename)
+
+    if arguments.memoize:
+        stats = rectapy.interpreter.memo.stats()
+        print(f'memo: {stats["hits"]} hits, {stats["misses"]} misses, {stats["entries"]}/{stats["size"]} entries',
+              file=sys.stderr)
+
+    if profiler is not None:
+        print(profiler.report(), end='', file=sys.stderr)
+
+        with open(arguments.profile_output, 'w') as f:
+            f.write(profiler.collapsed())
 
 
 if __name__ == '__main__':
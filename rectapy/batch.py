@@ -0,0 +1,108 @@
+import argparse
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import List, Dict, Optional, Iterator
+
+from rectapy import RectaPy
+from rectapy.interpreter import MAX_DEPTH
+from rectapy.rectapy import ENGINES
+
+CHUNKS_PER_WORKER = 4
+
+options: Dict[str, object] = {}
+
+
+class Result:
+    __slots__ = ('filename', 'output', 'error', 'elapsed')
+
+    def __init__(self, filename: str, output: str, error: Optional[str], elapsed: float):
+        self.filename = filename
+        self.output = output
+        self.error = error
+        self.elapsed = elapsed
+
+
+def initialize(worker_options: Dict[str, object]) -> None:
+    options.update(worker_options)
+
+    with redirect_stdout(io.StringIO()):
+        RectaPy(**options).run('var warm = 1;')
+
+
+def run_script(filename: str) -> Result:
+    output = io.StringIO()
+    error = None
+    start = time.perf_counter()
+
+    try:
+        rectapy = RectaPy(**options)
+        with redirect_stdout(output):
+            rectapy.run_file(filename)
+
+        if rectapy.errors:
+            error = f'{type(rectapy.errors[0]).__name__}: {rectapy.errors[0]}'
+    except Exception as exception:
+        error = f'{type(exception).__name__}: {exception}'
+
+    return Result(filename, output.getvalue(), error, time.perf_counter() - start)
+
+
+def batch(filenames: List[str], workers: Optional[int] = None, ordered: bool = True,
+          **worker_options) -> Iterator[Result]:
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(workers, initializer=initialize, initargs=(worker_options,)) as executor:
+        if ordered:
+            chunksize = max(1, len(filenames) // (workers * CHUNKS_PER_WORKER))
+            yield from executor.map(run_script, filenames, chunksize=chunksize)
+        else:
+            futures = [executor.submit(run_script, filename) for filename in filenames]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='rectapy batch')
+    parser.add_argument('filenames', nargs='+', metavar='filename')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--as-completed', dest='ordered', action='store_false',
+                        help='print each script as soon as it finishes instead of in argument order')
+    parser.add_argument('--backend', choices=ENGINES, default='tree',
+                        help='execution engine (default: tree)')
+    parser.add_argument('--no-optimize', dest='optimize', action='store_false',
+                        help='skip constant folding and dead-branch elimination')
+    parser.add_argument('--max-depth', type=int, default=MAX_DEPTH,
+                        help='maximum depth of nested Recta function calls (default: %(default)s)')
+    parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help='do not read or write parsed programs in __rectacache__')
+    parser.add_argument('--strict', action='store_true',
+                        help='raise an error on mismatched operand types instead of producing null')
+    arguments = parser.parse_args(argv)
+
+    failures = 0
+    start = time.perf_counter()
+
+    for result in batch(arguments.filenames, arguments.workers, arguments.ordered, engine=arguments.backend,
+                        optimize=arguments.optimize, strict=arguments.strict, max_depth=arguments.max_depth,
+                        cache=arguments.cache):
+        print(f'==> {result.filename} <==')
+        print(result.output, end='')
+
+        if result.error is not None:
+            failures += 1
+            print(f'{result.filename}: {result.error}', file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    count = len(arguments.filenames)
+    print(f'{count} scripts in {elapsed:.3f}s ({count / elapsed:.1f} scripts/s), {failures} failed', file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import argparse
+import gc
+import io
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Any, List, Dict, Tuple, Callable
+
+import rectapy
+from rectapy import RegexLexer, Parser, Resolver, Optimizer
+from rectapy.rectapy import ENGINES
+
+REPEAT = 5
+PHASES = ('lex', 'parse', 'resolve', 'optimize', 'interpret')
+
+FIBONACCI = """
+fun fibonacci(n) {
+  if n <= 1 {
+    return n;
+  }
+  return fibonacci(n - 2) + fibonacci(n - 1);
+}
+
+print fibonacci(18);
+"""
+
+NESTED_LOOPS = """
+var total = 0;
+var i = 0;
+while i < 150 {
+  var j = 0;
+  while j < 150 {
+    total = total + i * j - j / 2;
+    j = j + 1;
+  }
+  i = i + 1;
+}
+print total;
+"""
+
+CONCATENATION = """
+var text = "";
+var i = 0;
+while i < 5000 {
+  text = text + "ab";
+  i = i + 1;
+}
+print text == "";
+"""
+
+CLOSURES = """
+fun counter(step) {
+  var count = 0;
+  fun increment() {
+    count = count + step;
+    return count;
+  }
+  return increment;
+}
+
+var total = 0;
+var i = 0;
+while i < 2000 {
+  var next = counter(i);
+  next();
+  total = total + next();
+  i = i + 1;
+}
+print total;
+"""
+
+GENERATED_FUNCTION = """
+fun f%d(a, b) {
+  var c = a * %d + b;
+  if c > 100 and a != null {
+    return c - 1;
+  }
+  while c < 10 {
+    c = c + 1;
+  }
+  return c + 1;
+}
+var v%d = f%d(%d, 2);
+"""
+
+
+def generate(functions: int) -> str:
+    return ''.join(GENERATED_FUNCTION % (i, i, i, i, i) for i in range(functions))
+
+
+WORKLOADS = {
+    'fibonacci': FIBONACCI,
+    'nested_loops': NESTED_LOOPS,
+    'concatenation': CONCATENATION,
+    'closures': CLOSURES,
+    'generated': generate(1000),
+}
+
+
+def run_phases(source: str, engine: str, measure: Callable[[Callable], Tuple[Any, float]]) -> Dict[str, float]:
+    results = {}
+
+    def phase(name: str, action: Callable):
+        value, results[name] = measure(action)
+        return value
+
+    tokens = phase('lex', lambda: RegexLexer(source).lex())
+    statements = phase('parse', lambda: Parser(tokens).parse())
+
+    interpreter = ENGINES[engine]()
+    resolver = Resolver(interpreter)
+    phase('resolve', lambda: resolver.resolve(statements))
+    statements = phase('optimize', lambda: Optimizer().optimize(statements))
+
+    with redirect_stdout(io.StringIO()):
+        phase('interpret', lambda: interpreter.interpret(statements))
+
+    return results
+
+
+def elapsed(action: Callable) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    value = action()
+    return value, time.perf_counter() - start
+
+
+def allocated(action: Callable) -> Tuple[Any, int]:
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    value = action()
+    return value, tracemalloc.get_traced_memory()[1] - before
+
+
+def peak_memory(source: str, engine: str) -> Dict[str, int]:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        return run_phases(source, engine, allocated)
+    finally:
+        tracemalloc.stop()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def benchmark(source: str, engine: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    timings: Dict[str, List[float]] = {name: [] for name in PHASES}
+
+    for _ in range(repeat):
+        gc.collect()
+        for name, seconds in run_phases(source, engine, elapsed).items():
+            timings[name].append(seconds)
+
+    memory = peak_memory(source, engine)
+
+    return {name: {
+        'median': statistics.median(timings[name]),
+        'p95': percentile(timings[name], 0.95),
+        'peak_bytes': memory[name],
+    } for name in PHASES}
+
+
+def report(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    lines = [f'{"workload":<16} {"phase":<10} {"median":>10} {"p95":>10} {"peak":>10}']
+
+    for workload, phases in results.items():
+        for name, result in phases.items():
+            lines.append(f'{workload:<16} {name:<10} {result["median"] * 1000:>8.2f}ms {result["p95"] * 1000:>8.2f}ms '
+                         f'{result["peak_bytes"] / 1024:>8.0f}KB')
+
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m rectapy.bench')
+    parser.add_argument('workloads', nargs='*', metavar='workload',
+                        help=f'workloads to run (default: all of {", ".join(WORKLOADS)})')
+    parser.add_argument('--engine', choices=ENGINES, default='tree',
+                        help='execution engine used for the interpret phase (default: tree)')
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='timed runs per workload (default: %(default)s)')
+    parser.add_argument('--json', dest='output',
+                        help='also write the results to this file as JSON')
+    arguments = parser.parse_args()
+
+    unknown = [workload for workload in arguments.workloads if workload not in WORKLOADS]
+    if unknown:
+        parser.error(f'unknown workload: {", ".join(unknown)}')
+
+    results = {workload: benchmark(WORKLOADS[workload], arguments.engine, arguments.repeat)
+               for workload in arguments.workloads or WORKLOADS}
+
+    print(report(results), end='')
+
+    if arguments.output:
+        with open(arguments.output, 'w') as f:
+            json.dump({
+                'version': rectapy.__version__,
+                'python': platform.python_version(),
+                'engine': arguments.engine,
+                'repeat': arguments.repeat,
+                'workloads': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
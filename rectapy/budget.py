@@ -0,0 +1,57 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from rectapy import RectaBudgetError
+
+CLOCK_INTERVAL = 64
+
+active: ContextVar[Optional['Budget']] = ContextVar('budget', default=None)
+
+
+class Budget:
+    def __init__(self, statements: Optional[int] = None, seconds: Optional[float] = None,
+                 depth: Optional[int] = None, environments: Optional[int] = None,
+                 string_length: Optional[int] = None, array_length: Optional[int] = None):
+        self.statements = statements
+        self.seconds = seconds
+        self.depth = depth
+        self.environments = environments
+        self.string_length = string_length
+        self.array_length = array_length
+        self.deadline: Optional[float] = None
+        self.checks = 0
+
+    def start(self) -> 'Budget':
+        self.deadline = None if self.seconds is None else time.monotonic() + self.seconds
+        self.checks = 0
+        return self
+
+    def check(self, interpreter) -> None:
+        if self.statements is not None and interpreter.statement_count > self.statements:
+            raise RectaBudgetError(f'Exceeded the budget of {self.statements} statements.')
+
+        if self.depth is not None and interpreter.depth > self.depth:
+            raise RectaBudgetError(f'Exceeded the budget of {self.depth} nested calls.')
+
+        if self.environments is not None and interpreter.environment_count > self.environments:
+            raise RectaBudgetError(f'Exceeded the budget of {self.environments} environments.')
+
+        if self.deadline is not None:
+            self.checks += 1
+            if not self.checks % CLOCK_INTERVAL and time.monotonic() > self.deadline:
+                raise RectaBudgetError(f'Exceeded the time budget of {self.seconds:g} seconds.')
+
+    def check_string(self, value: str) -> None:
+        if len(value) > self.string_length:
+            raise RectaBudgetError(f'Exceeded the budget of {self.string_length} characters per string.')
+
+    def check_array(self, length: int) -> None:
+        if self.array_length is not None and length > self.array_length:
+            raise RectaBudgetError(f'Exceeded the budget of {self.array_length} elements per array.')
+
+
+def allocate(length: int) -> None:
+    budget = active.get()
+    if budget is not None:
+        budget.check_array(length)
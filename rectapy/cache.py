@@ -0,0 +1,63 @@
+import hashlib
+import os
+import pickle
+from typing import List, Dict, Tuple, Optional
+
+import rectapy
+from rectapy import Token, expression as expr, statement as stmt
+from rectapy.resolver import Purity
+
+CACHE_DIRECTORY = '__rectacache__'
+CACHE_FORMAT = 5
+
+
+class Program:
+    def __init__(self, statements: List[stmt.Statement], locals: Dict[expr.Expression, Tuple[int, int]],
+                 owned: Dict[stmt.Function, List[expr.Expression]],
+                 bindings: List[Tuple[str, str, Optional[stmt.Function]]], analyzed: List[Purity],
+                 unresolved: List[Token]):
+        self.statements = statements
+        self.locals = locals
+        self.owned = owned
+        self.bindings = bindings
+        self.analyzed = analyzed
+        self.unresolved = unresolved
+
+
+class ProgramCache:
+    def __init__(self, options: str = ''):
+        self.tag = f'rectapy-{rectapy.__version__}{options}'
+
+    def path(self, filename: str) -> str:
+        directory, name = os.path.split(os.path.abspath(filename))
+        return os.path.join(directory, CACHE_DIRECTORY, f'{name}.{self.tag}.pickle')
+
+    def digest(self, source: str) -> bytes:
+        return hashlib.sha256(f'{self.tag}\0{CACHE_FORMAT}\0{source}'.encode()).digest()
+
+    def load(self, filename: str, source: str) -> Optional[Program]:
+        try:
+            with open(self.path(filename), 'rb') as f:
+                if f.read(32) != self.digest(source):
+                    return None
+
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def store(self, filename: str, source: str, program: Program) -> None:
+        path = self.path(filename)
+        temporary = f'{path}.{os.getpid()}'
+
+        try:
+            data = pickle.dumps(program, pickle.HIGHEST_PROTOCOL)
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary, 'wb') as f:
+                f.write(self.digest(source))
+                f.write(data)
+
+            os.replace(temporary, path)
+        except (OSError, pickle.PicklingError, RecursionError):
+            if os.path.exists(temporary):
+                os.remove(temporary)
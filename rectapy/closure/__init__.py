@@ -0,0 +1,3 @@
+from .function import CompiledFunction
+from .compiler import ClosureCompiler
+from .interpreter import ClosureInterpreter
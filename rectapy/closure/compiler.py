@@ -0,0 +1,470 @@
+from typing import List
+
+from rectapy import Token, TokenType, Environment, RectaRuntimeError, RectaStackOverflowError, Callable, \
+    NativeFunction, VARIADIC, RectaList, iterate, expression as expr, statement as stmt
+from rectapy.operation import BINARY, add, subtract, less, less_equal, greater, index, assign_index
+from rectapy.interpreter import is_truthy, stringify, locate
+
+from .function import CompiledFunction, TailCall, CONTINUE
+
+
+def undefined(name: Token) -> RectaRuntimeError:
+    return RectaRuntimeError(f'Undefined variable \'{name.lexeme}\'.', name)
+
+
+def call_native(interpreter, function, arguments: List, parenthesis: Token):
+    if not isinstance(function, Callable):
+        raise RectaRuntimeError('Only functions are callable.', parenthesis)
+
+    arity = function.arity()
+    if len(arguments) != arity and arity != VARIADIC:
+        raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.', parenthesis)
+
+    try:
+        if type(function) is NativeFunction:
+            return function.function(*arguments)
+
+        return function.call(interpreter, arguments)
+    except RectaRuntimeError as error:
+        raise locate(error, parenthesis)
+
+
+def nothing(environment):
+    return None
+
+
+def proceed(environment):
+    return CONTINUE
+
+
+class ClosureCompiler(expr.ExprVisitor, stmt.StmtVisitor):
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.locals = interpreter.locals
+        self.globals = interpreter.globals.values
+        self.scope_depth = 0
+
+    def compile_statement(self, statement: stmt.Statement):
+        return statement.accept(self) if statement else proceed
+
+    def compile_expression(self, expression: expr.Expression):
+        return expression.accept(self) if expression else nothing
+
+    def compile_body(self, statements: List[stmt.Statement]):
+        closures = [self.compile_statement(statement) for statement in statements]
+
+        if not closures:
+            return proceed
+
+        if len(closures) == 1:
+            return closures[0]
+
+        def body(environment):
+            for closure in closures:
+                result = closure(environment)
+                if result is not CONTINUE:
+                    return result
+
+            return CONTINUE
+
+        return body
+
+    def compile_condition(self, expression: expr.Expression):
+        condition = self.compile_expression(expression)
+
+        if isinstance(expression, expr.Binary) and expression.operator.type in (
+                TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL,
+                TokenType.EQUAL_EQUAL, TokenType.EXCLAM_EQUAL):
+            return condition
+
+        def truthy(environment):
+            return is_truthy(condition(environment))
+
+        return truthy
+
+    def visit_assign(self, expression: expr.Assign):
+        value = self.compile_expression(expression.value)
+        name = expression.name.lexeme
+        token = expression.name
+
+        if expression in self.locals:
+            distance, slot = self.locals[expression]
+
+            if distance == 0:
+                def assign(environment):
+                    result = environment.values[slot] = value(environment)
+                    return result
+            else:
+                def assign(environment):
+                    result = value(environment)
+                    environment.ancestor(distance).values[slot] = result
+                    return result
+        else:
+            globals = self.globals
+
+            def assign(environment):
+                result = value(environment)
+                if name not in globals:
+                    raise undefined(token)
+                globals[name] = result
+                return result
+
+        return assign
+
+    def visit_binary(self, expression: expr.Binary):
+        left = self.compile_expression(expression.left)
+        right = self.compile_expression(expression.right)
+        opertype = expression.operator.type
+
+        operation = expression.operation
+
+        if isinstance(expression.left, expr.Literal) and isinstance(expression.right, expr.Literal):
+            try:
+                value = operation(expression.left.value, expression.right.value)
+            except (ArithmeticError, RectaRuntimeError):
+                pass
+            else:
+                return lambda environment: value
+
+        if isinstance(expression.right, expr.Literal) and type(expression.right.value) is float \
+                and opertype in FLOAT_OPERATIONS and operation is BINARY[opertype]:
+            return FLOAT_OPERATIONS[opertype](left, expression.right.value)
+
+        operator = expression.operator
+
+        def binary(environment):
+            left_value = left(environment)
+            right_value = right(environment)
+
+            try:
+                return operation(left_value, right_value)
+            except RectaRuntimeError as error:
+                raise locate(error, operator)
+
+        return binary
+
+    def visit_call(self, expression: expr.Call):
+        callee = self.compile_expression(expression.callee)
+        arguments = [self.compile_expression(argument) for argument in expression.arguments]
+        count = len(arguments)
+        interpreter = self.interpreter
+        parenthesis = expression.parenthesis
+
+        def call(environment):
+            function = callee(environment)
+            values = [argument(environment) for argument in arguments]
+
+            if type(function) is CompiledFunction:
+                if count != function.parameters:
+                    raise RectaRuntimeError(f'Expected {function.parameters} arguments but got {count}.', parenthesis)
+
+                if interpreter.depth >= interpreter.max_depth:
+                    raise RectaStackOverflowError('Stack overflow.', parenthesis)
+
+                interpreter.depth += 1
+                try:
+                    result = function.body(Environment(function.closure, values))
+                    while type(result) is TailCall:
+                        result = result.function.body(Environment(result.function.closure, result.arguments))
+                finally:
+                    interpreter.depth -= 1
+
+                return None if result is CONTINUE else result
+
+            return call_native(interpreter, function, values, parenthesis)
+
+        return call
+
+    def visit_get(self, expression: expr.Get):
+        return nothing
+
+    def visit_get_index(self, expression: expr.GetIndex):
+        target = self.compile_expression(expression.target)
+        position = self.compile_expression(expression.index)
+        bracket = expression.bracket
+
+        def get_index(environment):
+            value = target(environment)
+            offset = position(environment)
+
+            try:
+                return index(value, offset)
+            except RectaRuntimeError as error:
+                raise locate(error, bracket)
+
+        return get_index
+
+    def visit_grouping(self, expression: expr.Grouping):
+        return self.compile_expression(expression.expression)
+
+    def visit_list(self, expression: expr.ListLiteral):
+        elements = [self.compile_expression(element) for element in expression.elements]
+        return lambda environment: RectaList([element(environment) for element in elements])
+
+    def visit_literal(self, expression: expr.Literal):
+        value = expression.value
+        return lambda environment: value
+
+    def visit_logical(self, expression: expr.Logical):
+        left = self.compile_expression(expression.left)
+        right = self.compile_expression(expression.right)
+
+        if expression.operator.type == TokenType.OR:
+            def logical(environment):
+                value = left(environment)
+                return value if is_truthy(value) else right(environment)
+        else:
+            def logical(environment):
+                value = left(environment)
+                return right(environment) if is_truthy(value) else value
+
+        return logical
+
+    def visit_set(self, expression: expr.Set):
+        return nothing
+
+    def visit_set_index(self, expression: expr.SetIndex):
+        target = self.compile_expression(expression.target)
+        position = self.compile_expression(expression.index)
+        value = self.compile_expression(expression.value)
+        bracket = expression.bracket
+
+        def set_index(environment):
+            container = target(environment)
+            offset = position(environment)
+            result = value(environment)
+
+            try:
+                return assign_index(container, offset, result)
+            except RectaRuntimeError as error:
+                raise locate(error, bracket)
+
+        return set_index
+
+    def visit_unary(self, expression: expr.Unary):
+        operand = self.compile_expression(expression.operand)
+        operation = expression.operation
+        operator = expression.operator
+
+        def unary(environment):
+            value = operand(environment)
+
+            try:
+                return operation(value)
+            except RectaRuntimeError as error:
+                raise locate(error, operator)
+
+        return unary
+
+    def visit_variable_get(self, expression: expr.Variable):
+        name = expression.name.lexeme
+        token = expression.name
+
+        if expression not in self.locals:
+            globals = self.globals
+
+            def get_global(environment):
+                try:
+                    return globals[name]
+                except KeyError:
+                    raise undefined(token)
+
+            return get_global
+
+        distance, slot = self.locals[expression]
+
+        if distance == 0:
+            return lambda environment: environment.values[slot]
+
+        if distance == 1:
+            return lambda environment: environment.enclosing.values[slot]
+
+        return lambda environment: environment.ancestor(distance).values[slot]
+
+    def define(self, name: str, value):
+        if self.scope_depth:
+            def define(environment):
+                environment.values.append(value(environment))
+                return CONTINUE
+        else:
+            globals = self.globals
+
+            def define(environment):
+                globals[name] = value(environment)
+                return CONTINUE
+
+        return define
+
+    def visit_block(self, statement: stmt.Block):
+        if not statement.scoped:
+            return self.compile_body(statement.statements)
+
+        self.scope_depth += 1
+        body = self.compile_body(statement.statements)
+        self.scope_depth -= 1
+
+        return lambda environment: body(Environment(environment))
+
+    def visit_expression(self, statement: stmt.Expression):
+        expression = self.compile_expression(statement.expression)
+
+        def evaluate(environment):
+            expression(environment)
+            return CONTINUE
+
+        return evaluate
+
+    def visit_function(self, statement: stmt.Function):
+        name = statement.name.lexeme
+        parameters = len(statement.parameters)
+
+        self.scope_depth += 1
+        body = self.compile_body(statement.body)
+        self.scope_depth -= 1
+
+        return self.define(name, lambda environment: CompiledFunction(name, parameters, body, environment))
+
+    def visit_if(self, statement: stmt.If):
+        condition = self.compile_condition(statement.condition)
+        then_branch = self.compile_statement(statement.then_branch)
+
+        if statement.else_branch is None:
+            def branch(environment):
+                if condition(environment):
+                    return then_branch(environment)
+                return CONTINUE
+        else:
+            else_branch = self.compile_statement(statement.else_branch)
+
+            def branch(environment):
+                if condition(environment):
+                    return then_branch(environment)
+                return else_branch(environment)
+
+        return branch
+
+    def visit_return(self, statement: stmt.Return):
+        if not statement.tail_call:
+            return self.compile_expression(statement.value)
+
+        callee = self.compile_expression(statement.value.callee)
+        arguments = [self.compile_expression(argument) for argument in statement.value.arguments]
+        count = len(arguments)
+        interpreter = self.interpreter
+        parenthesis = statement.value.parenthesis
+
+        def tail_call(environment):
+            function = callee(environment)
+            values = [argument(environment) for argument in arguments]
+
+            if type(function) is CompiledFunction:
+                if count != function.parameters:
+                    raise RectaRuntimeError(f'Expected {function.parameters} arguments but got {count}.', parenthesis)
+
+                return TailCall(function, values)
+
+            return call_native(interpreter, function, values, parenthesis)
+
+        return tail_call
+
+    def visit_print(self, statement: stmt.Print):
+        expression = self.compile_expression(statement.expression)
+
+        def output(environment):
+            print(stringify(expression(environment)))
+            return CONTINUE
+
+        return output
+
+    def visit_variable_set(self, statement: stmt.Var):
+        return self.define(statement.name.lexeme, self.compile_expression(statement.initializer))
+
+    def visit_while(self, statement: stmt.While):
+        condition = self.compile_condition(statement.condition)
+        body = self.compile_statement(statement.body)
+
+        def loop(environment):
+            while condition(environment):
+                result = body(environment)
+                if result is not CONTINUE:
+                    return result
+
+            return CONTINUE
+
+        return loop
+
+    def visit_for(self, statement: stmt.For):
+        iterable = self.compile_expression(statement.iterable)
+        element = statement.element
+
+        self.scope_depth += 1
+        body = self.compile_statement(statement.body)
+        self.scope_depth -= 1
+
+        def loop(environment):
+            try:
+                values = iterate(iterable(environment))
+            except RectaRuntimeError as error:
+                raise locate(error, element)
+
+            scope = Environment(environment, [None])
+            slots = scope.values
+
+            for value in values:
+                slots[0] = value
+                result = body(scope)
+                if result is not CONTINUE:
+                    return result
+
+            return CONTINUE
+
+        return loop
+
+
+def constant_plus(left, constant):
+    def binary(environment):
+        value = left(environment)
+        return value + constant if type(value) is float else add(value, constant)
+
+    return binary
+
+
+def constant_minus(left, constant):
+    def binary(environment):
+        value = left(environment)
+        return value - constant if type(value) is float else subtract(value, constant)
+
+    return binary
+
+
+def constant_less(left, constant):
+    def binary(environment):
+        value = left(environment)
+        return value < constant if type(value) is float else less(value, constant)
+
+    return binary
+
+
+def constant_less_equal(left, constant):
+    def binary(environment):
+        value = left(environment)
+        return value <= constant if type(value) is float else less_equal(value, constant)
+
+    return binary
+
+
+def constant_greater(left, constant):
+    def binary(environment):
+        value = left(environment)
+        return value > constant if type(value) is float else greater(value, constant)
+
+    return binary
+
+
+FLOAT_OPERATIONS = {
+    TokenType.PLUS: constant_plus,
+    TokenType.MINUS: constant_minus,
+    TokenType.LESS: constant_less,
+    TokenType.LESS_EQUAL: constant_less_equal,
+    TokenType.GREATER: constant_greater,
+}
@@ -0,0 +1,42 @@
+from rectapy import Environment, Callable, RectaStackOverflowError
+
+CONTINUE = object()
+
+
+class TailCall:
+    __slots__ = ('function', 'arguments')
+
+    def __init__(self, function, arguments):
+        self.function = function
+        self.arguments = arguments
+
+
+class CompiledFunction(Callable):
+    def __init__(self, name: str, parameters: int, body, closure: Environment):
+        self.name = name
+        self.parameters = parameters
+        self.body = body
+        self.closure = closure
+
+    def arity(self) -> int:
+        return self.parameters
+
+    def invoke(self, interpreter, arguments):
+        if interpreter.depth >= interpreter.max_depth:
+            raise RectaStackOverflowError('Stack overflow.')
+
+        interpreter.depth += 1
+        try:
+            result = self.body(Environment(self.closure, arguments))
+            while type(result) is TailCall:
+                result = result.function.body(Environment(result.function.closure, result.arguments))
+        finally:
+            interpreter.depth -= 1
+
+        return None if result is CONTINUE else result
+
+    def call(self, interpreter, arguments):
+        return self.invoke(interpreter, list(arguments))
+
+    def __str__(self):
+        return f'<fn {self.name}>'
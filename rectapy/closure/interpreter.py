@@ -0,0 +1,61 @@
+from typing import List, Dict, Tuple, Optional
+
+from rectapy import GlobalEnvironment, RectaRuntimeError, Callable, NativeFunction, VARIADIC, BUILTINS, \
+    expression as expr, statement as stmt
+from rectapy.interpreter import MAX_DEPTH, recursion_limit, stringify
+
+from .compiler import ClosureCompiler
+from .function import CONTINUE
+
+
+class ClosureInterpreter:
+    def __init__(self, max_depth: int = MAX_DEPTH):
+        self.globals = GlobalEnvironment(BUILTINS)
+        self.locals: Dict[expr.Expression, Tuple[int, int]] = {}
+        self.error: Optional[RectaRuntimeError] = None
+        self.max_depth = max_depth
+        self.depth = 0
+
+    def interpret(self, statements: List[stmt.Statement]):
+        compiler = ClosureCompiler(self)
+        program = (
+            (True, compiler.compile_expression(statement.expression)) if isinstance(statement, stmt.Expression)
+            else (False, compiler.compile_statement(statement))
+            for statement in statements
+        )
+
+        last_value = None
+        self.error = None
+        try:
+            with recursion_limit(self.max_depth):
+                for is_expression, closure in program:
+                    result = closure(self.globals)
+                    if is_expression:
+                        last_value = result
+                    elif result is not CONTINUE:
+                        break
+                    else:
+                        last_value = None
+
+                return stringify(last_value)
+        except RectaRuntimeError as error:
+            self.error = error
+            print(error)
+        finally:
+            self.depth = 0
+
+    def resolve(self, expression: expr.Expression, depth: int, slot: int):
+        self.locals[expression] = (depth, slot)
+
+    def call(self, callee, arguments: List):
+        if not isinstance(callee, Callable):
+            raise RectaRuntimeError('Only functions are callable.')
+
+        arity = callee.arity()
+        if len(arguments) != arity and arity != VARIADIC:
+            raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.')
+
+        if type(callee) is NativeFunction:
+            return callee.function(*arguments)
+
+        return callee.call(self, list(arguments))
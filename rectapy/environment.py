@@ -1,46 +1,52 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 from rectapy import Token, RectaRuntimeError
 
 
 class Environment:
-    def __init__(self, enclosing: Optional[Environment] = None):
-        self.values: Dict[str, Any] = {}
+    __slots__ = ('values', 'enclosing')
+
+    def __init__(self, enclosing: Optional[Environment] = None, values: Optional[List[Any]] = None):
+        self.values: List[Any] = [] if values is None else values
         self.enclosing = enclosing
 
-    def define(self, key: str, value: Any) -> None:
-        self.values[key] = value
+    def define(self, value: Any) -> None:
+        self.values.append(value)
 
-    def ancestor(self, distance: int):
+    def ancestor(self, distance: int) -> Environment:
         environment = self
-        for i in range(distance):
+        while distance:
             environment = environment.enclosing
+            distance -= 1
 
         return environment
 
-    def get_at(self, distance: int, name: str):
-        return self.ancestor(distance).values[name]
+    def get_at(self, distance: int, slot: int):
+        return self.ancestor(distance).values[slot]
 
-    def assign(self, key: Token, value: Any):
-        if key.lexeme in self.values:
-            self.values[key.lexeme] = value
+    def assign_at(self, distance: int, slot: int, value: Any):
+        self.ancestor(distance).values[slot] = value
 
-        if self.enclosing:
-            self.enclosing.assign(key, value)
 
-        raise RectaRuntimeError(f'Undefined variable \'{key.lexeme}\'.')
+class GlobalEnvironment:
+    __slots__ = ('values',)
 
-    def assign_at(self, distance: int, name: Token, value: Any):
-        self.ancestor(distance).values[name.lexeme] = value
+    def __init__(self, values: Optional[Dict[str, Any]] = None):
+        self.values: Dict[str, Any] = {} if values is None else dict(values)
 
-    def get(self, key: Token):
-        if key.lexeme in self.values:
-            return self.values[key.lexeme]
+    def define(self, key: str, value: Any) -> None:
+        self.values[key] = value
 
-        if self.enclosing is not None:
-            return self.enclosing.get(key)
+    def assign(self, key: Token, value: Any):
+        if key.lexeme not in self.values:
+            raise RectaRuntimeError(f'Undefined variable \'{key.lexeme}\'.', key)
 
-        raise RectaRuntimeError(f'Undefined variable \'{key.lexeme}\'.')
+        self.values[key.lexeme] = value
 
+    def get(self, key: Token):
+        try:
+            return self.values[key.lexeme]
+        except KeyError:
+            raise RectaRuntimeError(f'Undefined variable \'{key.lexeme}\'.', key)
@@ -1,15 +1,40 @@
-class RectaSyntaxError(BaseException):
+class RectaError(BaseException):
+    def __init__(self, message: str = '', token=None):
+        super().__init__(message)
+        self.message = message
+        self.source = None
+        self.offset = 0
+
+        if token is not None:
+            self.at(token.source, token.offset)
+
+    def at(self, source, offset: int):
+        self.source = source
+        self.offset = offset
+        return self
+
+    def __str__(self):
+        if self.source is None:
+            return self.message
+
+        return f'{self.source.describe(self.offset)}: {self.message}'
+
+
+class RectaSyntaxError(RectaError):
     pass
 
 
-class RectaParseError(BaseException):
+class RectaParseError(RectaError):
     pass
 
 
-class RectaRuntimeError(BaseException):
+class RectaRuntimeError(RectaError):
     pass
 
 
-class ReturnTrigger(RectaRuntimeError):
-    def __init__(self, value):
-        self.value = value
+class RectaStackOverflowError(RectaRuntimeError):
+    pass
+
+
+class RectaBudgetError(RectaRuntimeError):
+    pass
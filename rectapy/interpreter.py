@@ -1,106 +1,292 @@
-from typing import List, Dict
-
-from rectapy import Token, TokenType, Environment, RectaRuntimeError, expression as expr, statement as stmt, Callable, Function, \
-    ReturnTrigger
+import sys
+from contextlib import contextmanager
+from typing import List, Dict, Set, Tuple, Optional, Callable as PyCallable
+
+from rectapy import Budget, MemoCache, Token, TokenType, Environment, GlobalEnvironment, RectaRuntimeError, \
+    RectaStackOverflowError, expression as expr, statement as stmt, Callable, Function, NativeFunction, VARIADIC, \
+    RectaList, Rope, BUILTINS, iterate
+from rectapy.budget import active
+from rectapy.type.list import format_list
+from rectapy.operation import index, assign_index
+from rectapy.type.function import RETURN
+
+MAX_DEPTH = 1000
+FRAMES_PER_CALL = 16
+
+EVENTS = ('statement', 'enter', 'exit', 'environment', 'error')
+TRACERS = {
+    'statement': ('execute',),
+    'enter': ('prepare_call', 'visit_call'),
+    'exit': ('prepare_call', 'visit_call'),
+    'environment': ('execute_block',),
+}
 
 
 class Interpreter(expr.ExprVisitor, stmt.StmtVisitor):
-    def __init__(self):
-        self.globals = Environment()
+    def __init__(self, max_depth: int = MAX_DEPTH):
+        self.globals = GlobalEnvironment(BUILTINS)
         self.environment = self.globals
-        self.locals: Dict[expr.Expression, int] = {}
+        self.locals: Dict[expr.Expression, Tuple[int, int]] = {}
+        self.return_value = None
+        self.tail_call = None
+        self.max_depth = max_depth
+        self.depth = 0
+        self.statement_count = 0
+        self.call_count = 0
+        self.environment_count = 0
+        self.peak_depth = 0
+        self.listeners: Dict[str, List[PyCallable]] = {event: [] for event in EVENTS}
+        self.traced_calls: List[Callable] = []
+        self.budget: Optional[Budget] = None
+        self.memo: Optional[MemoCache] = None
+        self.error: Optional[RectaRuntimeError] = None
 
     def interpret(self, statements: List[stmt.Statement]):
+        self.statement_count = self.call_count = self.environment_count = self.peak_depth = 0
         last_value = None
+        result = None
+        self.error = None
         try:
-            for statement in statements:
-                last_value = self.execute(statement)
+            with recursion_limit(self.max_depth):
+                for statement in statements:
+                    last_value = self.execute(statement)
+
+                    if last_value is RETURN:
+                        last_value = self.return_value
+                        break
+
+                result = stringify(last_value)
         except RectaRuntimeError as error:
+            self.error = error
+            for listener in self.listeners['error']:
+                listener(error)
+
             print(error)
+        finally:
+            self.environment = self.globals
+            self.depth = 0
+            self.traced_calls.clear()
+
+        return result
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            'statements': self.statement_count,
+            'calls': self.call_count,
+            'environments': self.environment_count,
+            'max_depth': self.peak_depth,
+        }
+
+    def listen(self, event: str, listener: PyCallable) -> None:
+        if event not in self.listeners:
+            raise ValueError(f'Unknown event \'{event}\'. Expected one of: {", ".join(EVENTS)}.')
+
+        self.listeners[event].append(listener)
+        self.instrument()
+
+    def unlisten(self, event: str, listener: PyCallable) -> None:
+        self.listeners[event].remove(listener)
+        self.instrument()
+
+    def instrument(self) -> None:
+        names = {name for event, tracers in TRACERS.items() if self.listeners[event] for name in tracers}
+
+        for tracers in TRACERS.values():
+            for name in tracers:
+                if name in names:
+                    setattr(self, name, getattr(self, f'trace_{name}'))
+                else:
+                    self.__dict__.pop(name, None)
+
+    def trace_execute(self, statement: stmt.Statement):
+        if statement:
+            for listener in self.listeners['statement']:
+                listener(statement)
+
+        return type(self).execute(self, statement)
+
+    def trace_execute_block(self, statements: List[stmt.Statement], environment: Environment):
+        for listener in self.listeners['environment']:
+            listener(environment)
+
+        return type(self).execute_block(self, statements, environment)
+
+    def trace_prepare_call(self, expression: expr.Call):
+        callee, arguments = type(self).prepare_call(self, expression)
+
+        for listener in self.listeners['enter']:
+            listener(callee, arguments)
+
+        self.traced_calls.append(callee)
+        return callee, arguments
+
+    def trace_visit_call(self, expression: expr.Call):
+        calls = self.traced_calls
+        size = len(calls)
+
+        try:
+            value = type(self).visit_call(self, expression)
+        except BaseException:
+            del calls[size:]
+            raise
+
+        while len(calls) > size:
+            callee = calls.pop()
+            for listener in self.listeners['exit']:
+                listener(callee, value)
 
-        return stringify(last_value)
+        return value
+
+    @contextmanager
+    def limit(self, budget: Budget):
+        if budget.string_length is not None:
+            self.visit_binary = self.limit_visit_binary
+
+        self.budget = budget.start()
+        token = active.set(budget)
+
+        try:
+            yield
+        finally:
+            active.reset(token)
+            self.budget = None
+            self.__dict__.pop('visit_binary', None)
+
+    def limit_visit_binary(self, expression: expr.Binary):
+        value = type(self).visit_binary(self, expression)
+
+        if type(value) is str or type(value) is Rope:
+            try:
+                self.budget.check_string(value)
+            except RectaRuntimeError as error:
+                raise locate(error, expression.operator)
+
+        return value
 
     def evaluate(self, expression: expr.Expression):
         return expression.accept(self) if expression else None
 
     def execute(self, statement: stmt.Statement):
-        return statement.accept(self) if statement else None
+        if not statement:
+            return None
+
+        self.statement_count += 1
+        return statement.accept(self)
 
     def execute_block(self, statements: List[stmt.Statement], environment: Environment):
+        self.environment_count += 1
         previous = self.environment
 
         try:
             self.environment = environment
 
             for statement in statements:
-                self.execute(statement)
+                if self.execute(statement) is RETURN:
+                    return RETURN
         finally:
             self.environment = previous
 
-    def resolve(self, expression: expr.Expression, depth: int):
-        self.locals[expression] = depth
+    def resolve(self, expression: expr.Expression, depth: int, slot: int):
+        self.locals[expression] = (depth, slot)
+
+    def call(self, callee, arguments: List):
+        if not isinstance(callee, Callable):
+            raise RectaRuntimeError('Only functions are callable.')
+
+        arity = callee.arity()
+        if len(arguments) != arity and arity != VARIADIC:
+            raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.')
+
+        if type(callee) is NativeFunction:
+            return callee.function(*arguments)
+
+        return callee.call(self, list(arguments))
 
     def lookup_variable(self, name: Token, expression: expr.Expression):
-        if expression in self.locals:
-            return self.environment.get_at(self.locals[expression], name.lexeme)
-        return self.globals.get(name)
+        local = self.locals.get(expression)
+        if local is None:
+            try:
+                return self.globals.values[name.lexeme]
+            except KeyError:
+                raise RectaRuntimeError(f'Undefined variable \'{name.lexeme}\'.', name)
+
+        distance, slot = local
+        environment = self.environment
+        while distance:
+            environment = environment.enclosing
+            distance -= 1
+
+        return environment.values[slot]
+
+    def define(self, name: Token, value):
+        if self.environment is self.globals:
+            self.globals.define(name.lexeme, value)
+        else:
+            self.environment.define(value)
 
     def visit_assign(self, expression: expr.Assign):
         value = self.evaluate(expression.value)
 
-        if expression in self.locals:
-            self.environment.assign_at(self.locals[expression], expression.value, value)
-        else:
+        local = self.locals.get(expression)
+        if local is None:
             self.globals.assign(expression.name, value)
+        else:
+            self.environment.assign_at(*local, value)
 
         return value
 
     def visit_binary(self, expression: expr.Binary):
         left = self.evaluate(expression.left)
         right = self.evaluate(expression.right)
-        opertype = expression.operator.type
-
-        if opertype == TokenType.PLUS and (check(float, left, right) or check(str, left, right)):
-            return left + right
-        elif opertype == TokenType.MINUS and check(float, left, right):
-            return left - right
-        elif opertype == TokenType.STAR and check(float, left, right):
-            return left * right
-        elif opertype == TokenType.SLASH and check(float, left, right):
-            return left / right
-        elif opertype == TokenType.GREATER and check(float, left, right):
-            return left > right
-        elif opertype == TokenType.GREATER_EQUAL and check(float, left, right):
-            return left >= right
-        elif opertype == TokenType.LESS and check(float, left, right):
-            return left < right
-        elif opertype == TokenType.LESS_EQUAL and check(float, left, right):
-            return left <= right
-        elif opertype == TokenType.EQUAL_EQUAL:
-            return left == right
-        elif opertype == TokenType.EXCLAM_EQUAL:
-            return left != right
-
-        return None
+
+        try:
+            return expression.operation(left, right)
+        except RectaRuntimeError as error:
+            raise locate(error, expression.operator)
 
     def visit_call(self, expression: expr.Call):
+        callee, arguments = self.prepare_call(expression)
+
+        try:
+            if type(callee) is NativeFunction:
+                return callee.function(*arguments)
+
+            return callee.call(self, arguments)
+        except RectaRuntimeError as error:
+            raise locate(error, expression.parenthesis)
+
+    def prepare_call(self, expression: expr.Call):
         callee = self.evaluate(expression.callee)
-        arguments = list(map(self.evaluate, expression.arguments))
+        arguments = [self.evaluate(argument) for argument in expression.arguments]
 
         if not isinstance(callee, Callable):
-            raise RectaRuntimeError('Only functions are callable.')
+            raise RectaRuntimeError('Only functions are callable.', expression.parenthesis)
 
-        if len(arguments) != callee.arity():
-            raise RectaRuntimeError(f'Expected {callee.arity()} arguments but got {len(arguments)}.')
+        arity = callee.arity()
+        if len(arguments) != arity and arity != VARIADIC:
+            raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.', expression.parenthesis)
 
-        return callee.call(self, arguments)
+        self.call_count += 1
+        return callee, arguments
 
     def visit_get(self, expression: expr.Get):
         pass
 
+    def visit_get_index(self, expression: expr.GetIndex):
+        target = self.evaluate(expression.target)
+        position = self.evaluate(expression.index)
+
+        try:
+            return index(target, position)
+        except RectaRuntimeError as error:
+            raise locate(error, expression.bracket)
+
     def visit_grouping(self, expression: expr.Grouping):
         return self.evaluate(expression.expression)
 
+    def visit_list(self, expression: expr.ListLiteral):
+        return RectaList([self.evaluate(element) for element in expression.elements])
+
     def visit_literal(self, expression: expr.Literal):
         return expression.value
 
@@ -118,43 +304,65 @@ class Interpreter(expr.ExprVisitor, stmt.StmtVisitor):
     def visit_set(self, expression: expr.Set):
         pass
 
-    def visit_unary(self, expression: expr.Unary):
-        right = self.evaluate(expression.operand)
-        opertype = expression.operator.type
+    def visit_set_index(self, expression: expr.SetIndex):
+        target = self.evaluate(expression.target)
+        position = self.evaluate(expression.index)
+        value = self.evaluate(expression.value)
 
-        if opertype == TokenType.EXCLAM:
-            return not is_truthy(right)
-        elif opertype == TokenType.MINUS:
-            if isinstance(right, float):
-                return -right
-            else:
-                raise RectaRuntimeError('Bad operand type for unary -')
+        try:
+            return assign_index(target, position, value)
+        except RectaRuntimeError as error:
+            raise locate(error, expression.bracket)
+
+    def visit_unary(self, expression: expr.Unary):
+        operand = self.evaluate(expression.operand)
 
-        return None
+        try:
+            return expression.operation(operand)
+        except RectaRuntimeError as error:
+            raise locate(error, expression.operator)
 
     def visit_variable_get(self, expression: expr.Variable):
-        return self.environment.get(expression.name)
+        return self.lookup_variable(expression.name, expression)
 
     def visit_block(self, statement: stmt.Block):
-        self.execute_block(statement.statements, Environment(self.environment))
+        if statement.scoped:
+            return self.execute_block(statement.statements, Environment(self.environment))
+
+        for inner in statement.statements:
+            if self.execute(inner) is RETURN:
+                return RETURN
 
     def visit_expression(self, statement: stmt.Expression):
         return self.evaluate(statement.expression)
 
     def visit_function(self, statement: stmt.Function):
-        function = Function(statement, self.environment)
-        self.environment.define(statement.name.lexeme, function)
+        self.define(statement.name, Function(statement, self.environment))
 
     def visit_if(self, statement: stmt.If):
         if is_truthy(self.evaluate(statement.condition)):
-            self.execute(statement.then_branch)
+            return self.execute(statement.then_branch)
         elif statement.else_branch:
-            self.execute(statement.else_branch)
+            return self.execute(statement.else_branch)
 
     def visit_return(self, statement: stmt.Return):
-        value = None if statement.value is None else self.evaluate(statement.value)
+        if statement.tail_call:
+            callee, arguments = self.prepare_call(statement.value)
+
+            if type(callee) is Function:
+                self.tail_call = (callee, arguments)
+                return RETURN
+
+            try:
+                self.return_value = callee.call(self, arguments)
+            except RectaRuntimeError as error:
+                raise locate(error, statement.value.parenthesis)
 
-        raise ReturnTrigger(value)
+            return RETURN
+
+        self.return_value = None if statement.value is None else self.evaluate(statement.value)
+
+        return RETURN
 
     def visit_print(self, statement: stmt.Print):
         print(stringify(self.evaluate(statement.expression)))
@@ -164,15 +372,66 @@ class Interpreter(expr.ExprVisitor, stmt.StmtVisitor):
         if statement.initializer:
             value = self.evaluate(statement.initializer)
 
-        self.environment.define(statement.name.lexeme, value)
+        self.define(statement.name, value)
 
     def visit_while(self, statement: stmt.While):
+        budget = self.budget
+
         while is_truthy(self.evaluate(statement.condition)):
-            self.execute(statement.body)
+            if self.execute(statement.body) is RETURN:
+                return RETURN
+
+            if budget is not None:
+                budget.check(self)
 
     def visit_for(self, statement: stmt.For):
-        # TODO: Implement for statement
-        pass
+        try:
+            values = iterate(self.evaluate(statement.iterable))
+        except RectaRuntimeError as error:
+            raise locate(error, statement.element)
+
+        environment = Environment(self.environment, [None])
+        self.environment_count += 1
+        for listener in self.listeners['environment']:
+            listener(environment)
+
+        slots = environment.values
+        budget = self.budget
+        previous = self.environment
+
+        try:
+            self.environment = environment
+
+            for value in values:
+                slots[0] = value
+
+                if self.execute(statement.body) is RETURN:
+                    return RETURN
+
+                if budget is not None:
+                    budget.check(self)
+        finally:
+            self.environment = previous
+
+
+def locate(error: RectaRuntimeError, token: Token) -> RectaRuntimeError:
+    if error.source is None:
+        error.at(token.source, token.offset)
+
+    return error
+
+
+@contextmanager
+def recursion_limit(max_depth: int):
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, max_depth * FRAMES_PER_CALL))
+
+    try:
+        yield
+    except RecursionError:
+        raise RectaStackOverflowError('Stack overflow.') from None
+    finally:
+        sys.setrecursionlimit(limit)
 
 
 def is_truthy(value: object) -> bool:
@@ -188,15 +447,14 @@ def is_truthy(value: object) -> bool:
     return True
 
 
-def stringify(value: object) -> str:
+def stringify(value: object, seen: Optional[Set[int]] = None) -> str:
     if value is None:
         return 'null'
 
     if isinstance(value, float):
         return '%g' % value
 
-    return str(value)
-
+    if type(value) is RectaList:
+        return format_list(value, stringify, seen)
 
-def check(value_type: type, *values: object) -> bool:
-    return all(isinstance(value, value_type) for value in values)
+    return str(value)
@@ -0,0 +1,63 @@
+import math
+from collections import OrderedDict
+from typing import Dict
+
+from rectapy import Rope
+
+MEMO_SIZE = 4096
+KEY_TYPES = (float, str, bool, type(None), Rope)
+
+MISSING = object()
+
+
+class MemoCache:
+    def __init__(self, size: int = MEMO_SIZE):
+        if size <= 0:
+            raise ValueError('Memo cache size must be positive.')
+
+        self.size = size
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def call(self, function, interpreter, arguments):
+        for argument in arguments:
+            if type(argument) not in KEY_TYPES:
+                return function.invoke(interpreter, arguments)
+
+        declaration = function.function
+        key = (declaration if declaration.pure else function, tuple(arguments), tuple(map(signature, arguments)))
+
+        value = self.entries.get(key, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = function.invoke(interpreter, arguments)
+
+        self.entries[key] = value
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+            'size': self.size,
+        }
+
+
+def signature(argument):
+    if type(argument) is float:
+        return math.copysign(1.0, argument)
+
+    return type(argument)
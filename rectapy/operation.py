@@ -0,0 +1,165 @@
+import operator
+
+from rectapy import TokenType, RectaRuntimeError, RectaList, Array, Rope
+from rectapy.type.array import elementwise, negate as negate_array
+from rectapy.type.rope import concatenate
+
+
+def add(left, right):
+    if type(left) is float and type(right) is float:
+        return left + right
+    if (type(left) is str or type(left) is Rope) and (type(right) is str or type(right) is Rope):
+        return concatenate(left, right)
+    return elementwise(operator.add, left, right)
+
+
+def subtract(left, right):
+    if type(left) is float and type(right) is float:
+        return left - right
+    return elementwise(operator.sub, left, right)
+
+
+def multiply(left, right):
+    if type(left) is float and type(right) is float:
+        return left * right
+    return elementwise(operator.mul, left, right)
+
+
+def divide(left, right):
+    if type(left) is float and type(right) is float:
+        return left / right
+    return elementwise(operator.truediv, left, right)
+
+
+def greater(left, right):
+    if type(left) is float and type(right) is float:
+        return left > right
+    return elementwise(operator.gt, left, right)
+
+
+def greater_equal(left, right):
+    if type(left) is float and type(right) is float:
+        return left >= right
+    return elementwise(operator.ge, left, right)
+
+
+def less(left, right):
+    if type(left) is float and type(right) is float:
+        return left < right
+    return elementwise(operator.lt, left, right)
+
+
+def less_equal(left, right):
+    if type(left) is float and type(right) is float:
+        return left <= right
+    return elementwise(operator.le, left, right)
+
+
+def equal(left, right):
+    return left == right
+
+
+def not_equal(left, right):
+    return left != right
+
+
+def strict_add(left, right):
+    value = add(left, right)
+    if value is None:
+        raise RectaRuntimeError('Operands must be two numbers or two strings.')
+    return value
+
+
+def strict(operation):
+    def apply(left, right):
+        value = operation(left, right)
+        if value is None:
+            raise RectaRuntimeError('Operands must be numbers.')
+        return value
+
+    apply.__name__ = apply.__qualname__ = f'strict_{operation.__name__}'
+    return apply
+
+
+strict_subtract = strict(subtract)
+strict_multiply = strict(multiply)
+strict_divide = strict(divide)
+strict_greater = strict(greater)
+strict_greater_equal = strict(greater_equal)
+strict_less = strict(less)
+strict_less_equal = strict(less_equal)
+
+
+def negate(value):
+    if type(value) is float:
+        return -value
+    if type(value) is Array:
+        return negate_array(value)
+    raise RectaRuntimeError('Bad operand type for unary -')
+
+
+def index(target, position):
+    if type(target) is not RectaList and type(target) is not Array:
+        raise RectaRuntimeError('Only lists and arrays can be indexed.')
+
+    return target.values[offset(target, position)]
+
+
+def assign_index(target, position, value):
+    if type(target) is Array:
+        if type(value) is not float:
+            raise RectaRuntimeError('Array elements must be numbers.')
+    elif type(target) is not RectaList:
+        raise RectaRuntimeError('Only lists and arrays can be indexed.')
+
+    target.values[offset(target, position)] = value
+    return value
+
+
+def offset(target, position) -> int:
+    if type(position) is not float or not position.is_integer():
+        raise RectaRuntimeError('Index must be an integer.')
+
+    if not 0 <= position < len(target.values):
+        raise RectaRuntimeError(f'Index {position:g} out of range for length {len(target.values)}.')
+
+    return int(position)
+
+
+def logical_not(value):
+    if value is None or value is False:
+        return True
+    if type(value) is float:
+        return value == 0
+    return False
+
+
+BINARY = {
+    TokenType.PLUS: add,
+    TokenType.MINUS: subtract,
+    TokenType.STAR: multiply,
+    TokenType.SLASH: divide,
+    TokenType.GREATER: greater,
+    TokenType.GREATER_EQUAL: greater_equal,
+    TokenType.LESS: less,
+    TokenType.LESS_EQUAL: less_equal,
+    TokenType.EQUAL_EQUAL: equal,
+    TokenType.EXCLAM_EQUAL: not_equal,
+}
+
+STRICT_BINARY = {
+    **BINARY,
+    TokenType.PLUS: strict_add,
+    TokenType.MINUS: strict_subtract,
+    TokenType.STAR: strict_multiply,
+    TokenType.SLASH: strict_divide,
+    TokenType.GREATER: strict_greater,
+    TokenType.GREATER_EQUAL: strict_greater_equal,
+    TokenType.LESS: strict_less,
+    TokenType.LESS_EQUAL: strict_less_equal,
+}
+
+UNARY = {
+    TokenType.EXCLAM: logical_not,
+    TokenType.MINUS: negate,
+}
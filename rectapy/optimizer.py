@@ -0,0 +1,138 @@
+from typing import List, Optional
+
+from rectapy import TokenType, RectaRuntimeError, Rope, expression as expr, statement as stmt
+from rectapy.interpreter import is_truthy
+
+
+class Optimizer(expr.ExprVisitor, stmt.StmtVisitor):
+    def optimize(self, statements: List[stmt.Statement]) -> List[stmt.Statement]:
+        return [self.optimize_statement(statement) for statement in statements]
+
+    def optimize_statement(self, statement: Optional[stmt.Statement]) -> Optional[stmt.Statement]:
+        return statement.accept(self) if statement else None
+
+    def optimize_expression(self, expression: Optional[expr.Expression]) -> Optional[expr.Expression]:
+        return expression.accept(self) if expression else None
+
+    def visit_assign(self, expression: expr.Assign):
+        expression.value = self.optimize_expression(expression.value)
+        return expression
+
+    def visit_binary(self, expression: expr.Binary):
+        expression.left = self.optimize_expression(expression.left)
+        expression.right = self.optimize_expression(expression.right)
+
+        if isinstance(expression.left, expr.Literal) and isinstance(expression.right, expr.Literal):
+            try:
+                value = expression.operation(expression.left.value, expression.right.value)
+            except (ArithmeticError, RectaRuntimeError):
+                pass
+            else:
+                return expr.Literal(str(value) if type(value) is Rope else value)
+
+        return expression
+
+    def visit_call(self, expression: expr.Call):
+        expression.callee = self.optimize_expression(expression.callee)
+        expression.arguments = [self.optimize_expression(argument) for argument in expression.arguments]
+        return expression
+
+    def visit_get(self, expression: expr.Get):
+        return expression
+
+    def visit_get_index(self, expression: expr.GetIndex):
+        expression.target = self.optimize_expression(expression.target)
+        expression.index = self.optimize_expression(expression.index)
+        return expression
+
+    def visit_grouping(self, expression: expr.Grouping):
+        return self.optimize_expression(expression.expression)
+
+    def visit_list(self, expression: expr.ListLiteral):
+        expression.elements = [self.optimize_expression(element) for element in expression.elements]
+        return expression
+
+    def visit_literal(self, expression: expr.Literal):
+        return expression
+
+    def visit_logical(self, expression: expr.Logical):
+        expression.left = self.optimize_expression(expression.left)
+        expression.right = self.optimize_expression(expression.right)
+
+        if isinstance(expression.left, expr.Literal):
+            if is_truthy(expression.left.value) == (expression.operator.type == TokenType.OR):
+                return expression.left
+            return expression.right
+
+        return expression
+
+    def visit_set(self, expression: expr.Set):
+        return expression
+
+    def visit_set_index(self, expression: expr.SetIndex):
+        expression.target = self.optimize_expression(expression.target)
+        expression.index = self.optimize_expression(expression.index)
+        expression.value = self.optimize_expression(expression.value)
+        return expression
+
+    def visit_unary(self, expression: expr.Unary):
+        expression.operand = self.optimize_expression(expression.operand)
+
+        if isinstance(expression.operand, expr.Literal):
+            try:
+                return expr.Literal(expression.operation(expression.operand.value))
+            except RectaRuntimeError:
+                pass
+
+        return expression
+
+    def visit_variable_get(self, expression: expr.Variable):
+        return expression
+
+    def visit_block(self, statement: stmt.Block):
+        statement.statements = self.optimize(statement.statements)
+        return statement
+
+    def visit_expression(self, statement: stmt.Expression):
+        statement.expression = self.optimize_expression(statement.expression)
+        return statement
+
+    def visit_function(self, statement: stmt.Function):
+        statement.body = self.optimize(statement.body)
+        return statement
+
+    def visit_if(self, statement: stmt.If):
+        statement.condition = self.optimize_expression(statement.condition)
+        statement.then_branch = self.optimize_statement(statement.then_branch)
+        statement.else_branch = self.optimize_statement(statement.else_branch)
+
+        if isinstance(statement.condition, expr.Literal):
+            return statement.then_branch if is_truthy(statement.condition.value) else statement.else_branch
+
+        return statement
+
+    def visit_return(self, statement: stmt.Return):
+        statement.value = self.optimize_expression(statement.value)
+        return statement
+
+    def visit_print(self, statement: stmt.Print):
+        statement.expression = self.optimize_expression(statement.expression)
+        return statement
+
+    def visit_variable_set(self, statement: stmt.Var):
+        statement.initializer = self.optimize_expression(statement.initializer)
+        return statement
+
+    def visit_while(self, statement: stmt.While):
+        statement.condition = self.optimize_expression(statement.condition)
+
+        if isinstance(statement.condition, expr.Literal) and not is_truthy(statement.condition.value):
+            return None
+
+        statement.body = self.optimize_statement(statement.body)
+        return statement
+
+    def visit_for(self, statement: stmt.For):
+        statement.iterable = self.optimize_expression(statement.iterable)
+        statement.body = self.optimize_statement(statement.body)
+        return statement
@@ -1,2 +1,3 @@
 from . import statement, expression
-from .parser import Parser
+from .parser import Parser, StreamParser
+from .printer import AstPrinter
@@ -24,10 +24,18 @@ class ExprVisitor(ABC):
     def visit_get(self, expression: Get):
         pass
 
+    @abstractmethod
+    def visit_get_index(self, expression: GetIndex):
+        pass
+
     @abstractmethod
     def visit_grouping(self, expression: Grouping):
         pass
 
+    @abstractmethod
+    def visit_list(self, expression: ListLiteral):
+        pass
+
     @abstractmethod
     def visit_literal(self, expression: Literal):
         pass
@@ -40,6 +48,10 @@ class ExprVisitor(ABC):
     def visit_set(self, expression: Set):
         pass
 
+    @abstractmethod
+    def visit_set_index(self, expression: SetIndex):
+        pass
+
     @abstractmethod
     def visit_unary(self, expression: Unary):
         pass
@@ -50,12 +62,16 @@ class ExprVisitor(ABC):
 
 
 class Expression(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: ExprVisitor):
         pass
 
 
 class Assign(Expression):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name: Token, value: Expression):
         self.name = name
         self.value = value
@@ -65,16 +81,21 @@ class Assign(Expression):
 
 
 class Binary(Expression):
+    __slots__ = ('left', 'operator', 'right', 'operation')
+
     def __init__(self, left: Expression, operator: Token, right: Expression):
         self.left = left
         self.operator = operator
         self.right = right
+        self.operation = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_binary(self)
 
 
 class Call(Expression):
+    __slots__ = ('callee', 'parenthesis', 'arguments')
+
     def __init__(self, callee: Expression, parenthesis: Token, arguments: List[Expression]):
         self.callee = callee
         self.parenthesis = parenthesis
@@ -85,6 +106,8 @@ class Call(Expression):
 
 
 class Get(Expression):
+    __slots__ = ('target', 'name')
+
     def __init__(self, target: Expression, name: Token):
         self.target = target
         self.name = name
@@ -93,7 +116,21 @@ class Get(Expression):
         return visitor.visit_get(self)
 
 
+class GetIndex(Expression):
+    __slots__ = ('target', 'bracket', 'index')
+
+    def __init__(self, target: Expression, bracket: Token, index: Expression):
+        self.target = target
+        self.bracket = bracket
+        self.index = index
+
+    def accept(self, visitor: ExprVisitor):
+        return visitor.visit_get_index(self)
+
+
 class Grouping(Expression):
+    __slots__ = ('expression',)
+
     def __init__(self, expression: Expression):
         self.expression = expression
 
@@ -101,7 +138,19 @@ class Grouping(Expression):
         return visitor.visit_grouping(self)
 
 
+class ListLiteral(Expression):
+    __slots__ = ('elements',)
+
+    def __init__(self, elements: List[Expression]):
+        self.elements = elements
+
+    def accept(self, visitor: ExprVisitor):
+        return visitor.visit_list(self)
+
+
 class Literal(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value: object):
         self.value = value
 
@@ -110,6 +159,8 @@ class Literal(Expression):
 
 
 class Logical(Expression):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left: Expression, operator: Token, right: Expression):
         self.left = left
         self.operator = operator
@@ -120,6 +171,8 @@ class Logical(Expression):
 
 
 class Set(Expression):
+    __slots__ = ('target', 'name', 'value')
+
     def __init__(self, target: Expression, name: Token, value: Expression):
         self.target = target
         self.name = name
@@ -129,16 +182,34 @@ class Set(Expression):
         return visitor.visit_set(self)
 
 
+class SetIndex(Expression):
+    __slots__ = ('target', 'bracket', 'index', 'value')
+
+    def __init__(self, target: Expression, bracket: Token, index: Expression, value: Expression):
+        self.target = target
+        self.bracket = bracket
+        self.index = index
+        self.value = value
+
+    def accept(self, visitor: ExprVisitor):
+        return visitor.visit_set_index(self)
+
+
 class Unary(Expression):
+    __slots__ = ('operator', 'operand', 'operation')
+
     def __init__(self, operator: Token, operand: Expression):
         self.operator = operator
         self.operand = operand
+        self.operation = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_unary(self)
 
 
 class Variable(Expression):
+    __slots__ = ('name',)
+
     def __init__(self, name: Token):
         self.name = name
 
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Iterable, Iterator
 
 from . import expression as expr
 from . import statement as stmt
@@ -9,13 +9,14 @@ class Parser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
         self.current = 0
+        self.errors: List[RectaParseError] = []
 
     def parse(self) -> List[stmt.Statement]:
-        statements = []
-        while not self.is_end():
-            statements.append(self.declaration())
+        return list(self.declarations())
 
-        return statements
+    def declarations(self) -> Iterator[Optional[stmt.Statement]]:
+        while not self.is_end():
+            yield self.declaration()
 
     def expression(self) -> expr.Expression:
         return self.assignment()
@@ -28,9 +29,14 @@ class Parser:
             if self.match(TokenType.FUN):
                 return self.function()
 
+            if self.match(TokenType.MEMOIZE):
+                self.consume(TokenType.FUN, 'Expect \'fun\' after \'memoize\'.')
+                return self.function(memoize=True)
+
             return self.statement()
         except RectaParseError as error:
             print(error)
+            self.errors.append(error)
 
             self.synchronize()
 
@@ -104,7 +110,7 @@ class Parser:
 
         return stmt.Print(value)
 
-    def function(self) -> stmt.Statement:
+    def function(self, memoize: bool = False) -> stmt.Statement:
         name = self.consume(TokenType.IDENTIFIER, 'Expect function name')
         self.consume(TokenType.LEFT_PAREN, 'Expect \'(\' after function name.')
 
@@ -120,7 +126,7 @@ class Parser:
         else:
             body = [self.statement()]
 
-        return stmt.Function(name, parameters, body)
+        return stmt.Function(name, parameters, body, memoize)
 
     def block(self) -> List[stmt.Statement]:
         statements = []
@@ -136,6 +142,7 @@ class Parser:
         expression = self._or()
 
         if self.match(TokenType.EQUAL):
+            equals = self.peek(-1)
             value = self.assignment()
 
             if isinstance(expression, expr.Variable):
@@ -145,8 +152,10 @@ class Parser:
                 expression.__class__ = expr.Get
 
                 return expr.Set(expression.target, expression.name, value)
+            elif isinstance(expression, expr.GetIndex):
+                return expr.SetIndex(expression.target, expression.bracket, expression.index, value)
 
-            raise RectaParseError('Invalid assignment target.')
+            raise RectaParseError('Invalid assignment target.', equals)
 
         return expression
 
@@ -227,6 +236,10 @@ class Parser:
             elif self.match(TokenType.DOT):
                 name = self.consume(TokenType.IDENTIFIER, 'Expect property name after \'.\'')
                 expression = expr.Get(expression, name)
+            elif self.match(TokenType.LEFT_BRACKET):
+                index = self.expression()
+                bracket = self.consume(TokenType.RIGHT_BRACKET, 'Expect \']\' after index.')
+                expression = expr.GetIndex(expression, bracket, index)
             else:
                 break
 
@@ -264,7 +277,16 @@ class Parser:
             self.consume(TokenType.RIGHT_PAREN, 'Expect \')\' after expression.')
             return expr.Grouping(expression)
 
-        raise RectaParseError(self.peek(), 'Expect expression.')
+        if self.match(TokenType.LEFT_BRACKET):
+            elements = []
+            if not self.check(TokenType.RIGHT_BRACKET):
+                elements.append(self.expression())
+                while self.match(TokenType.COMMA):
+                    elements.append(self.expression())
+            self.consume(TokenType.RIGHT_BRACKET, 'Expect \']\' after list elements.')
+            return expr.ListLiteral(elements)
+
+        raise RectaParseError('Expect expression.', self.peek())
 
     def match(self, *types: TokenType) -> bool:
         for token_type in types:
@@ -278,7 +300,7 @@ class Parser:
         if self.check(token_type):
             return self.advance()
 
-        raise RectaParseError(message)
+        raise RectaParseError(message, self.peek())
 
     def check(self, token_type: TokenType) -> bool:
         if self.is_end():
@@ -304,8 +326,26 @@ class Parser:
             if self.peek(-1).type == TokenType.SEMICOLON:
                 return
 
-            if self.peek().type in [TokenType.IF, TokenType.FUN, TokenType.VAR, TokenType.FOR, TokenType.WHILE,
-                                    TokenType.RETURN, TokenType.PRINT]:
+            if self.peek().type in [TokenType.IF, TokenType.FUN, TokenType.MEMOIZE, TokenType.VAR, TokenType.FOR,
+                                    TokenType.WHILE, TokenType.RETURN, TokenType.PRINT]:
                 return
 
             self.advance()
+
+
+class StreamParser(Parser):
+    def __init__(self, tokens: Iterable[Token]):
+        self.stream = iter(tokens)
+        self.errors: List[RectaParseError] = []
+        self.previous: Optional[Token] = None
+        self.token: Token = next(self.stream)
+
+    def advance(self) -> Token:
+        if not self.is_end():
+            self.previous = self.token
+            self.token = next(self.stream)
+
+        return self.previous
+
+    def peek(self, offset: Optional[int] = 0):
+        return self.token if offset == 0 else self.previous
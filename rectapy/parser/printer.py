@@ -0,0 +1,110 @@
+from typing import List
+
+from . import expression as expr
+from . import statement as stmt
+
+
+class AstPrinter(expr.ExprVisitor, stmt.StmtVisitor):
+    def dump(self, statements: List[stmt.Statement]) -> str:
+        return '\n'.join(self.format_statement(statement) for statement in statements)
+
+    def format_statement(self, statement: stmt.Statement) -> str:
+        return statement.accept(self) if statement else '(nop)'
+
+    def format_expression(self, expression: expr.Expression) -> str:
+        return expression.accept(self) if expression else 'null'
+
+    def parenthesize(self, name: str, *parts: str) -> str:
+        return f'({" ".join((name,) + parts)})'
+
+    def visit_assign(self, expression: expr.Assign):
+        return self.parenthesize('=', expression.name.lexeme, self.format_expression(expression.value))
+
+    def visit_binary(self, expression: expr.Binary):
+        return self.parenthesize(expression.operator.lexeme, self.format_expression(expression.left),
+                                 self.format_expression(expression.right))
+
+    def visit_call(self, expression: expr.Call):
+        return self.parenthesize('call', self.format_expression(expression.callee),
+                                 *map(self.format_expression, expression.arguments))
+
+    def visit_get(self, expression: expr.Get):
+        return self.parenthesize('.', self.format_expression(expression.target), expression.name.lexeme)
+
+    def visit_get_index(self, expression: expr.GetIndex):
+        return self.parenthesize('[]', self.format_expression(expression.target),
+                                 self.format_expression(expression.index))
+
+    def visit_grouping(self, expression: expr.Grouping):
+        return self.parenthesize('group', self.format_expression(expression.expression))
+
+    def visit_list(self, expression: expr.ListLiteral):
+        return self.parenthesize('list', *map(self.format_expression, expression.elements))
+
+    def visit_literal(self, expression: expr.Literal):
+        if expression.value is None:
+            return 'null'
+
+        if isinstance(expression.value, str):
+            return repr(expression.value)
+
+        if isinstance(expression.value, float):
+            return '%g' % expression.value
+
+        return str(expression.value).lower()
+
+    def visit_logical(self, expression: expr.Logical):
+        return self.parenthesize(expression.operator.lexeme, self.format_expression(expression.left),
+                                 self.format_expression(expression.right))
+
+    def visit_set(self, expression: expr.Set):
+        return self.parenthesize('=', self.visit_get(expression), self.format_expression(expression.value))
+
+    def visit_set_index(self, expression: expr.SetIndex):
+        return self.parenthesize('=', self.visit_get_index(expression), self.format_expression(expression.value))
+
+    def visit_unary(self, expression: expr.Unary):
+        return self.parenthesize(expression.operator.lexeme, self.format_expression(expression.operand))
+
+    def visit_variable_get(self, expression: expr.Variable):
+        return expression.name.lexeme
+
+    def visit_block(self, statement: stmt.Block):
+        return self.parenthesize('block', *map(self.format_statement, statement.statements))
+
+    def visit_expression(self, statement: stmt.Expression):
+        return self.parenthesize(';', self.format_expression(statement.expression))
+
+    def visit_function(self, statement: stmt.Function):
+        parameters = self.parenthesize(*(parameter.lexeme for parameter in statement.parameters)) \
+            if statement.parameters else '()'
+        keyword = 'memoize fun' if statement.memoize else 'fun'
+        return self.parenthesize(keyword, statement.name.lexeme, parameters,
+                                 *map(self.format_statement, statement.body))
+
+    def visit_if(self, statement: stmt.If):
+        parts = [self.format_expression(statement.condition), self.format_statement(statement.then_branch)]
+        if statement.else_branch:
+            parts.append(self.format_statement(statement.else_branch))
+        return self.parenthesize('if', *parts)
+
+    def visit_return(self, statement: stmt.Return):
+        if statement.value is None:
+            return '(return)'
+        return self.parenthesize('return', self.format_expression(statement.value))
+
+    def visit_print(self, statement: stmt.Print):
+        return self.parenthesize('print', self.format_expression(statement.expression))
+
+    def visit_variable_set(self, statement: stmt.Var):
+        if statement.initializer is None:
+            return self.parenthesize('var', statement.name.lexeme)
+        return self.parenthesize('var', statement.name.lexeme, self.format_expression(statement.initializer))
+
+    def visit_while(self, statement: stmt.While):
+        return self.parenthesize('while', self.format_expression(statement.condition),
+                                 self.format_statement(statement.body))
+
+    def visit_for(self, statement: stmt.For):
+        return self.parenthesize('for', statement.element.lexeme, self.format_expression(statement.iterable),
+                                 self.format_statement(statement.body))
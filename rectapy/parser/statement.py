@@ -49,20 +49,27 @@ class StmtVisitor(ABC):
 
 
 class Statement(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: StmtVisitor):
         pass
 
 
 class Block(Statement):
+    __slots__ = ('statements', 'scoped')
+
     def __init__(self, statements: List[Statement]):
         self.statements = statements
+        self.scoped = any(isinstance(statement, (Var, Function)) for statement in statements)
 
     def accept(self, visitor):
         return visitor.visit_block(self)
 
 
 class Expression(Statement):
+    __slots__ = ('expression',)
+
     def __init__(self, expression: Expr):
         self.expression = expression
 
@@ -71,16 +78,22 @@ class Expression(Statement):
 
 
 class Function(Statement):
-    def __init__(self, name: Token, parameters: List[Token], body: List[Statement]):
+    __slots__ = ('name', 'parameters', 'body', 'memoize', 'pure', '__weakref__')
+
+    def __init__(self, name: Token, parameters: List[Token], body: List[Statement], memoize: bool = False):
         self.name = name
         self.parameters = parameters
         self.body = body
+        self.memoize = memoize
+        self.pure = False
 
     def accept(self, visitor):
         return visitor.visit_function(self)
 
 
 class If(Statement):
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+
     def __init__(self, condition: Expr, then_branch: Statement, else_branch: Statement):
         self.condition = condition
         self.then_branch = then_branch
@@ -91,15 +104,20 @@ class If(Statement):
 
 
 class Return(Statement):
+    __slots__ = ('keyword', 'value', 'tail_call')
+
     def __init__(self, keyword: Token, value: Expr):
         self.keyword = keyword
         self.value = value
+        self.tail_call = False
 
     def accept(self, visitor):
         return visitor.visit_return(self)
 
 
 class Print(Statement):
+    __slots__ = ('expression',)
+
     def __init__(self, expression: Expr):
         self.expression = expression
 
@@ -108,6 +126,8 @@ class Print(Statement):
 
 
 class Var(Statement):
+    __slots__ = ('name', 'initializer')
+
     def __init__(self, name: Token, initializer: Expr):
         self.name = name
         self.initializer = initializer
@@ -117,6 +137,8 @@ class Var(Statement):
 
 
 class While(Statement):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition: Expr, body: Statement):
         self.condition = condition
         self.body = body
@@ -126,6 +148,8 @@ class While(Statement):
 
 
 class For(Statement):
+    __slots__ = ('element', 'iterable', 'body')
+
     def __init__(self, element: Token, iterable: Expr, body: Statement):
         self.element = element
         self.iterable = iterable
@@ -0,0 +1,221 @@
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List, Dict, Optional
+
+from rectapy import Token, Callable, Function, RectaRuntimeError, expression as expr, statement as stmt
+from rectapy.interpreter import Interpreter, MAX_DEPTH, locate
+
+INTERVAL = 0.001
+MAIN = '<main>'
+TOP = 20
+
+
+class FunctionProfile:
+    __slots__ = ('calls', 'inclusive', 'exclusive', 'active')
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+        self.active = 0
+
+
+class Frame:
+    __slots__ = ('key', 'profile', 'start', 'children')
+
+    def __init__(self, key, profile: FunctionProfile, start: float):
+        self.key = key
+        self.profile = profile
+        self.start = start
+        self.children = 0.0
+
+
+class Profiler:
+    def __init__(self, interval: float = INTERVAL):
+        self.interval = interval
+        self.functions: Dict[object, FunctionProfile] = {}
+        self.stack: List[Frame] = []
+        self.statement: Optional[stmt.Statement] = None
+        self.executions: Counter = Counter()
+        self.statement_samples: Counter = Counter()
+        self.stack_samples: Counter = Counter()
+        self.samples = 0
+        self.elapsed = 0.0
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+        self.switch_interval = 0.0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.stop()
+
+    def start(self) -> None:
+        self.running = True
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval))
+
+        self.enter(MAIN)
+        self.thread = threading.Thread(target=self.sample, name='rectapy-profiler', daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.running = False
+        self.thread.join()
+        self.thread = None
+        sys.setswitchinterval(self.switch_interval)
+
+        while self.stack:
+            self.exit()
+
+    def sample(self) -> None:
+        start = time.perf_counter()
+
+        while self.running:
+            time.sleep(self.interval)
+
+            stack = self.stack[:]
+            statement = self.statement
+
+            if stack:
+                self.samples += 1
+                self.stack_samples[tuple(frame.key for frame in stack)] += 1
+                if statement is not None:
+                    self.statement_samples[statement] += 1
+
+        self.elapsed += time.perf_counter() - start
+
+    def enter(self, key) -> None:
+        profile = self.functions.get(key)
+        if profile is None:
+            profile = self.functions[key] = FunctionProfile()
+
+        profile.calls += 1
+        profile.active += 1
+        self.stack.append(Frame(key, profile, time.perf_counter()))
+
+    def exit(self) -> None:
+        frame = self.stack.pop()
+        elapsed = time.perf_counter() - frame.start
+        profile = frame.profile
+
+        profile.active -= 1
+        if not profile.active:
+            profile.inclusive += elapsed
+        profile.exclusive += elapsed - frame.children
+
+        if self.stack:
+            self.stack[-1].children += elapsed
+
+    def replace(self, key) -> None:
+        self.exit()
+        self.enter(key)
+
+    def report(self, top: int = TOP) -> str:
+        lines = [f'{self.samples} samples in {self.elapsed:.3f}s', '',
+                 f'{"calls":>10} {"inclusive":>11} {"exclusive":>11}  function']
+
+        functions = sorted(self.functions.items(), key=lambda item: item[1].exclusive, reverse=True)
+        for key, profile in functions:
+            lines.append(f'{profile.calls:>10} {profile.inclusive:>10.4f}s {profile.exclusive:>10.4f}s  {label(key)}')
+
+        lines += ['', f'{"samples":>10} {"share":>7} {"executions":>11}  statement']
+
+        for statement, samples in self.statement_samples.most_common(top):
+            share = samples / self.samples * 100
+            lines.append(f'{samples:>10} {share:>6.1f}% {self.executions[statement]:>11}  {describe(statement)}')
+
+        return '\n'.join(lines) + '\n'
+
+    def collapsed(self) -> str:
+        stacks = sorted(';'.join(map(label, keys)) + f' {samples}' for keys, samples in self.stack_samples.items())
+        return ''.join(line + '\n' for line in stacks)
+
+
+class ProfilingInterpreter(Interpreter):
+    def __init__(self, profiler: Profiler, max_depth: int = MAX_DEPTH):
+        super().__init__(max_depth)
+        self.profiler = profiler
+
+    def interpret(self, statements: List[stmt.Statement]):
+        with self.profiler:
+            return super().interpret(statements)
+
+    def execute(self, statement: stmt.Statement):
+        if not statement:
+            return None
+
+        self.statement_count += 1
+        if type(statement) is stmt.Block:
+            return statement.accept(self)
+
+        profiler = self.profiler
+        previous = profiler.statement
+        profiler.statement = statement
+        profiler.executions[statement] += 1
+
+        try:
+            return statement.accept(self)
+        finally:
+            profiler.statement = previous
+
+    def visit_call(self, expression: expr.Call):
+        callee, arguments = self.prepare_call(expression)
+        self.profiler.enter(frame_key(callee))
+
+        try:
+            return callee.call(self, arguments)
+        except RectaRuntimeError as error:
+            raise locate(error, expression.parenthesis)
+        finally:
+            self.profiler.exit()
+
+    def visit_return(self, statement: stmt.Return):
+        result = super().visit_return(statement)
+
+        if self.tail_call is not None:
+            self.profiler.replace(frame_key(self.tail_call[0]))
+
+        return result
+
+
+def frame_key(callee: Callable):
+    return callee.function if type(callee) is Function else str(callee)
+
+
+def label(key) -> str:
+    if isinstance(key, stmt.Function):
+        return f'{key.name.lexeme} ({key.name.source.describe(key.name.offset)})'
+
+    return key
+
+
+def first_token(node) -> Optional[Token]:
+    if isinstance(node, Token):
+        return node
+
+    if isinstance(node, list):
+        children = node
+    elif isinstance(node, (expr.Expression, stmt.Statement)):
+        children = [getattr(node, slot) for slot in type(node).__slots__]
+    else:
+        return None
+
+    tokens = [token for token in map(first_token, children) if token is not None]
+    return min(tokens, key=lambda token: token.offset, default=None)
+
+
+def describe(statement: stmt.Statement) -> str:
+    token = first_token(statement)
+    if token is None or token.source is None:
+        return type(statement).__name__
+
+    number, _ = token.source.location(token.offset)
+    text = token.source.line(number)
+    location = f'{token.source.name}:{number}'
+
+    return location if text is None else f'{location}  {text.strip()}'
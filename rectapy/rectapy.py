@@ -1,27 +1,200 @@
-from typing import Any
+import sys
+from functools import partial
+from typing import Any, Dict, List, Set, Optional, Iterable, Iterator, TextIO, Union
 
 import rectapy
 
 
+CHUNK_SIZE = 64 * 1024
+
+ENGINES = {
+    'tree': rectapy.Interpreter,
+    'vm': rectapy.VM,
+    'closure': rectapy.ClosureInterpreter,
+    'py': rectapy.PyInterpreter,
+}
+
+
 class RectaPy:
-    def __init__(self):
-        self.interpreter = rectapy.Interpreter()
-        self.resolver = rectapy.Resolver(self.interpreter)
+    def __init__(self, engine: str = 'tree', optimize: bool = True, dump_ast: bool = False, strict: bool = False,
+                 max_depth: int = rectapy.interpreter.MAX_DEPTH, cache: bool = True,
+                 profiler: Optional[rectapy.Profiler] = None, memoize: int = 0):
+        if engine not in ENGINES:
+            raise ValueError(f'Unknown engine \'{engine}\'. Expected one of: {", ".join(ENGINES)}.')
+
+        if profiler is None:
+            self.interpreter = ENGINES[engine](max_depth)
+        elif engine == 'tree':
+            self.interpreter = rectapy.ProfilingInterpreter(profiler, max_depth)
+        else:
+            raise ValueError('Profiling is only supported by the tree engine.')
+
+        if memoize:
+            if engine != 'tree':
+                raise ValueError('Memoization is only supported by the tree engine.')
+
+            self.interpreter.memo = rectapy.MemoCache(memoize)
+        self.resolver = rectapy.Resolver(self.interpreter, strict)
+        self.optimizer = rectapy.Optimizer() if optimize else None
+        self.dump_ast = dump_ast
+        self.errors: List[rectapy.RectaError] = []
+        self.cache = None
+        if cache and not dump_ast:
+            self.cache = rectapy.ProgramCache(('' if optimize else '-unoptimized') + ('-strict' if strict else ''))
+
+    def run(self, code: str, name: str = '<input>', budget: Optional[rectapy.Budget] = None):
+        if budget is not None and not isinstance(self.interpreter, rectapy.Interpreter):
+            raise ValueError('Execution budgets are only supported by the tree engine.')
 
-    def run(self, code: str):
-        lexer = rectapy.Lexer(code)
-        tokens = lexer.lex()
+        try:
+            statements = self.compile(code, name)
+
+            if statements is None:
+                return None
+
+            if budget is None:
+                return self.interpret(statements)
+
+            with self.interpreter.limit(budget):
+                return self.interpret(statements)
+        finally:
+            self.resolver.release()
+
+    def interpret(self, statements: Iterable[rectapy.statement.Statement]):
+        try:
+            return self.interpreter.interpret(statements)
+        finally:
+            if self.interpreter.error is not None:
+                self.errors.append(self.interpreter.error)
+
+    def report(self, error: rectapy.RectaError) -> None:
+        self.errors.append(error)
+        print(error)
+
+    def native(self, function=None, *, name: Optional[str] = None, pure: bool = False):
+        return rectapy.native(function, name=name, registry=self.interpreter.globals.values, pure=pure)
+
+    def snapshot(self) -> 'Snapshot':
+        """Record the global bindings; lists, arrays and closure state they refer to are shared, not copied."""
+        return Snapshot(dict(self.interpreter.globals.values), set(self.resolver.globals),
+                        dict(self.resolver.functions), set(self.resolver.rebound))
+
+    def reset(self, snapshot: 'Snapshot') -> None:
+        """Rebind the globals recorded by snapshot; mutations made to the shared values are kept."""
+        values = self.interpreter.globals.values
+        values.clear()
+        values.update(snapshot.values)
+        self.resolver.globals = set(snapshot.globals)
+        self.resolver.functions = dict(snapshot.functions)
+        self.resolver.rebound = set(snapshot.rebound)
+
+    def compile(self, code: str, name: str = '<input>',
+                errors: Optional[List[rectapy.RectaParseError]] = None) -> Optional[List[rectapy.statement.Statement]]:
+        lexer = rectapy.RegexLexer(code, name)
+
+        try:
+            tokens = lexer.lex()
+        except rectapy.RectaSyntaxError as error:
+            self.report(error)
+            return None
 
         parser = rectapy.Parser(tokens)
         statements = parser.parse()
+        self.errors.extend(parser.errors)
+
+        if errors is not None:
+            errors.extend(parser.errors)
+
+        return self.prepare(statements)
+
+    def prepare(self, statements: List[rectapy.statement.Statement],
+                check_globals: bool = True) -> Optional[List[rectapy.statement.Statement]]:
+        try:
+            self.resolver.resolve(statements, check_globals)
+        except rectapy.RectaRuntimeError as error:
+            self.report(error)
+            return None
+
+        if self.dump_ast:
+            print(f'before:\n{rectapy.AstPrinter().dump(statements)}', file=sys.stderr)
 
-        self.resolver.resolve(statements)
+        if self.optimizer:
+            statements = self.optimizer.optimize(statements)
 
-        return self.interpreter.interpret(statements)
+            if self.dump_ast:
+                print(f'after:\n{rectapy.AstPrinter().dump(statements)}', file=sys.stderr)
+
+        return statements
 
     def run_file(self, filename: str) -> None:
         with open(filename, 'r') as f:
-            self.run(f.read())
+            code = f.read()
+
+        if self.cache is None:
+            self.run(code, filename)
+            return
+
+        try:
+            statements = self.load(filename, code)
+
+            if statements is not None:
+                self.interpret(statements)
+        finally:
+            self.resolver.release()
+
+    def load(self, filename: str, code: str) -> Optional[List[rectapy.statement.Statement]]:
+        program = self.cache.load(filename, code)
+
+        if program is None:
+            errors = []
+            statements = self.compile(code, filename, errors)
+
+            if statements is not None and not errors:
+                self.cache.store(filename, code, rectapy.Program(statements, self.resolver.locals,
+                                                                 dict(self.resolver.ownership), self.resolver.bindings,
+                                                                 self.resolver.analyzed, self.resolver.unresolved))
+
+            return statements
+
+        self.resolver.replay(program.bindings, program.analyzed)
+
+        try:
+            self.resolver.check_unresolved(program.unresolved)
+        except rectapy.RectaRuntimeError as error:
+            self.report(error)
+            return None
+
+        self.resolver.restore(program.locals, program.owned)
+
+        return program.statements
+
+    def run_stream(self, stream: Union[TextIO, Iterable[str]]):
+        name = getattr(stream, 'name', '<stream>')
+        if hasattr(stream, 'read'):
+            stream = iter(partial(stream.read, CHUNK_SIZE), '')
+
+        parser = None
+        try:
+            parser = rectapy.StreamParser(rectapy.StreamLexer(stream, name))
+            return self.interpret(self.stream_statements(parser))
+        except rectapy.RectaSyntaxError as error:
+            self.report(error)
+            return None
+        finally:
+            if parser is not None:
+                self.errors.extend(parser.errors)
+
+            self.resolver.release()
+
+    def stream_statements(self, parser: rectapy.StreamParser) -> Iterator[rectapy.statement.Statement]:
+        for statement in parser.declarations():
+            statements = self.prepare([statement], check_globals=False)
+
+            if statements is None:
+                return
+
+            yield from statements
+            self.resolver.release()
 
     def run_prompt(self) -> None:
         try:
@@ -32,3 +205,14 @@ class RectaPy:
                     print(result)
         except KeyboardInterrupt:
             pass
+
+
+class Snapshot:
+    __slots__ = ('values', 'globals', 'functions', 'rebound')
+
+    def __init__(self, values: Dict[str, Any], globals: Set[str], functions: Dict[str, rectapy.statement.Statement],
+                 rebound: Set[str]):
+        self.values = values
+        self.globals = globals
+        self.functions = functions
+        self.rebound = rebound
@@ -1,20 +1,168 @@
-from typing import List, Dict
+import weakref
+from typing import List, Dict, Set, Tuple, Optional
 
-from rectapy import expression as expr, statement as stmt, Token, TokenType, RectaRuntimeError
+from rectapy import expression as expr, statement as stmt, Token, TokenType, RectaRuntimeError, NativeFunction
 from rectapy.interpreter import Interpreter
+from rectapy.operation import BINARY, STRICT_BINARY, UNARY
+
+
+class Scope:
+    def __init__(self):
+        self.slots: Dict[str, int] = {}
+        self.defined: Set[str] = set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.slots
+
+    def is_pending(self, name: str) -> bool:
+        return name in self.slots and name not in self.defined
+
+
+class Purity:
+    __slots__ = ('function', 'base', 'pure', 'globals')
+
+    def __init__(self, function: stmt.Function, base: int):
+        self.function = function
+        self.base = base
+        self.pure = True
+        self.globals: Set[str] = set()
 
 
 class Resolver(expr.ExprVisitor, stmt.StmtVisitor):
-    def __init__(self, interpreter: Interpreter):
+    def __init__(self, interpreter: Interpreter, strict: bool = False):
         self.interpreter = interpreter
-        self.scopes: List[Dict[str, bool]] = []
+        self.binary = STRICT_BINARY if strict else BINARY
+        self.scopes: List[Scope] = []
+        self.globals: Set[str] = set()
+        self.unresolved: List[Token] = []
+        self.locals: Dict[expr.Expression, Tuple[int, int]] = {}
+        self.function_depth = 0
+        self.function: Optional[stmt.Function] = None
+        self.owned: Dict[stmt.Function, List[expr.Expression]] = {}
+        self.ownership: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.transient: List[expr.Expression] = []
+        self.purity: Optional[Purity] = None
+        self.analyzed: List[Purity] = []
+        self.functions: Dict[str, stmt.Function] = {}
+        self.rebound: Set[str] = set()
+        self.dependents: Dict[str, weakref.WeakSet] = {}
+        self.bindings: List[Tuple[str, str, Optional[stmt.Function]]] = []
+
+    def resolve(self, statements: List[stmt.Statement], check_globals: bool = True):
+        self.scopes = []
+        self.unresolved = []
+        self.locals = {}
+        self.owned = {}
+        self.function = None
+        self.purity = None
+        self.analyzed = []
+        self.bindings = []
+
+        try:
+            self.resolve_statements(statements)
+            self.analyze(self.analyzed)
+        finally:
+            for function, expressions in self.owned.items():
+                self.own(function, expressions)
+
+            self.ownership = weakref.WeakKeyDictionary(self.owned)
+            self.owned = {}
+
+        if check_globals:
+            self.check_unresolved(self.unresolved)
+
+    def own(self, function: stmt.Function, expressions: List[expr.Expression]):
+        weakref.finalize(function, release, self.interpreter.locals, expressions).atexit = False
+
+    def restore(self, locals: Dict[expr.Expression, Tuple[int, int]],
+                owned: Dict[stmt.Function, List[expr.Expression]]):
+        for expression, (depth, slot) in locals.items():
+            self.interpreter.resolve(expression, depth, slot)
+
+        claimed = set()
+        for function, expressions in owned.items():
+            self.own(function, expressions)
+            claimed.update(expressions)
+
+        self.transient.extend(expression for expression in locals if expression not in claimed)
+
+    def release(self):
+        release(self.interpreter.locals, self.transient)
+        self.transient = []
+        self.analyzed = []
+        self.bindings = []
+
+    def replay(self, bindings: List[Tuple[str, str, Optional[stmt.Function]]], analyzed: List[Purity]):
+        for kind, name, function in bindings:
+            if kind == 'declare':
+                self.declare_global(name)
+            elif kind == 'assign':
+                self.rebind(name)
+            elif name not in self.rebound:
+                self.functions[name] = function
+
+        for purity in analyzed:
+            purity.function.pure = False
+
+        self.analyze(analyzed)
+
+    def analyze(self, analyzed: List[Purity]):
+        candidates = [purity for purity in analyzed if purity.pure]
+
+        changed = True
+        while changed:
+            pending = {purity.function for purity in candidates}
+            survivors = [purity for purity in candidates
+                         if all(self.is_pure_global(name, pending) for name in purity.globals)]
+            changed = len(survivors) != len(candidates)
+            candidates = survivors
+
+        for purity in candidates:
+            purity.function.pure = True
+
+            for name in purity.globals:
+                self.dependents.setdefault(name, weakref.WeakSet()).add(purity.function)
+
+    def is_pure_global(self, name: str, pending: Set[stmt.Function]) -> bool:
+        if name in self.rebound:
+            return False
+
+        function = self.functions.get(name)
+        if function is not None:
+            return function.pure or function in pending
+
+        if name in self.globals:
+            return False
+
+        value = self.interpreter.globals.values.get(name)
+        return type(value) is NativeFunction and value.pure
+
+    def rebind(self, name: str):
+        self.rebound.add(name)
+        self.functions.pop(name, None)
+
+        for function in list(self.dependents.pop(name, ())):
+            function.pure = False
+
+            if self.functions.get(function.name.lexeme) is function:
+                self.rebind(function.name.lexeme)
+
+    def impure(self):
+        if self.purity is not None:
+            self.purity.pure = False
+
+    def check_unresolved(self, names: List[Token]):
+        for name in names:
+            if name.lexeme not in self.globals and name.lexeme not in self.interpreter.globals.values:
+                raise RectaRuntimeError(f'Undefined variable \'{name.lexeme}\'.', name)
 
-    def resolve(self, statements: List[stmt.Statement]):
+    def resolve_statements(self, statements: List[stmt.Statement]):
         for statement in statements:
             self.resolve_statement(statement)
 
     def resolve_statement(self, statement: stmt.Statement):
-        statement.accept(self)
+        if statement:
+            statement.accept(self)
 
     def resolve_expression(self, expression: expr.Expression):
         expression.accept(self)
@@ -22,48 +170,84 @@ class Resolver(expr.ExprVisitor, stmt.StmtVisitor):
     def resolve_local(self, expression: expr.Expression, name: Token):
         for i, scope in enumerate(reversed(self.scopes)):
             if name.lexeme in scope:
-                self.interpreter.resolve(expression, i)
+                self.locals[expression] = (i, scope.slots[name.lexeme])
+                self.interpreter.resolve(expression, i, scope.slots[name.lexeme])
+
+                if self.purity is not None and len(self.scopes) - 1 - i < self.purity.base:
+                    self.purity.pure = False
+
+                if self.function is None:
+                    self.transient.append(expression)
+                else:
+                    self.owned.setdefault(self.function, []).append(expression)
                 return
 
+        self.unresolved.append(name)
+
+        if self.purity is not None:
+            self.purity.globals.add(name.lexeme)
+
     def resolve_function(self, function: stmt.Function):
+        enclosing = self.function
+        enclosing_purity = self.purity
+        self.impure()
+        self.function = function
+        self.purity = Purity(function, len(self.scopes))
+        self.analyzed.append(self.purity)
+        self.function_depth += 1
         self.begin_scope()
         for parameter in function.parameters:
             self.declare(parameter)
             self.define(parameter)
-        self.resolve(function.body)
+        self.resolve_statements(function.body)
         self.end_scope()
+        self.function_depth -= 1
+        self.function = enclosing
+        self.purity = enclosing_purity
 
     def begin_scope(self):
-        self.scopes.append({})
+        self.scopes.append(Scope())
 
     def end_scope(self):
         self.scopes.pop()
 
     def declare(self, name: Token):
         if not self.scopes:
+            self.bindings.append(('declare', name.lexeme, None))
+            self.declare_global(name.lexeme)
             return
 
         scope = self.scopes[-1]
 
         if name.lexeme in scope:
-            raise RectaRuntimeError('Variable with this name already declared in this scope.')
+            raise RectaRuntimeError('Variable with this name already declared in this scope.', name)
+
+        scope.slots[name.lexeme] = len(scope.slots)
+
+    def declare_global(self, name: str):
+        if name in self.globals or name in self.functions or name in self.interpreter.globals.values:
+            self.rebind(name)
 
-        scope[name.lexeme] = False
+        self.globals.add(name)
 
     def define(self, name: Token):
         if not self.scopes:
             return
 
-        self.scopes[-1][name.lexeme] = True
+        self.scopes[-1].defined.add(name.lexeme)
 
     def visit_block(self, statement: stmt.Block):
+        if not statement.scoped:
+            self.resolve_statements(statement.statements)
+            return
+
         self.begin_scope()
-        self.resolve(statement.statements)
+        self.resolve_statements(statement.statements)
         self.end_scope()
 
     def visit_variable_get(self, expression: expr.Variable):
-        if self.scopes and not self.scopes[-1][expression.name.lexeme]:
-            raise RectaRuntimeError('Cannot read local variable in its own initializer')
+        if self.scopes and self.scopes[-1].is_pending(expression.name.lexeme):
+            raise RectaRuntimeError('Cannot read local variable in its own initializer', expression.name)
 
         self.resolve_local(expression, expression.name)
 
@@ -79,10 +263,21 @@ class Resolver(expr.ExprVisitor, stmt.StmtVisitor):
         self.resolve_expression(expression.value)
         self.resolve_local(expression, expression.name)
 
+        if expression not in self.locals:
+            self.impure()
+            self.bindings.append(('assign', expression.name.lexeme, None))
+            self.rebind(expression.name.lexeme)
+
     def visit_function(self, statement: stmt.Function):
         self.declare(statement.name)
         self.define(statement.name)
 
+        if not self.scopes:
+            self.bindings.append(('function', statement.name.lexeme, statement))
+
+            if statement.name.lexeme not in self.rebound:
+                self.functions[statement.name.lexeme] = statement
+
         self.resolve_function(statement)
 
     def visit_expression(self, statement: stmt.Expression):
@@ -96,26 +291,40 @@ class Resolver(expr.ExprVisitor, stmt.StmtVisitor):
             self.resolve_statement(statement.else_branch)
 
     def visit_print(self, statement: stmt.Print):
+        self.impure()
         self.resolve_expression(statement.expression)
 
     def visit_return(self, statement: stmt.Return):
+        statement.tail_call = self.function_depth > 0 and isinstance(statement.value, expr.Call)
+
         if statement.value:
             self.resolve_expression(statement.value)
 
     def visit_for(self, statement: stmt.For):
-        pass
+        self.resolve_expression(statement.iterable)
+
+        self.begin_scope()
+        self.declare(statement.element)
+        self.define(statement.element)
+        self.resolve_statement(statement.body)
+        self.end_scope()
 
     def visit_while(self, statement: stmt.While):
         self.resolve_expression(statement.condition)
         self.resolve_statement(statement.body)
 
     def visit_binary(self, expression: expr.Binary):
+        expression.operation = self.binary[expression.operator.type]
+
         self.resolve_expression(expression.left)
         self.resolve_expression(expression.right)
 
     def visit_call(self, expression: expr.Call):
         self.resolve_expression(expression.callee)
 
+        if type(expression.callee) is not expr.Variable or expression.callee in self.locals:
+            self.impure()
+
         for argument in expression.arguments:
             self.resolve_expression(argument)
 
@@ -125,9 +334,24 @@ class Resolver(expr.ExprVisitor, stmt.StmtVisitor):
     def visit_set(self, expression: expr.Set):
         pass
 
+    def visit_get_index(self, expression: expr.GetIndex):
+        self.resolve_expression(expression.target)
+        self.resolve_expression(expression.index)
+
+    def visit_set_index(self, expression: expr.SetIndex):
+        self.impure()
+        self.resolve_expression(expression.target)
+        self.resolve_expression(expression.index)
+        self.resolve_expression(expression.value)
+
     def visit_grouping(self, expression: expr.Grouping):
         self.resolve_expression(expression.expression)
 
+    def visit_list(self, expression: expr.ListLiteral):
+        self.impure()
+        for element in expression.elements:
+            self.resolve_expression(element)
+
     def visit_literal(self, expression: expr.Literal):
         pass
 
@@ -136,5 +360,11 @@ class Resolver(expr.ExprVisitor, stmt.StmtVisitor):
         self.resolve_expression(expression.right)
 
     def visit_unary(self, expression: expr.Unary):
+        expression.operation = UNARY[expression.operator.type]
+
         self.resolve_expression(expression.operand)
 
+
+def release(locals: Dict[expr.Expression, Tuple[int, int]], expressions: List[expr.Expression]):
+    for expression in expressions:
+        locals.pop(expression, None)
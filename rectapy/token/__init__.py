@@ -1,3 +1,4 @@
 from .tokentype import TokenType
+from .source import Source
 from .token import Token
-from .lexer import Lexer
+from .lexer import Lexer, RegexLexer, StreamLexer
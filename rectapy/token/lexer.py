@@ -1,24 +1,61 @@
-from typing import List, Optional
+import re
+from sys import intern
+from typing import List, Optional, Iterable, Iterator
 
+from .source import Source
 from .token import Token
-from .tokentype import TokenType
+from .tokentype import TokenType, KEYWORDS
 from rectapy import RectaSyntaxError
 
+SKIP_PATTERN = re.compile(r'(?:\s+|//[^\n]*)*')
+
+TOKEN_PATTERN = re.compile(r'(?=(?P<skip>' + SKIP_PATTERN.pattern + r'))(?P=skip)' + r'''(?:
+    (?P<name>[^\W\d_][^\W_]*)
+  | (?P<operator>[!=<>]=?|[(){}\[\],.\-+;*]|/(?!/))
+  | (?P<number>[0-9]+(?:\.[0-9]*)?)
+  | (?P<string>"[^"]*"|'[^']*')
+  | (?P<end>\Z)
+)''', re.VERBOSE)
+
+OPERATORS = {
+    '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN,
+    '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE,
+    '[': TokenType.LEFT_BRACKET,
+    ']': TokenType.RIGHT_BRACKET,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+    '-': TokenType.MINUS,
+    '+': TokenType.PLUS,
+    ';': TokenType.SEMICOLON,
+    '*': TokenType.STAR,
+    '/': TokenType.SLASH,
+    '!': TokenType.EXCLAM,
+    '!=': TokenType.EXCLAM_EQUAL,
+    '=': TokenType.EQUAL,
+    '==': TokenType.EQUAL_EQUAL,
+    '<': TokenType.LESS,
+    '<=': TokenType.LESS_EQUAL,
+    '>': TokenType.GREATER,
+    '>=': TokenType.GREATER_EQUAL,
+}
+
 
 class Lexer:
-    def __init__(self, source: str):
+    def __init__(self, source: str, name: str = '<input>'):
         self.source = source
+        self.file = Source(source, name)
         self.tokens = []
         self.start = 0
         self.current = 0
-        self.line = 1
 
     def lex(self) -> List[Token]:
         while not self.is_end():
             self.start = self.current
             self.scan_token()
 
-        self.tokens.append(Token(TokenType.EOF, ''))
+        self.tokens.append(Token(TokenType.EOF, '', None, self.current, self.file))
 
         return self.tokens
 
@@ -65,16 +102,12 @@ class Lexer:
                 self.add_token(TokenType.SLASH)
         elif ch.isspace():
             pass
-        elif ch == '\n':
-            self.line += 1
         elif ch == '"' or ch == '\'':
             while self.peek() != ch and not self.is_end():
-                if self.peek() == '\n':
-                    self.line += 1
                 self.advance()
 
             if self.is_end():
-                raise RectaSyntaxError('Unterminated string')
+                raise RectaSyntaxError('Unterminated string').at(self.file, self.start)
 
             self.advance()
             self.add_token(
@@ -96,13 +129,9 @@ class Lexer:
             while self.peek() and self.peek().isalnum():
                 self.advance()
 
-            text = self.source[self.start: self.current]
-            if TokenType.has_value(text):
-                self.add_token(TokenType(text))
-            else:
-                self.add_token(TokenType.IDENTIFIER)
+            self.add_token(KEYWORDS.get(self.source[self.start: self.current], TokenType.IDENTIFIER))
         else:
-            raise RectaSyntaxError('Unexpected token: ' + ch)
+            raise RectaSyntaxError('Unexpected token: ' + ch).at(self.file, self.start)
 
     def is_end(self) -> bool:
         return self.current >= len(self.source)
@@ -124,7 +153,85 @@ class Lexer:
         return True
 
     def add_token(self, token_type: TokenType, literal: Optional[object] = None) -> None:
-        self.tokens.append(Token(token_type, self.source[self.start: self.current], literal))
+        self.tokens.append(Token(token_type, self.source[self.start: self.current], literal, self.start, self.file))
+
+
+class RegexLexer:
+    def __init__(self, source: str, name: str = '<input>'):
+        self.source = source
+        self.file = Source(source, name)
+
+    def lex(self) -> List[Token]:
+        return list(scan((self.source,), self.file))
+
+
+class StreamLexer:
+    def __init__(self, chunks: Iterable[str], name: str = '<stream>'):
+        self.chunks = chunks
+        self.file = Source(None, name)
+
+    def __iter__(self) -> Iterator[Token]:
+        return scan(self.feed(), self.file)
+
+    def feed(self) -> Iterator[str]:
+        for chunk in self.chunks:
+            self.file.feed(chunk)
+            yield chunk
+
+
+def scan(chunks: Iterable[str], file: Source) -> Iterator[Token]:
+    chunks = iter(chunks)
+    buffer = next(chunks, '')
+    base = 0
+    final = False
+
+    while True:
+        position = 0
+        length = len(buffer)
+
+        for match in TOKEN_PATTERN.finditer(buffer):
+            if match.start() != position:
+                start = SKIP_PATTERN.match(buffer, position).end()
+                ch = buffer[start]
+                if ch != '"' and ch != '\'':
+                    raise RectaSyntaxError('Unexpected token: ' + ch).at(file, base + start)
+                if final:
+                    raise RectaSyntaxError('Unterminated string').at(file, base + start)
+                break
+
+            position = match.end()
+            if position == length and not final:
+                position = match.start()
+                break
+
+            kind = match.lastgroup
+            text = match.group(kind)
+            offset = base + position - len(text)
+
+            if kind == 'name':
+                if not text[0].isalpha():
+                    raise RectaSyntaxError('Unexpected token: ' + text[0]).at(file, offset)
+                yield Token(KEYWORDS.get(text, TokenType.IDENTIFIER), intern(text), None, offset, file)
+            elif kind == 'operator':
+                yield Token(OPERATORS[text], text, None, offset, file)
+            elif kind == 'number':
+                yield Token(TokenType.NUMBER, text, float(text), offset, file)
+            elif kind == 'string':
+                quote = text[0]
+                yield Token(TokenType.DOUBLE_STRING if quote == '"' else TokenType.SINGLE_STRING, text,
+                            text.strip(quote), offset, file)
+            else:
+                yield Token(TokenType.EOF, '', None, offset, file)
+                return
+
+        base += position
+        buffer = buffer[position:]
+        chunk = next(chunks, None)
+
+        if chunk is None:
+            final = True
+        else:
+            buffer += chunk
 
 
 def is_digit(ch: str) -> bool:
@@ -0,0 +1,42 @@
+import re
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+NEWLINE = re.compile('\n')
+
+
+class Source:
+    def __init__(self, text: Optional[str] = None, name: str = '<input>'):
+        self.text = text
+        self.name = name
+        self.starts: Optional[List[int]] = None if text is not None else [0]
+        self.length = 0
+
+    def feed(self, chunk: str) -> None:
+        base = self.length
+        self.starts.extend(base + match.end() for match in NEWLINE.finditer(chunk))
+        self.length += len(chunk)
+
+    def line_starts(self) -> List[int]:
+        if self.starts is None:
+            self.starts = [0]
+            self.starts.extend(match.end() for match in NEWLINE.finditer(self.text))
+
+        return self.starts
+
+    def location(self, offset: int) -> Tuple[int, int]:
+        starts = self.line_starts()
+        line = bisect_right(starts, offset)
+        return line, offset - starts[line - 1] + 1
+
+    def describe(self, offset: int) -> str:
+        line, column = self.location(offset)
+        return f'{self.name}:{line}:{column}'
+
+    def line(self, number: int) -> Optional[str]:
+        if self.text is None:
+            return None
+
+        starts = self.line_starts()
+        end = starts[number] - 1 if number < len(starts) else len(self.text)
+        return self.text[starts[number - 1]:end]
@@ -1,13 +1,19 @@
 from typing import Optional
 
+from .source import Source
 from .tokentype import TokenType
 
 
 class Token:
-    def __init__(self, token_type: TokenType, lexeme: str, literal: Optional[object] = None):
+    __slots__ = ('type', 'lexeme', 'literal', 'offset', 'source')
+
+    def __init__(self, token_type: TokenType, lexeme: str, literal: Optional[object] = None, offset: int = 0,
+                 source: Optional[Source] = None):
         self.type = token_type
         self.lexeme = lexeme
         self.literal = literal
+        self.offset = offset
+        self.source = source
 
     def __str__(self):
         return f'{self.type.name}({self.lexeme})'
@@ -49,7 +49,11 @@ class TokenType(Enum):
     IN = 'in'
     RETURN = 'return'
     PRINT = 'print'
+    MEMOIZE = 'memoize'
 
     @classmethod
     def has_value(cls, value):
-        return any(value == item.value for item in cls)
+        return value in KEYWORDS
+
+
+KEYWORDS = {item.value: item for item in TokenType if isinstance(item.value, str)}
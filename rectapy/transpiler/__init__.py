@@ -0,0 +1,2 @@
+from .generator import PythonGenerator
+from .interpreter import PyInterpreter
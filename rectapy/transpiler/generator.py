@@ -0,0 +1,455 @@
+import keyword
+from itertools import count
+from typing import List, Dict, Tuple, Set, Optional
+
+from rectapy import Token, TokenType, expression as expr, statement as stmt
+from rectapy.interpreter import is_truthy
+from rectapy.operation import BINARY
+
+INDENT = '    '
+
+COMPARISONS = (
+    TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL,
+    TokenType.EQUAL_EQUAL, TokenType.EXCLAM_EQUAL,
+)
+
+OPERATORS = {
+    TokenType.PLUS: '+',
+    TokenType.MINUS: '-',
+    TokenType.STAR: '*',
+    TokenType.SLASH: '/',
+    TokenType.GREATER: '>',
+    TokenType.GREATER_EQUAL: '>=',
+    TokenType.LESS: '<',
+    TokenType.LESS_EQUAL: '<=',
+}
+
+HELPERS = {
+    TokenType.PLUS: '_add',
+    TokenType.MINUS: '_subtract',
+    TokenType.STAR: '_multiply',
+    TokenType.SLASH: '_divide',
+    TokenType.GREATER: '_greater',
+    TokenType.GREATER_EQUAL: '_greater_equal',
+    TokenType.LESS: '_less',
+    TokenType.LESS_EQUAL: '_less_equal',
+}
+
+
+class Context:
+    def __init__(self, parent: Optional['Context'] = None, wrapper: bool = False):
+        self.parent = parent
+        self.wrapper = wrapper
+        self.globals: Set[str] = set()
+        self.nonlocals: Set[str] = set()
+        self.loop_depth = 0
+
+    @property
+    def module(self) -> bool:
+        return self.parent is None
+
+
+class Scope:
+    def __init__(self, context: Context):
+        self.context = context
+        self.names: List[str] = []
+
+
+def is_global_name(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def declares_function(statements: List[stmt.Statement]) -> bool:
+    for statement in statements:
+        if isinstance(statement, stmt.Function):
+            return True
+        if isinstance(statement, stmt.Block) and declares_function(statement.statements):
+            return True
+        if isinstance(statement, stmt.If) and declares_function([statement.then_branch, statement.else_branch]):
+            return True
+        if isinstance(statement, (stmt.While, stmt.For)) and declares_function([statement.body]):
+            return True
+
+    return False
+
+
+class PythonGenerator(expr.ExprVisitor, stmt.StmtVisitor):
+    def __init__(self, locals: Dict[expr.Expression, Tuple[int, int]]):
+        self.locals = locals
+        self.counter = count()
+        self.context = Context()
+        self.scopes: List[Scope] = []
+        self.lines: List[str] = []
+        self.indent = 0
+        self.tokens: Dict[str, Token] = {}
+        self.names: Dict[str, Token] = {}
+
+    def generate(self, statements: List[stmt.Statement]) -> str:
+        self.context.globals.add('_result')
+
+        for statement in statements:
+            if isinstance(statement, stmt.Expression):
+                self.emit(f'_result = {self.generate_expression(statement.expression)}')
+            else:
+                self.generate_statement(statement)
+                self.emit('_result = None')
+
+        return '\n'.join(self.lines) + '\n'
+
+    def generate_statement(self, statement: stmt.Statement):
+        if statement:
+            statement.accept(self)
+
+    def generate_expression(self, expression: expr.Expression) -> str:
+        return expression.accept(self) if expression else 'None'
+
+    def generate_condition(self, expression: expr.Expression) -> str:
+        if isinstance(expression, expr.Binary) and expression.operator.type in COMPARISONS:
+            return self.generate_expression(expression)
+
+        if isinstance(expression, expr.Unary) and expression.operator.type == TokenType.EXCLAM:
+            return self.generate_expression(expression)
+
+        if isinstance(expression, expr.Logical):
+            operator = 'or' if expression.operator.type == TokenType.OR else 'and'
+            return f'({self.generate_condition(expression.left)} {operator} ' \
+                   f'{self.generate_condition(expression.right)})'
+
+        if isinstance(expression, expr.Literal):
+            return repr(is_truthy(expression.value))
+
+        return f'_truthy({self.generate_expression(expression)})'
+
+    def generate_body(self, statements: List[stmt.Statement]):
+        self.indent += 1
+        start = len(self.lines)
+
+        for statement in statements:
+            self.generate_statement(statement)
+
+        if len(self.lines) == start:
+            self.emit('pass')
+
+        self.indent -= 1
+
+    def emit(self, line: str):
+        self.lines.append(INDENT * self.indent + line)
+
+    def unique(self, prefix: str) -> str:
+        return f'{prefix}_{next(self.counter)}'
+
+    def temporary(self) -> str:
+        return self.unique('_t')
+
+    def token(self, token: Token) -> str:
+        name = self.unique('_k')
+        self.tokens[name] = token
+        return name
+
+    def begin_scope(self):
+        self.scopes.append(Scope(self.context))
+
+    def end_scope(self):
+        self.scopes.pop()
+
+    def declare(self, name: str) -> str:
+        if not self.scopes:
+            if not is_global_name(name):
+                return self.unique('_g')
+
+            self.context.globals.add(name)
+            return name
+
+        variable = self.unique(name)
+        self.scopes[-1].names.append(variable)
+        return variable
+
+    def bind(self, name: str, variable: str, value: str):
+        if self.scopes or is_global_name(name):
+            self.emit(f'{variable} = {value}')
+        else:
+            self.emit(f'_G[{name!r}] = {value}')
+
+    def local(self, expression: expr.Expression) -> Optional[Tuple[str, Context]]:
+        if expression not in self.locals:
+            return None
+
+        distance, slot = self.locals[expression]
+        scope = self.scopes[len(self.scopes) - 1 - distance]
+        return scope.names[slot], scope.context
+
+    def assign_target(self, expression: expr.Assign) -> Optional[str]:
+        local = self.local(expression)
+
+        if local is None:
+            name = expression.name.lexeme
+            if not is_global_name(name):
+                return None
+
+            self.context.globals.add(name)
+            return name
+
+        variable, owner = local
+        if owner is not self.context:
+            self.context.nonlocals.add(variable)
+
+        return variable
+
+    def is_simple(self, expression: expr.Expression) -> bool:
+        if isinstance(expression, expr.Literal):
+            return True
+
+        if isinstance(expression, expr.Variable):
+            return expression in self.locals or is_global_name(expression.name.lexeme)
+
+        return False
+
+    def visit_assign(self, expression: expr.Assign):
+        value = self.generate_expression(expression.value)
+        target = self.assign_target(expression)
+
+        if target is None:
+            return f'_assign_global({expression.name.lexeme!r}, {value}, {self.token(expression.name)})'
+
+        return f'({target} := {value})'
+
+    def visit_binary(self, expression: expr.Binary):
+        left = self.generate_expression(expression.left)
+        right = self.generate_expression(expression.right)
+        opertype = expression.operator.type
+
+        if expression.operation is not BINARY[opertype]:
+            return f'_apply({self.token(expression.operator)}, _{expression.operation.__name__}, {left}, {right})'
+
+        if opertype == TokenType.EQUAL_EQUAL:
+            return f'({left} == {right})'
+
+        if opertype == TokenType.EXCLAM_EQUAL:
+            return f'({left} != {right})'
+
+        generic = f'_apply({self.token(expression.operator)}, {HELPERS[opertype]}, {left}, {right})'
+
+        operands = (expression.left, expression.right)
+        if not all(map(self.is_simple, operands)) or all(isinstance(operand, expr.Literal) for operand in operands):
+            return generic
+
+        literals = [operand.value for operand in operands if isinstance(operand, expr.Literal)]
+        variables = [code for operand, code in zip(operands, (left, right)) if not isinstance(operand, expr.Literal)]
+
+        if not literals:
+            condition = f'_type({left}) is _float and _type({right}) is _float'
+        elif type(literals[0]) is float:
+            condition = f'_type({variables[0]}) is _float'
+        else:
+            return generic
+
+        return f'({left} {OPERATORS[opertype]} {right} if {condition} else {generic})'
+
+    def visit_call(self, expression: expr.Call):
+        callee = self.generate_expression(expression.callee)
+        arguments = [self.generate_expression(argument) for argument in expression.arguments]
+        token = self.token(expression.parenthesis)
+
+        if isinstance(expression.callee, expr.Variable) and self.is_simple(expression.callee):
+            return f'({callee}({", ".join(arguments)}) if _type({callee}) is _function ' \
+                   f'and {callee}.__code__.co_argcount == {len(arguments)} and _depth < _max_depth ' \
+                   f'else _call({token}, {callee}, [{", ".join(arguments)}]))'
+
+        return f'_call({token}, {callee}, [{", ".join(arguments)}])'
+
+    def visit_get(self, expression: expr.Get):
+        return 'None'
+
+    def visit_get_index(self, expression: expr.GetIndex):
+        target = self.generate_expression(expression.target)
+        index = self.generate_expression(expression.index)
+        return f'_apply({self.token(expression.bracket)}, _index, {target}, {index})'
+
+    def visit_grouping(self, expression: expr.Grouping):
+        return f'({self.generate_expression(expression.expression)})'
+
+    def visit_list(self, expression: expr.ListLiteral):
+        return f'_list([{", ".join(map(self.generate_expression, expression.elements))}])'
+
+    def visit_literal(self, expression: expr.Literal):
+        return repr(expression.value)
+
+    def visit_logical(self, expression: expr.Logical):
+        left = self.generate_expression(expression.left)
+        right = self.generate_expression(expression.right)
+        temporary = self.temporary()
+
+        if expression.operator.type == TokenType.OR:
+            return f'({temporary} if _truthy({temporary} := {left}) else {right})'
+
+        return f'({right} if _truthy({temporary} := {left}) else {temporary})'
+
+    def visit_set(self, expression: expr.Set):
+        return 'None'
+
+    def visit_set_index(self, expression: expr.SetIndex):
+        target = self.generate_expression(expression.target)
+        index = self.generate_expression(expression.index)
+        value = self.generate_expression(expression.value)
+        return f'_apply({self.token(expression.bracket)}, _assign_index, {target}, {index}, {value})'
+
+    def visit_unary(self, expression: expr.Unary):
+        operand = self.generate_expression(expression.operand)
+
+        if expression.operator.type == TokenType.EXCLAM:
+            return f'(not _truthy({operand}))'
+
+        if isinstance(expression.operand, expr.Literal) and type(expression.operand.value) is float:
+            return f'(-{operand})'
+
+        token = self.token(expression.operator)
+
+        if self.is_simple(expression.operand):
+            return f'(-{operand} if _type({operand}) is _float else _apply({token}, _negate, {operand}))'
+
+        return f'_apply({token}, _negate, {operand})'
+
+    def visit_variable_get(self, expression: expr.Variable):
+        local = self.local(expression)
+        if local is not None:
+            return local[0]
+
+        name = expression.name.lexeme
+        if not is_global_name(name):
+            return f'_global({name!r}, {self.token(expression.name)})'
+
+        self.names.setdefault(name, expression.name)
+        return name
+
+    def visit_block(self, statement: stmt.Block):
+        if not statement.scoped:
+            for inner in statement.statements:
+                self.generate_statement(inner)
+            return
+
+        if self.context.loop_depth and declares_function(statement.statements):
+            self.generate_wrapper(statement.statements)
+            return
+
+        self.begin_scope()
+        for inner in statement.statements:
+            self.generate_statement(inner)
+        self.end_scope()
+
+    def generate_wrapper(self, statements: List[stmt.Statement]):
+        name = self.unique('_scope')
+        parent = self.context
+
+        self.generate_function(name, [], statements, wrapper=True)
+
+        result = self.temporary()
+        self.emit(f'{result} = {name}()')
+        self.emit(f'if {result} is not _CONTINUE:')
+        self.emit(f'{INDENT}raise _Stop()' if parent.module else f'{INDENT}return {result}')
+
+    def generate_function(self, name: str, parameters: List[str], body: List[stmt.Statement], wrapper=False):
+        enclosing_lines, enclosing_indent = self.lines, self.indent
+        self.context = Context(self.context, wrapper)
+        self.lines, self.indent = [], 0
+
+        self.begin_scope()
+        variables = [self.declare(parameter) for parameter in parameters]
+        self.generate_body(body)
+        self.end_scope()
+
+        if wrapper:
+            self.indent += 1
+            self.emit('return _CONTINUE')
+            self.indent -= 1
+        else:
+            self.context.globals.add('_depth')
+
+        context, lines = self.context, self.lines
+        self.context, self.lines, self.indent = context.parent, enclosing_lines, enclosing_indent
+
+        self.emit(f'def {name}({", ".join(variables)}):')
+        self.indent += 1
+        if context.globals:
+            self.emit(f'global {", ".join(sorted(context.globals))}')
+        if context.nonlocals:
+            self.emit(f'nonlocal {", ".join(sorted(context.nonlocals))}')
+
+        if wrapper:
+            self.lines.extend(INDENT * (self.indent - 1) + line for line in lines)
+        else:
+            self.emit('_depth += 1')
+            self.emit('try:')
+            self.lines.extend(INDENT * self.indent + line for line in lines)
+            self.emit('finally:')
+            self.emit(f'{INDENT}_depth -= 1')
+        self.indent -= 1
+
+    def visit_expression(self, statement: stmt.Expression):
+        expression = statement.expression
+
+        if isinstance(expression, expr.Assign):
+            value = self.generate_expression(expression.value)
+            target = self.assign_target(expression)
+
+            if target is None:
+                self.emit(f'_assign_global({expression.name.lexeme!r}, {value}, {self.token(expression.name)})')
+            else:
+                self.emit(f'{target} = {value}')
+            return
+
+        self.emit(self.generate_expression(expression))
+
+    def visit_function(self, statement: stmt.Function):
+        name = statement.name.lexeme
+        variable = self.declare(name)
+
+        self.generate_function(variable, [parameter.lexeme for parameter in statement.parameters], statement.body)
+
+        if variable != name:
+            self.emit(f'{variable}.__name__ = {name!r}')
+            if not self.scopes:
+                self.bind(name, variable, variable)
+
+    def visit_if(self, statement: stmt.If):
+        self.emit(f'if {self.generate_condition(statement.condition)}:')
+        self.generate_body([statement.then_branch])
+
+        if statement.else_branch:
+            self.emit('else:')
+            self.generate_body([statement.else_branch])
+
+    def visit_return(self, statement: stmt.Return):
+        value = self.generate_expression(statement.value)
+
+        if self.context.module:
+            self.emit(value)
+            self.emit('raise _Stop()')
+        else:
+            self.emit(f'return {value}')
+
+    def visit_print(self, statement: stmt.Print):
+        self.emit(f'_output({self.generate_expression(statement.expression)})')
+
+    def visit_variable_set(self, statement: stmt.Var):
+        value = self.generate_expression(statement.initializer)
+        name = statement.name.lexeme
+        self.bind(name, self.declare(name), value)
+
+    def visit_while(self, statement: stmt.While):
+        self.emit(f'while {self.generate_condition(statement.condition)}:')
+
+        self.context.loop_depth += 1
+        self.generate_body([statement.body])
+        self.context.loop_depth -= 1
+
+    def visit_for(self, statement: stmt.For):
+        iterable = self.generate_expression(statement.iterable)
+
+        self.begin_scope()
+        variable = self.declare(statement.element.lexeme)
+        self.emit(f'for {variable} in _iterate({iterable}, {self.token(statement.element)}):')
+
+        self.context.loop_depth += 1
+        self.generate_body([statement.body])
+        self.context.loop_depth -= 1
+        self.end_scope()
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from functools import partial
+from types import CodeType
+from typing import List, Dict, Set, Tuple, Optional
+
+from rectapy import GlobalEnvironment, RectaRuntimeError, Token, BUILTINS, expression as expr, statement as stmt
+from rectapy.interpreter import MAX_DEPTH, recursion_limit
+
+from . import runtime
+from .generator import PythonGenerator, INDENT
+
+CACHE_SIZE = 256
+
+code_cache: 'OrderedDict[str, CodeType]' = OrderedDict()
+
+
+def wrap(source: str, parameters: List[str], names: Set[str]) -> str:
+    lines = [f'def _run({", ".join(parameters)}):']
+    if names:
+        lines.append(f'{INDENT}global {", ".join(sorted(names))}')
+    lines += [INDENT + line for line in source.splitlines()]
+    lines.append(f'{INDENT}pass')
+
+    return '\n'.join(lines) + '\n'
+
+
+def compile_source(source: str, parameters: List[str], names: Set[str]) -> CodeType:
+    code = code_cache.get(source)
+
+    if code is None:
+        code = compile(wrap(source, parameters, names), '<recta>', 'exec')
+        code_cache[source] = code
+
+        if len(code_cache) > CACHE_SIZE:
+            code_cache.popitem(last=False)
+    else:
+        code_cache.move_to_end(source)
+
+    return code
+
+
+class PyInterpreter:
+    def __init__(self, max_depth: int = MAX_DEPTH):
+        self.globals = GlobalEnvironment(BUILTINS)
+        self.locals: Dict[expr.Expression, Tuple[int, int]] = {}
+        self.error: Optional[RectaRuntimeError] = None
+        self.max_depth = max_depth
+
+        namespace = self.globals.values
+        namespace.update(runtime.HELPERS)
+        namespace['__builtins__'] = {}
+        namespace['_G'] = namespace
+        namespace['_depth'] = 0
+        namespace['_max_depth'] = max_depth
+        namespace['_call'] = partial(runtime.call, self)
+        namespace['_global'] = self.get_global
+        namespace['_assign_global'] = self.assign_global
+
+    def interpret(self, statements: List[stmt.Statement]):
+        namespace = self.globals.values
+        namespace['_result'] = None
+        namespace['_depth'] = 0
+        self.error = None
+
+        generator = PythonGenerator(self.locals)
+        code = compile_source(generator.generate(statements), list(generator.tokens), generator.context.globals)
+        exec(code, namespace)
+        run = namespace.pop('_run')
+
+        try:
+            with recursion_limit(self.max_depth):
+                try:
+                    run(**generator.tokens)
+                except runtime.Stop:
+                    pass
+
+                return runtime.represent(namespace['_result'])
+        except NameError as error:
+            self.error = runtime.undefined(error.name, generator.names.get(error.name))
+            print(self.error)
+        except RectaRuntimeError as error:
+            self.error = error
+            print(error)
+
+    def transpile(self, statements: List[stmt.Statement]) -> str:
+        return PythonGenerator(self.locals).generate(statements)
+
+    def resolve(self, expression: expr.Expression, depth: int, slot: int):
+        self.locals[expression] = (depth, slot)
+
+    def call(self, callee, arguments: List):
+        return runtime.invoke(self, callee, list(arguments))
+
+    def get_global(self, name: str, token: Optional[Token] = None):
+        try:
+            return self.globals.values[name]
+        except KeyError:
+            raise runtime.undefined(name, token)
+
+    def assign_global(self, name: str, value, token: Optional[Token] = None):
+        if name not in self.globals.values:
+            raise runtime.undefined(name, token)
+
+        self.globals.values[name] = value
+        return value
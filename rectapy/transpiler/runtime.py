@@ -0,0 +1,105 @@
+from types import FunctionType
+from typing import List, Set, Any, Optional
+
+from rectapy import RectaRuntimeError, RectaStackOverflowError, Callable, NativeFunction, VARIADIC, Token, RectaList, \
+    iterate as iterate_value
+from rectapy.interpreter import is_truthy, stringify, locate
+from rectapy.type.list import format_list
+from rectapy.operation import add, subtract, multiply, divide, greater, greater_equal, less, less_equal, negate, \
+    index, assign_index, STRICT_BINARY
+
+CONTINUE = object()
+
+
+class Stop(Exception):
+    pass
+
+
+def represent(value: object, seen: Optional[Set[int]] = None) -> str:
+    if type(value) is FunctionType:
+        return f'<fn {value.__name__}>'
+
+    if type(value) is RectaList:
+        return format_list(value, represent, seen)
+
+    return stringify(value)
+
+
+def output(value: object) -> None:
+    print(represent(value))
+
+
+def undefined(name: str, token: Optional[Token] = None) -> RectaRuntimeError:
+    return RectaRuntimeError(f'Undefined variable \'{name}\'.', token)
+
+
+def apply(token: Token, operation, *operands):
+    try:
+        return operation(*operands)
+    except RectaRuntimeError as error:
+        raise locate(error, token)
+
+
+def iterate(value, token: Token):
+    try:
+        return iterate_value(value)
+    except RectaRuntimeError as error:
+        raise locate(error, token)
+
+
+def call(interpreter, token: Token, callee, arguments: List[Any]):
+    try:
+        return invoke(interpreter, callee, arguments)
+    except RectaRuntimeError as error:
+        raise locate(error, token)
+
+
+def invoke(interpreter, callee, arguments: List[Any]):
+    if type(callee) is FunctionType:
+        arity = callee.__code__.co_argcount
+        if len(arguments) != arity:
+            raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.')
+
+        if interpreter.globals.values['_depth'] >= interpreter.max_depth:
+            raise RectaStackOverflowError('Stack overflow.')
+
+        return callee(*arguments)
+
+    if not isinstance(callee, Callable):
+        raise RectaRuntimeError('Only functions are callable.')
+
+    arity = callee.arity()
+    if len(arguments) != arity and arity != VARIADIC:
+        raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.')
+
+    if type(callee) is NativeFunction:
+        return callee.function(*arguments)
+
+    return callee.call(interpreter, arguments)
+
+
+HELPERS = {
+    '_type': type,
+    '_float': float,
+    '_function': FunctionType,
+    '_truthy': is_truthy,
+    '_output': output,
+    '_add': add,
+    '_subtract': subtract,
+    '_multiply': multiply,
+    '_divide': divide,
+    '_greater': greater,
+    '_greater_equal': greater_equal,
+    '_less': less,
+    '_less_equal': less_equal,
+    '_negate': negate,
+    '_list': RectaList,
+    '_index': index,
+    '_assign_index': assign_index,
+    '_undefined': undefined,
+    '_apply': apply,
+    '_iterate': iterate,
+    '_CONTINUE': CONTINUE,
+    '_Stop': Stop,
+    **{f'_{operation.__name__}': operation for operation in STRICT_BINARY.values()},
+}
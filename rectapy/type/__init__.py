@@ -1,2 +1,9 @@
 from .callable import Callable
 from .function import Function
+from .native import NativeFunction, VARIADIC, BUILTINS, native
+from .iterable import Iterable, iterate
+from .range import Range
+from .list import RectaList
+from .array import Array
+from .rope import Rope
+from . import library
@@ -0,0 +1,64 @@
+import operator
+from array import array
+from itertools import repeat
+from typing import Optional
+
+from rectapy import RectaRuntimeError
+from rectapy.budget import allocate
+
+from .iterable import Iterable
+from .list import RectaList
+from .range import Range
+
+
+class Array(Iterable):
+    __slots__ = ('values',)
+
+    def __init__(self, values: array):
+        self.values = values
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other):
+        return type(other) is Array and other.values == self.values
+
+    __hash__ = None
+
+    def __str__(self):
+        return f'array([{", ".join("%g" % value for value in self.values)}])'
+
+
+def elementwise(operation, left, right) -> Optional[Array]:
+    if type(left) is Array:
+        if type(right) is Array:
+            if len(left.values) != len(right.values):
+                raise RectaRuntimeError(f'Array lengths differ: {len(left.values)} and {len(right.values)}.')
+
+            return Array(array('d', map(operation, left.values, right.values)))
+
+        if type(right) is float:
+            return Array(array('d', map(operation, left.values, repeat(right))))
+    elif type(left) is float and type(right) is Array:
+        return Array(array('d', map(operation, repeat(left), right.values)))
+
+    return None
+
+
+def negate(value: Array) -> Array:
+    return Array(array('d', map(operator.neg, value.values)))
+
+
+def numbers(value) -> array:
+    if type(value) is Array:
+        return value.values
+
+    if type(value) is Range:
+        allocate(value.stop)
+        return array('d', value)
+
+    if type(value) is RectaList and all(type(element) is float for element in value.values):
+        allocate(len(value.values))
+        return array('d', value)
+
+    raise RectaRuntimeError('Array elements must be numbers.')
@@ -1,7 +1,9 @@
-from rectapy import Environment, statement as stmt, ReturnTrigger
+from rectapy import Environment, RectaStackOverflowError, statement as stmt
 
 from .callable import Callable
 
+RETURN = object()
+
 
 class Function(Callable):
     def __init__(self, function: stmt.Function, closure: Environment):
@@ -12,13 +14,42 @@ class Function(Callable):
         return len(self.function.parameters)
 
     def call(self, interpreter, arguments):
-        environment = Environment(self.closure)
-        for parameter, argument in zip(self.function.parameters, arguments):
-            environment.define(parameter.lexeme, argument)
+        memo = interpreter.memo
+        if memo is not None and (self.function.pure or self.function.memoize):
+            return memo.call(self, interpreter, arguments)
+
+        return self.invoke(interpreter, arguments)
+
+    def invoke(self, interpreter, arguments):
+        if interpreter.depth >= interpreter.max_depth:
+            raise RectaStackOverflowError('Stack overflow.')
+
+        interpreter.depth += 1
+        if interpreter.depth > interpreter.peak_depth:
+            interpreter.peak_depth = interpreter.depth
+
+        function = self
+        budget = interpreter.budget
 
         try:
-            interpreter.execute_block(self.function.body, environment)
-        except ReturnTrigger as trigger:
-            return trigger.value
+            if budget is not None:
+                budget.check(interpreter)
+
+            while interpreter.execute_block(function.function.body, Environment(function.closure, arguments)) is RETURN:
+                if interpreter.tail_call is None:
+                    value = interpreter.return_value
+                    interpreter.return_value = None
+                    return value
+
+                function, arguments = interpreter.tail_call
+                interpreter.tail_call = None
+
+                if budget is not None:
+                    budget.check(interpreter)
+
+            return None
+        finally:
+            interpreter.depth -= 1
 
-        return None
+    def __str__(self):
+        return f'<fn {self.function.name.lexeme}>'
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+
+from rectapy import RectaRuntimeError
+
+
+class Iterable(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Any]:
+        pass
+
+
+def iterate(value) -> Iterator[Any]:
+    if not isinstance(value, Iterable):
+        raise RectaRuntimeError('Only ranges, lists and arrays can be iterated.')
+
+    return iter(value)
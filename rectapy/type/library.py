@@ -0,0 +1,140 @@
+import math
+import time
+from array import array
+
+from rectapy import RectaRuntimeError
+from rectapy.budget import allocate
+
+from .array import Array, numbers
+from .list import RectaList
+from .native import native
+from .range import Range
+from .rope import Rope
+
+
+def number(value, function: str) -> float:
+    if type(value) is not float or math.isinf(value) or math.isnan(value):
+        raise RectaRuntimeError(f'{function}() expects a finite number.')
+
+    return value
+
+
+def integer(value, function: str) -> int:
+    if type(value) is not float or not value.is_integer():
+        raise RectaRuntimeError(f'{function}() expects an integer.')
+
+    return int(value)
+
+
+@native
+def clock():
+    return time.perf_counter()
+
+
+@native(name='len', pure=True)
+def length(value):
+    if type(value) is str or type(value) is Rope:
+        return float(len(value))
+
+    if type(value) is RectaList or type(value) is Array:
+        return float(len(value.values))
+
+    raise RectaRuntimeError('len() expects a string, list or array.')
+
+
+@native(pure=True)
+def substring(text, start, end):
+    if type(text) is Rope:
+        text = str(text)
+    elif type(text) is not str:
+        raise RectaRuntimeError('substring() expects a string.')
+
+    start, end = integer(start, 'substring'), integer(end, 'substring')
+    if not 0 <= start <= end <= len(text):
+        raise RectaRuntimeError(f'substring() bounds {start}..{end} out of range for length {len(text)}.')
+
+    return text[start:end]
+
+
+@native(pure=True)
+def fixed(value, digits):
+    digits = integer(digits, 'fixed')
+    if not 0 <= digits <= 20:
+        raise RectaRuntimeError('fixed() expects between 0 and 20 digits.')
+
+    return '%.*f' % (digits, number(value, 'fixed'))
+
+
+@native(pure=True)
+def sqrt(value):
+    if number(value, 'sqrt') < 0:
+        raise RectaRuntimeError('sqrt() expects a non-negative number.')
+
+    return math.sqrt(value)
+
+
+@native(pure=True)
+def floor(value):
+    return float(math.floor(number(value, 'floor')))
+
+
+@native(name='abs', pure=True)
+def absolute(value):
+    return abs(number(value, 'abs'))
+
+
+@native(name='range', pure=True)
+def make_range(stop):
+    return Range(max(0, math.ceil(number(stop, 'range'))))
+
+
+@native(name='array')
+def make_array(value):
+    if type(value) is Array:
+        allocate(len(value.values))
+        return Array(array('d', value.values))
+
+    if type(value) is float:
+        length = max(0, math.ceil(number(value, 'array')))
+        allocate(length)
+        return Array(array('d', bytes(8 * length)))
+
+    return Array(numbers(value))
+
+
+@native(name='sum', pure=True)
+def total(values):
+    if type(values) is Range:
+        return float(values.stop * (values.stop - 1) // 2)
+
+    return sum(numbers(values), 0.0)
+
+
+def extreme(name: str, function, values):
+    if not values:
+        raise RectaRuntimeError(f'{name}() expects at least one argument.')
+
+    if len(values) == 1 and type(values[0]) is Range:
+        if not values[0].stop:
+            raise RectaRuntimeError(f'{name}() of an empty sequence.')
+
+        return function(0.0, float(values[0].stop - 1))
+
+    if len(values) == 1 and type(values[0]) is not float:
+        values = numbers(values[0])
+        if not values:
+            raise RectaRuntimeError(f'{name}() of an empty sequence.')
+    elif any(type(value) is not float for value in values):
+        raise RectaRuntimeError(f'{name}() expects numbers.')
+
+    return function(values)
+
+
+@native(name='min', pure=True)
+def minimum(*values):
+    return extreme('min', min, values)
+
+
+@native(name='max', pure=True)
+def maximum(*values):
+    return extreme('max', max, values)
@@ -0,0 +1,51 @@
+from typing import Any, List, Set, Tuple, Optional
+
+from .iterable import Iterable
+
+
+class RectaList(Iterable):
+    __slots__ = ('values',)
+
+    def __init__(self, values: List[Any]):
+        self.values = values
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other):
+        return type(other) is RectaList and equal(self, other, set())
+
+    __hash__ = None
+
+
+def equal(left: RectaList, right: RectaList, comparing: Set[Tuple[int, int]]) -> bool:
+    if left is right or (id(left), id(right)) in comparing:
+        return True
+
+    if len(left.values) != len(right.values):
+        return False
+
+    comparing.add((id(left), id(right)))
+
+    for a, b in zip(left.values, right.values):
+        if type(a) is RectaList and type(b) is RectaList:
+            if not equal(a, b, comparing):
+                return False
+        elif a != b:
+            return False
+
+    return True
+
+
+def format_list(value: RectaList, element, seen: Optional[Set[int]]) -> str:
+    if seen is None:
+        seen = set()
+
+    if id(value) in seen:
+        return '[...]'
+
+    seen.add(id(value))
+    try:
+        return f'[{", ".join(element(item, seen) for item in value.values)}]'
+    finally:
+        seen.remove(id(value))
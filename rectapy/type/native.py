@@ -0,0 +1,47 @@
+import inspect
+from typing import Any, Dict, List, Optional
+
+from .callable import Callable
+
+VARIADIC = -1
+
+BUILTINS: Dict[str, Callable] = {}
+
+
+class NativeFunction(Callable):
+    __slots__ = ('name', 'function', 'parameters', 'pure')
+
+    def __init__(self, name: str, function, parameters: int, pure: bool = False):
+        self.name = name
+        self.function = function
+        self.parameters = parameters
+        self.pure = pure
+
+    def arity(self) -> int:
+        return self.parameters
+
+    def call(self, interpreter, arguments: List[Any]):
+        return self.function(*arguments)
+
+    def __str__(self):
+        return f'<native fn {self.name}>'
+
+
+def arity(function) -> int:
+    parameters = inspect.signature(function).parameters.values()
+
+    if any(parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters):
+        return VARIADIC
+
+    return sum(parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+               and parameter.default is parameter.empty for parameter in parameters)
+
+
+def native(function=None, *, name: Optional[str] = None, registry: Optional[Dict[str, Any]] = None,
+           pure: bool = False):
+    def register(function):
+        target = BUILTINS if registry is None else registry
+        target[name or function.__name__] = NativeFunction(name or function.__name__, function, arity(function), pure)
+        return function
+
+    return register if function is None else register(function)
@@ -0,0 +1,20 @@
+from .iterable import Iterable
+
+
+class Range(Iterable):
+    __slots__ = ('stop',)
+
+    def __init__(self, stop: int):
+        self.stop = stop
+
+    def __iter__(self):
+        return map(float, range(self.stop))
+
+    def __eq__(self, other):
+        return type(other) is Range and other.stop == self.stop
+
+    def __hash__(self):
+        return hash(self.stop)
+
+    def __str__(self):
+        return f'range({self.stop})'
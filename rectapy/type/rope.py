@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import List, Union
+
+ROPE_THRESHOLD = 1024
+
+
+class Rope:
+    __slots__ = ('parts', 'count', 'length', 'flat')
+
+    def __init__(self, parts: List[str], count: int, length: int):
+        self.parts = parts
+        self.count = count
+        self.length = length
+        self.flat = None
+
+    def append(self, text: str) -> Rope:
+        parts = self.parts
+        if len(parts) != self.count:
+            parts = parts[:self.count]
+
+        parts.append(text)
+        return Rope(parts, self.count + 1, self.length + len(text))
+
+    def __str__(self):
+        if self.flat is None:
+            self.flat = ''.join(self.parts[:self.count])
+            self.parts = [self.flat]
+            self.count = 1
+
+        return self.flat
+
+    def __len__(self):
+        return self.length
+
+    def __eq__(self, other):
+        if type(other) is Rope or type(other) is str:
+            return len(other) == self.length and str(other) == str(self)
+
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+
+def concatenate(left: Union[str, Rope], right: Union[str, Rope]) -> Union[str, Rope]:
+    if type(right) is Rope:
+        right = str(right)
+
+    if type(left) is Rope:
+        return left.append(right)
+
+    length = len(left) + len(right)
+    if length < ROPE_THRESHOLD:
+        return left + right
+
+    return Rope([left, right], 2, length)
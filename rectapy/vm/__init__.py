@@ -0,0 +1,5 @@
+from .opcode import OpCode
+from .chunk import Chunk
+from .function import Closure
+from .compiler import Compiler
+from .vm import VM
@@ -0,0 +1,65 @@
+from typing import List, Any, Dict, Tuple, Optional
+
+from rectapy import Token
+
+from .opcode import OpCode
+
+
+class Chunk:
+    def __init__(self, name: str = '<script>', arity: int = 0):
+        self.name = name
+        self.arity = arity
+        self.code: List[int] = []
+        self.constants: List[Any] = []
+        self.constant_indices: Dict[Tuple[type, Any], int] = {}
+        self.tokens: Dict[int, Token] = {}
+
+    def emit(self, opcode: OpCode, *operands: int, token: Optional[Token] = None) -> int:
+        position = len(self.code)
+        self.code.append(opcode.value)
+        self.code.extend(operands)
+
+        if token is not None:
+            self.tokens[position] = token
+
+        return position
+
+    def add_constant(self, value: Any) -> int:
+        if isinstance(value, (float, str)):
+            key = (type(value), value)
+            if key not in self.constant_indices:
+                self.constant_indices[key] = len(self.constants)
+                self.constants.append(value)
+
+            return self.constant_indices[key]
+
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+    def patch(self, position: int, target: int) -> None:
+        self.code[position + 1] = target
+
+    def disassemble(self) -> str:
+        lines = [f'== {self.name} ==']
+        offset = 0
+        while offset < len(self.code):
+            opcode = OpCode(self.code[offset])
+            operands = self.code[offset + 1: offset + 1 + opcode.operands]
+            line = f'{offset:04d} {opcode.name:<20} {" ".join(map(str, operands))}'.rstrip()
+
+            if opcode in (OpCode.CONSTANT, OpCode.CLOSURE):
+                line += f' ({self.constants[operands[0]]})'
+            elif opcode in (OpCode.DEFINE_GLOBAL, OpCode.GET_GLOBAL, OpCode.SET_GLOBAL):
+                line += f' ({self.constants[operands[0]]})'
+
+            lines.append(line)
+            offset += 1 + opcode.operands
+
+        for constant in self.constants:
+            if isinstance(constant, Chunk):
+                lines.append(constant.disassemble())
+
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return f'<chunk {self.name}>'
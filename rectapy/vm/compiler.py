@@ -0,0 +1,244 @@
+from typing import List, Dict, Tuple
+
+from rectapy import TokenType, expression as expr, statement as stmt
+
+from rectapy.operation import BINARY
+
+from .chunk import Chunk
+from .opcode import OpCode
+
+BINARY_OPCODES = {
+    TokenType.PLUS: OpCode.ADD,
+    TokenType.MINUS: OpCode.SUBTRACT,
+    TokenType.STAR: OpCode.MULTIPLY,
+    TokenType.SLASH: OpCode.DIVIDE,
+    TokenType.GREATER: OpCode.GREATER,
+    TokenType.GREATER_EQUAL: OpCode.GREATER_EQUAL,
+    TokenType.LESS: OpCode.LESS,
+    TokenType.LESS_EQUAL: OpCode.LESS_EQUAL,
+    TokenType.EQUAL_EQUAL: OpCode.EQUAL,
+    TokenType.EXCLAM_EQUAL: OpCode.NOT_EQUAL,
+}
+
+
+class Compiler(expr.ExprVisitor, stmt.StmtVisitor):
+    def __init__(self, locals: Dict[expr.Expression, Tuple[int, int]]):
+        self.locals = locals
+        self.chunk = Chunk()
+        self.scope_depth = 0
+
+    def compile(self, statements: List[stmt.Statement]) -> Chunk:
+        for statement in statements:
+            if isinstance(statement, stmt.Expression):
+                self.compile_expression(statement.expression)
+                self.chunk.emit(OpCode.RESULT)
+            else:
+                self.compile_statement(statement)
+                self.chunk.emit(OpCode.NULL)
+                self.chunk.emit(OpCode.RESULT)
+
+        self.chunk.emit(OpCode.NULL)
+        self.chunk.emit(OpCode.RETURN)
+
+        return self.chunk
+
+    def compile_statement(self, statement: stmt.Statement):
+        if statement:
+            statement.accept(self)
+
+    def compile_expression(self, expression: expr.Expression):
+        if expression:
+            expression.accept(self)
+        else:
+            self.chunk.emit(OpCode.NULL)
+
+    def compile_block(self, statements: List[stmt.Statement]):
+        for statement in statements:
+            self.compile_statement(statement)
+
+    def emit_jump(self, opcode: OpCode) -> int:
+        return self.chunk.emit(opcode, -1)
+
+    def patch_jump(self, position: int) -> None:
+        self.chunk.patch(position, len(self.chunk.code))
+
+    def name(self, name: str) -> int:
+        return self.chunk.add_constant(name)
+
+    def visit_assign(self, expression: expr.Assign):
+        self.compile_expression(expression.value)
+
+        if expression in self.locals:
+            self.chunk.emit(OpCode.SET_LOCAL, *self.locals[expression])
+        else:
+            self.chunk.emit(OpCode.SET_GLOBAL, self.name(expression.name.lexeme), token=expression.name)
+
+    def visit_binary(self, expression: expr.Binary):
+        self.compile_expression(expression.left)
+        self.compile_expression(expression.right)
+
+        if expression.operation is BINARY[expression.operator.type]:
+            self.chunk.emit(BINARY_OPCODES[expression.operator.type], token=expression.operator)
+        else:
+            self.chunk.emit(OpCode.BINARY, self.chunk.add_constant(expression.operation), token=expression.operator)
+
+    def visit_call(self, expression: expr.Call, opcode: OpCode = OpCode.CALL):
+        self.compile_expression(expression.callee)
+
+        for argument in expression.arguments:
+            self.compile_expression(argument)
+
+        self.chunk.emit(opcode, len(expression.arguments), token=expression.parenthesis)
+
+    def visit_get(self, expression: expr.Get):
+        self.chunk.emit(OpCode.NULL)
+
+    def visit_get_index(self, expression: expr.GetIndex):
+        self.compile_expression(expression.target)
+        self.compile_expression(expression.index)
+        self.chunk.emit(OpCode.GET_INDEX, token=expression.bracket)
+
+    def visit_grouping(self, expression: expr.Grouping):
+        self.compile_expression(expression.expression)
+
+    def visit_list(self, expression: expr.ListLiteral):
+        for element in expression.elements:
+            self.compile_expression(element)
+
+        self.chunk.emit(OpCode.BUILD_LIST, len(expression.elements))
+
+    def visit_literal(self, expression: expr.Literal):
+        if expression.value is None:
+            self.chunk.emit(OpCode.NULL)
+        elif expression.value is True:
+            self.chunk.emit(OpCode.TRUE)
+        elif expression.value is False:
+            self.chunk.emit(OpCode.FALSE)
+        else:
+            self.chunk.emit(OpCode.CONSTANT, self.chunk.add_constant(expression.value))
+
+    def visit_logical(self, expression: expr.Logical):
+        self.compile_expression(expression.left)
+
+        if expression.operator.type == TokenType.OR:
+            jump = self.emit_jump(OpCode.JUMP_IF_TRUE_OR_POP)
+        else:
+            jump = self.emit_jump(OpCode.JUMP_IF_FALSE_OR_POP)
+
+        self.compile_expression(expression.right)
+        self.patch_jump(jump)
+
+    def visit_set(self, expression: expr.Set):
+        self.chunk.emit(OpCode.NULL)
+
+    def visit_set_index(self, expression: expr.SetIndex):
+        self.compile_expression(expression.target)
+        self.compile_expression(expression.index)
+        self.compile_expression(expression.value)
+        self.chunk.emit(OpCode.SET_INDEX, token=expression.bracket)
+
+    def visit_unary(self, expression: expr.Unary):
+        self.compile_expression(expression.operand)
+
+        if expression.operator.type == TokenType.EXCLAM:
+            self.chunk.emit(OpCode.NOT)
+        else:
+            self.chunk.emit(OpCode.NEGATE, token=expression.operator)
+
+    def visit_variable_get(self, expression: expr.Variable):
+        if expression in self.locals:
+            self.chunk.emit(OpCode.GET_LOCAL, *self.locals[expression])
+        else:
+            self.chunk.emit(OpCode.GET_GLOBAL, self.name(expression.name.lexeme), token=expression.name)
+
+    def define(self, name: str):
+        if self.scope_depth:
+            self.chunk.emit(OpCode.DEFINE)
+        else:
+            self.chunk.emit(OpCode.DEFINE_GLOBAL, self.name(name))
+
+    def visit_block(self, statement: stmt.Block):
+        if not statement.scoped:
+            self.compile_block(statement.statements)
+            return
+
+        self.chunk.emit(OpCode.PUSH_ENV)
+        self.scope_depth += 1
+        self.compile_block(statement.statements)
+        self.scope_depth -= 1
+        self.chunk.emit(OpCode.POP_ENV)
+
+    def visit_expression(self, statement: stmt.Expression):
+        self.compile_expression(statement.expression)
+        self.chunk.emit(OpCode.POP)
+
+    def visit_function(self, statement: stmt.Function):
+        enclosing = self.chunk
+        self.chunk = Chunk(statement.name.lexeme, len(statement.parameters))
+        self.scope_depth += 1
+
+        try:
+            self.compile_block(statement.body)
+            self.chunk.emit(OpCode.NULL)
+            self.chunk.emit(OpCode.RETURN)
+        finally:
+            function, self.chunk = self.chunk, enclosing
+            self.scope_depth -= 1
+
+        self.chunk.emit(OpCode.CLOSURE, self.chunk.add_constant(function))
+        self.define(statement.name.lexeme)
+
+    def visit_if(self, statement: stmt.If):
+        self.compile_expression(statement.condition)
+        then_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+        self.compile_statement(statement.then_branch)
+
+        if statement.else_branch:
+            else_jump = self.emit_jump(OpCode.JUMP)
+            self.patch_jump(then_jump)
+            self.compile_statement(statement.else_branch)
+            self.patch_jump(else_jump)
+        else:
+            self.patch_jump(then_jump)
+
+    def visit_return(self, statement: stmt.Return):
+        if statement.tail_call:
+            self.visit_call(statement.value, OpCode.TAIL_CALL)
+        else:
+            self.compile_expression(statement.value)
+
+        self.chunk.emit(OpCode.RETURN)
+
+    def visit_print(self, statement: stmt.Print):
+        self.compile_expression(statement.expression)
+        self.chunk.emit(OpCode.PRINT)
+
+    def visit_variable_set(self, statement: stmt.Var):
+        self.compile_expression(statement.initializer)
+        self.define(statement.name.lexeme)
+
+    def visit_while(self, statement: stmt.While):
+        start = len(self.chunk.code)
+        self.compile_expression(statement.condition)
+        exit_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+        self.compile_statement(statement.body)
+        self.chunk.emit(OpCode.JUMP, start)
+        self.patch_jump(exit_jump)
+
+    def visit_for(self, statement: stmt.For):
+        self.compile_expression(statement.iterable)
+        self.chunk.emit(OpCode.ITERATE, token=statement.element)
+        self.chunk.emit(OpCode.PUSH_ENV)
+        self.chunk.emit(OpCode.NULL)
+        self.chunk.emit(OpCode.DEFINE)
+        self.chunk.emit(OpCode.DEFINE)
+        self.scope_depth += 1
+
+        start = len(self.chunk.code)
+        exit_jump = self.emit_jump(OpCode.FOR_ITER)
+        self.compile_statement(statement.body)
+        self.chunk.emit(OpCode.JUMP, start)
+        self.patch_jump(exit_jump)
+
+        self.scope_depth -= 1
+        self.chunk.emit(OpCode.POP_ENV)
@@ -0,0 +1,18 @@
+from rectapy import Environment, Callable
+
+from .chunk import Chunk
+
+
+class Closure(Callable):
+    def __init__(self, chunk: Chunk, closure: Environment):
+        self.chunk = chunk
+        self.closure = closure
+
+    def arity(self) -> int:
+        return self.chunk.arity
+
+    def call(self, interpreter, arguments):
+        return interpreter.call(self, arguments)
+
+    def __str__(self):
+        return f'<fn {self.chunk.name}>'
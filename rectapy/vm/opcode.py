@@ -0,0 +1,76 @@
+from enum import IntEnum, auto
+
+
+class OpCode(IntEnum):
+    CONSTANT = auto()
+    NULL = auto()
+    TRUE = auto()
+    FALSE = auto()
+    POP = auto()
+    RESULT = auto()
+
+    DEFINE = auto()
+    DEFINE_GLOBAL = auto()
+    GET_LOCAL = auto()
+    SET_LOCAL = auto()
+    GET_GLOBAL = auto()
+    SET_GLOBAL = auto()
+
+    ADD = auto()
+    SUBTRACT = auto()
+    MULTIPLY = auto()
+    DIVIDE = auto()
+    GREATER = auto()
+    GREATER_EQUAL = auto()
+    LESS = auto()
+    LESS_EQUAL = auto()
+    EQUAL = auto()
+    NOT_EQUAL = auto()
+    BINARY = auto()
+    NOT = auto()
+    NEGATE = auto()
+
+    BUILD_LIST = auto()
+    GET_INDEX = auto()
+    SET_INDEX = auto()
+
+    PRINT = auto()
+
+    JUMP = auto()
+    JUMP_IF_FALSE = auto()
+    JUMP_IF_FALSE_OR_POP = auto()
+    JUMP_IF_TRUE_OR_POP = auto()
+    ITERATE = auto()
+    FOR_ITER = auto()
+
+    CALL = auto()
+    TAIL_CALL = auto()
+    RETURN = auto()
+    CLOSURE = auto()
+
+    PUSH_ENV = auto()
+    POP_ENV = auto()
+
+    @property
+    def operands(self) -> int:
+        return OPERANDS.get(self, 0)
+
+
+OPERANDS = {
+    OpCode.CONSTANT: 1,
+    OpCode.DEFINE_GLOBAL: 1,
+    OpCode.GET_LOCAL: 2,
+    OpCode.SET_LOCAL: 2,
+    OpCode.GET_GLOBAL: 1,
+    OpCode.SET_GLOBAL: 1,
+    OpCode.JUMP: 1,
+    OpCode.JUMP_IF_FALSE: 1,
+    OpCode.JUMP_IF_FALSE_OR_POP: 1,
+    OpCode.JUMP_IF_TRUE_OR_POP: 1,
+    OpCode.FOR_ITER: 1,
+    OpCode.BINARY: 1,
+    OpCode.BUILD_LIST: 1,
+    OpCode.CALL: 1,
+    OpCode.TAIL_CALL: 1,
+    OpCode.CLOSURE: 1,
+}
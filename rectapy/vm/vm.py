@@ -0,0 +1,359 @@
+from typing import List, Dict, Tuple, Optional
+
+from rectapy import Environment, GlobalEnvironment, RectaRuntimeError, RectaStackOverflowError, Callable, \
+    NativeFunction, VARIADIC, RectaList, BUILTINS, iterate, expression as expr, statement as stmt
+from rectapy.interpreter import MAX_DEPTH, is_truthy, stringify, locate, recursion_limit
+from rectapy.operation import add, subtract, multiply, divide, greater, greater_equal, less, less_equal, negate, \
+    index, assign_index
+
+from .chunk import Chunk
+from .compiler import Compiler
+from .function import Closure
+from .opcode import OpCode
+
+
+class VM:
+    def __init__(self, max_depth: int = MAX_DEPTH):
+        self.globals = GlobalEnvironment(BUILTINS)
+        self.locals: Dict[expr.Expression, Tuple[int, int]] = {}
+        self.result = None
+        self.error: Optional[RectaRuntimeError] = None
+        self.max_depth = max_depth
+
+    def interpret(self, statements: List[stmt.Statement]):
+        chunk = Compiler(self.locals).compile(statements)
+
+        self.result = None
+        self.error = None
+        try:
+            with recursion_limit(self.max_depth):
+                self.run(chunk, self.globals)
+                return stringify(self.result)
+        except RectaRuntimeError as error:
+            self.error = error
+            print(error)
+
+    def resolve(self, expression: expr.Expression, depth: int, slot: int):
+        self.locals[expression] = (depth, slot)
+
+    def call(self, callee, arguments: List):
+        if not isinstance(callee, Callable):
+            raise RectaRuntimeError('Only functions are callable.')
+
+        arity = callee.arity()
+        if len(arguments) != arity and arity != VARIADIC:
+            raise RectaRuntimeError(f'Expected {arity} arguments but got {len(arguments)}.')
+
+        if type(callee) is Closure:
+            return self.run(callee.chunk, Environment(callee.closure, list(arguments)))
+
+        if type(callee) is NativeFunction:
+            return callee.function(*arguments)
+
+        return callee.call(self, arguments)
+
+    def run(self, chunk: Chunk, environment):
+        CONSTANT = OpCode.CONSTANT.value
+        NULL = OpCode.NULL.value
+        TRUE = OpCode.TRUE.value
+        FALSE = OpCode.FALSE.value
+        POP = OpCode.POP.value
+        RESULT = OpCode.RESULT.value
+        DEFINE = OpCode.DEFINE.value
+        DEFINE_GLOBAL = OpCode.DEFINE_GLOBAL.value
+        GET_LOCAL = OpCode.GET_LOCAL.value
+        SET_LOCAL = OpCode.SET_LOCAL.value
+        GET_GLOBAL = OpCode.GET_GLOBAL.value
+        SET_GLOBAL = OpCode.SET_GLOBAL.value
+        ADD = OpCode.ADD.value
+        SUBTRACT = OpCode.SUBTRACT.value
+        MULTIPLY = OpCode.MULTIPLY.value
+        DIVIDE = OpCode.DIVIDE.value
+        GREATER = OpCode.GREATER.value
+        GREATER_EQUAL = OpCode.GREATER_EQUAL.value
+        LESS = OpCode.LESS.value
+        LESS_EQUAL = OpCode.LESS_EQUAL.value
+        EQUAL = OpCode.EQUAL.value
+        NOT_EQUAL = OpCode.NOT_EQUAL.value
+        BINARY = OpCode.BINARY.value
+        NOT = OpCode.NOT.value
+        NEGATE = OpCode.NEGATE.value
+        BUILD_LIST = OpCode.BUILD_LIST.value
+        GET_INDEX = OpCode.GET_INDEX.value
+        SET_INDEX = OpCode.SET_INDEX.value
+        PRINT = OpCode.PRINT.value
+        JUMP = OpCode.JUMP.value
+        JUMP_IF_FALSE = OpCode.JUMP_IF_FALSE.value
+        JUMP_IF_FALSE_OR_POP = OpCode.JUMP_IF_FALSE_OR_POP.value
+        JUMP_IF_TRUE_OR_POP = OpCode.JUMP_IF_TRUE_OR_POP.value
+        ITERATE = OpCode.ITERATE.value
+        FOR_ITER = OpCode.FOR_ITER.value
+        CALL = OpCode.CALL.value
+        TAIL_CALL = OpCode.TAIL_CALL.value
+        RETURN = OpCode.RETURN.value
+        CLOSURE = OpCode.CLOSURE.value
+        PUSH_ENV = OpCode.PUSH_ENV.value
+        POP_ENV = OpCode.POP_ENV.value
+
+        globals = self.globals.values
+        frames = []
+        stack = []
+        push = stack.append
+        pop = stack.pop
+
+        code = chunk.code
+        constants = chunk.constants
+        ip = 0
+
+        try:
+            while True:
+                op = code[ip]
+
+                if op == GET_LOCAL:
+                    distance = code[ip + 1]
+                    scope = environment
+                    while distance:
+                        scope = scope.enclosing
+                        distance -= 1
+                    push(scope.values[code[ip + 2]])
+                    ip += 3
+                elif op == CONSTANT:
+                    push(constants[code[ip + 1]])
+                    ip += 2
+                elif op == GET_GLOBAL:
+                    name = constants[code[ip + 1]]
+                    try:
+                        push(globals[name])
+                    except KeyError:
+                        raise RectaRuntimeError(f'Undefined variable \'{name}\'.')
+                    ip += 2
+                elif op == JUMP_IF_FALSE:
+                    value = pop()
+                    if value is None or value is False or value == 0 and type(value) is float:
+                        ip = code[ip + 1]
+                    else:
+                        ip += 2
+                elif op == ADD:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left + right
+                    else:
+                        stack[-1] = add(left, right)
+                    ip += 1
+                elif op == SUBTRACT:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left - right
+                    else:
+                        stack[-1] = subtract(left, right)
+                    ip += 1
+                elif op == LESS_EQUAL:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left <= right
+                    else:
+                        stack[-1] = less_equal(left, right)
+                    ip += 1
+                elif op == LESS:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left < right
+                    else:
+                        stack[-1] = less(left, right)
+                    ip += 1
+                elif op == CALL or op == TAIL_CALL:
+                    count = code[ip + 1]
+                    callee = stack[-1 - count]
+
+                    if type(callee) is Closure:
+                        function = callee.chunk
+                        if count != function.arity:
+                            raise RectaRuntimeError(f'Expected {function.arity} arguments but got {count}.')
+
+                        if op == CALL:
+                            if len(frames) >= self.max_depth:
+                                raise RectaStackOverflowError('Stack overflow.')
+
+                            frames.append((chunk, code, constants, ip + 2, environment))
+
+                        if count:
+                            environment = Environment(callee.closure, stack[-count:])
+                            del stack[-count - 1:]
+                        else:
+                            environment = Environment(callee.closure)
+                            pop()
+
+                        chunk = function
+                        code = function.code
+                        constants = function.constants
+                        ip = 0
+                    else:
+                        arguments = stack[len(stack) - count:]
+                        del stack[-count - 1:]
+
+                        if not isinstance(callee, Callable):
+                            raise RectaRuntimeError('Only functions are callable.')
+
+                        arity = callee.arity()
+                        if count != arity and arity != VARIADIC:
+                            raise RectaRuntimeError(f'Expected {arity} arguments but got {count}.')
+
+                        if type(callee) is NativeFunction:
+                            push(callee.function(*arguments))
+                        else:
+                            push(callee.call(self, arguments))
+                        ip += 2
+                elif op == RETURN:
+                    if not frames:
+                        return pop()
+
+                    chunk, code, constants, ip, environment = frames.pop()
+                elif op == SET_LOCAL:
+                    distance = code[ip + 1]
+                    scope = environment
+                    while distance:
+                        scope = scope.enclosing
+                        distance -= 1
+                    scope.values[code[ip + 2]] = stack[-1]
+                    ip += 3
+                elif op == POP:
+                    pop()
+                    ip += 1
+                elif op == JUMP:
+                    ip = code[ip + 1]
+                elif op == MULTIPLY:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left * right
+                    else:
+                        stack[-1] = multiply(left, right)
+                    ip += 1
+                elif op == DIVIDE:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left / right
+                    else:
+                        stack[-1] = divide(left, right)
+                    ip += 1
+                elif op == GREATER:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left > right
+                    else:
+                        stack[-1] = greater(left, right)
+                    ip += 1
+                elif op == GREATER_EQUAL:
+                    right = pop()
+                    left = stack[-1]
+                    if type(left) is float and type(right) is float:
+                        stack[-1] = left >= right
+                    else:
+                        stack[-1] = greater_equal(left, right)
+                    ip += 1
+                elif op == EQUAL:
+                    right = pop()
+                    stack[-1] = stack[-1] == right
+                    ip += 1
+                elif op == NOT_EQUAL:
+                    right = pop()
+                    stack[-1] = stack[-1] != right
+                    ip += 1
+                elif op == BINARY:
+                    right = pop()
+                    stack[-1] = constants[code[ip + 1]](stack[-1], right)
+                    ip += 2
+                elif op == DEFINE:
+                    environment.values.append(pop())
+                    ip += 1
+                elif op == DEFINE_GLOBAL:
+                    globals[constants[code[ip + 1]]] = pop()
+                    ip += 2
+                elif op == SET_GLOBAL:
+                    name = constants[code[ip + 1]]
+                    if name not in globals:
+                        raise RectaRuntimeError(f'Undefined variable \'{name}\'.')
+                    globals[name] = stack[-1]
+                    ip += 2
+                elif op == NULL:
+                    push(None)
+                    ip += 1
+                elif op == TRUE:
+                    push(True)
+                    ip += 1
+                elif op == FALSE:
+                    push(False)
+                    ip += 1
+                elif op == NOT:
+                    stack[-1] = not is_truthy(stack[-1])
+                    ip += 1
+                elif op == NEGATE:
+                    stack[-1] = -stack[-1] if type(stack[-1]) is float else negate(stack[-1])
+                    ip += 1
+                elif op == JUMP_IF_FALSE_OR_POP:
+                    if is_truthy(stack[-1]):
+                        pop()
+                        ip += 2
+                    else:
+                        ip = code[ip + 1]
+                elif op == JUMP_IF_TRUE_OR_POP:
+                    if is_truthy(stack[-1]):
+                        ip = code[ip + 1]
+                    else:
+                        pop()
+                        ip += 2
+                elif op == FOR_ITER:
+                    slots = environment.values
+                    for value in slots[1]:
+                        slots[0] = value
+                        ip += 2
+                        break
+                    else:
+                        ip = code[ip + 1]
+                elif op == ITERATE:
+                    stack[-1] = iterate(stack[-1])
+                    ip += 1
+                elif op == BUILD_LIST:
+                    count = code[ip + 1]
+                    if count:
+                        values = stack[-count:]
+                        del stack[-count:]
+                    else:
+                        values = []
+                    push(RectaList(values))
+                    ip += 2
+                elif op == GET_INDEX:
+                    position = pop()
+                    stack[-1] = index(stack[-1], position)
+                    ip += 1
+                elif op == SET_INDEX:
+                    value = pop()
+                    position = pop()
+                    stack[-1] = assign_index(stack[-1], position, value)
+                    ip += 1
+                elif op == PUSH_ENV:
+                    environment = Environment(environment)
+                    ip += 1
+                elif op == POP_ENV:
+                    environment = environment.enclosing
+                    ip += 1
+                elif op == CLOSURE:
+                    push(Closure(constants[code[ip + 1]], environment))
+                    ip += 2
+                elif op == PRINT:
+                    print(stringify(pop()))
+                    ip += 1
+                elif op == RESULT:
+                    self.result = pop()
+                    ip += 1
+                else:
+                    raise RectaRuntimeError(f'Unknown opcode {op}.')
+        except RectaRuntimeError as error:
+            token = chunk.tokens.get(ip)
+            raise locate(error, token) if token else error
@@ -0,0 +1,64 @@
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+
+from rectapy.batch import batch, main
+
+SCRIPT = """
+var i = 0;
+while i < %d {
+  print "%s";
+  i = i + 1;
+}
+"""
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+
+    try:
+        filenames = []
+        for index in range(12):
+            filename = os.path.join(directory, f'script{index}.recta')
+            with open(filename, 'w') as f:
+                f.write(SCRIPT % (index * 20, f'line {index}'))
+            filenames.append(filename)
+
+        broken = os.path.join(directory, 'broken.recta')
+        with open(broken, 'w') as f:
+            f.write('print -"text";\n')
+
+        missing = os.path.join(directory, 'missing.recta')
+        filenames += [broken, missing]
+
+        results = list(batch(filenames, workers=3, cache=False))
+        assert [result.filename for result in results] == filenames
+
+        for index, result in enumerate(results[:12]):
+            assert result.output == f'line {index}\n' * (index * 20), result.filename
+            assert result.error is None
+
+        assert results[12].output == f'{broken}:1:7: Bad operand type for unary -\n'
+        assert results[12].error == f'RectaRuntimeError: {broken}:1:7: Bad operand type for unary -', results[12].error
+        assert results[13].output == '' and results[13].error.startswith('FileNotFoundError')
+
+        failures = 0
+        for name, source in (('syntax.recta', 'print "open;'), ('parse.recta', 'print (1;'),
+                             ('undefined.recta', 'print missing;')):
+            filename = os.path.join(directory, name)
+            with open(filename, 'w') as f:
+                f.write(source)
+            failures += next(batch([filename], workers=1, cache=False)).error is not None
+        assert failures == 3
+
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as summary:
+            assert main([broken, filenames[1], '--workers', '1', '--no-cache']) == 1
+        assert ', 1 failed\n' in summary.getvalue(), summary.getvalue()
+
+        unordered = {result.filename: result.output for result in batch(filenames, workers=3, ordered=False)}
+        assert unordered == {result.filename: result.output for result in results}
+    finally:
+        shutil.rmtree(directory)
+
+    print('batch: ok')
@@ -0,0 +1,117 @@
+import io
+import time
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, Budget
+
+FOREVER = """
+while true {
+}
+"""
+
+SPIN = """
+fun spin(n) {
+  return spin(n + 1);
+}
+
+spin(0);
+"""
+
+DEEP = """
+fun deep(n) {
+  if n <= 0 {
+    return 0;
+  }
+  return 1 + deep(n - 1);
+}
+
+print deep(50);
+"""
+
+BLOCKS = """
+var i = 0;
+while i < 100 {
+  var j = i;
+  i = i + 1;
+}
+print i;
+"""
+
+ARRAYS = """
+var a = array(100);
+var b = array(range(100));
+var c = array(a + b);
+print len(a);
+print len(b);
+print len(c);
+"""
+
+DOUBLING = """
+var text = "ab";
+text = text + text;
+text = text + text;
+text = text + text;
+print text;
+"""
+
+
+def run(code: str, budget: Budget, engine: str = 'tree') -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        RectaPy(engine).run(code, 'budget.recta', budget)
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    assert run(FOREVER, Budget(statements=1000)) == 'Exceeded the budget of 1000 statements.\n'
+    assert run(SPIN, Budget(statements=1000)) == 'budget.recta:6:7: Exceeded the budget of 1000 statements.\n'
+
+    start = time.monotonic()
+    assert run(FOREVER, Budget(seconds=0.1)) == 'Exceeded the time budget of 0.1 seconds.\n'
+    assert time.monotonic() - start < 2
+
+    assert run(DEEP, Budget(depth=100)) == '50\n'
+    assert run(DEEP, Budget(depth=20)) == 'budget.recta:6:24: Exceeded the budget of 20 nested calls.\n', \
+        run(DEEP, Budget(depth=20))
+
+    assert run(BLOCKS, Budget(environments=200)) == '100\n'
+    assert run(BLOCKS, Budget(environments=50)) == 'Exceeded the budget of 50 environments.\n'
+
+    assert run(DOUBLING, Budget(string_length=16)) == 'ab' * 8 + '\n'
+    assert run(DOUBLING, Budget(string_length=15)) == \
+        'budget.recta:5:13: Exceeded the budget of 15 characters per string.\n'
+
+    assert run(ARRAYS, Budget(array_length=100)) == '100\n100\n100\n'
+    start = time.monotonic()
+    assert run('print sum(range(20000000)) + max(range(20000000)) + min(range(20000000));',
+               Budget(seconds=0.05, array_length=10)) == '2e+14\n'
+    assert time.monotonic() - start < 1
+    assert run('print sum([1, 2, 3]);', Budget(array_length=2)) == \
+        'budget.recta:1:20: Exceeded the budget of 2 elements per array.\n'
+    assert run('print max([1, 2, 3]);', Budget(array_length=2)) == \
+        'budget.recta:1:20: Exceeded the budget of 2 elements per array.\n'
+    assert run('print min(range(0));', Budget()) == 'budget.recta:1:19: min() of an empty sequence.\n'
+
+    assert run('var big = array(100000000);', Budget(array_length=1000)) == \
+        'budget.recta:1:26: Exceeded the budget of 1000 elements per array.\n'
+    assert run('var big = array(range(100000000));', Budget(array_length=1000)) == \
+        'budget.recta:1:33: Exceeded the budget of 1000 elements per array.\n'
+    assert run('var small = array([1, 2]);', Budget(array_length=1)) == \
+        'budget.recta:1:25: Exceeded the budget of 1 elements per array.\n'
+
+    rectapy = RectaPy()
+    with redirect_stdout(io.StringIO()):
+        rectapy.run(DEEP, budget=Budget(depth=20, string_length=1))
+    assert rectapy.interpreter.budget is None
+    assert rectapy.interpreter.max_depth == 1000
+    assert run('print len(array(100000));', Budget()) == '100000\n'
+    assert 'visit_binary' not in rectapy.interpreter.__dict__
+
+    try:
+        RectaPy('vm').run(FOREVER, budget=Budget(statements=10))
+        assert False
+    except ValueError:
+        pass
+
+    print('budget: ok')
@@ -0,0 +1,105 @@
+import gc
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+PROGRAM = """
+fun scale(x) {
+  var factor = 3;
+  return x * factor;
+}
+
+{
+  var local = scale(2);
+  print local;
+}
+"""
+
+PRELUDE = """
+fun g(x) {
+  return x;
+}
+
+fun f(x) {
+  return g(x);
+}
+
+print f(1);
+"""
+
+BROKEN = """
+print 1;
+print (2;
+print 3;
+"""
+
+
+def run_file(rectapy: RectaPy, filename: str) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rectapy.run_file(filename)
+
+    return output.getvalue()
+
+
+def write(directory: str, name: str, source: str) -> str:
+    filename = os.path.join(directory, name)
+    with open(filename, 'w') as f:
+        f.write(source)
+
+    return filename
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+
+    try:
+        broken = write(directory, 'broken.recta', BROKEN)
+        expected = f'{broken}:3:9: Expect \')\' after expression.\n1\n3\n'
+        for _ in range(2):
+            assert run_file(RectaPy(), broken) == expected
+        assert not os.path.exists(os.path.join(directory, '__rectacache__'))
+
+        program = write(directory, 'program.recta', PROGRAM)
+        for warm in (False, True):
+            rectapy = RectaPy()
+            assert run_file(rectapy, program) == '6\n'
+            assert os.path.exists(os.path.join(directory, '__rectacache__'))
+
+            assert len(rectapy.interpreter.locals) == 2, (warm, rectapy.interpreter.locals)
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                rectapy.run('print scale(5);')
+            assert output.getvalue() == '15\n'
+
+            rectapy.interpreter.globals.values.pop('scale')
+            rectapy.resolver.functions.pop('scale', None)
+            gc.collect()
+            assert not rectapy.interpreter.locals, (warm, rectapy.interpreter.locals)
+
+        prelude = write(directory, 'prelude.recta', PRELUDE)
+        for warm in (False, True):
+            rectapy = RectaPy(memoize=16)
+            assert run_file(rectapy, prelude) == '1\n'
+            assert rectapy.resolver.functions['f'].pure, warm
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                rectapy.run('fun g(x) { return x * 10; } print f(1);')
+            assert output.getvalue() == '10\n', (warm, output.getvalue())
+            assert 'f' not in rectapy.resolver.functions, warm
+
+        undefined = write(directory, 'undefined.recta', '{ var a = 1; print a + missing; }')
+        for _ in range(2):
+            rectapy = RectaPy()
+            assert run_file(rectapy, undefined) == f'{undefined}:1:24: Undefined variable \'missing\'.\n'
+            assert not rectapy.interpreter.locals
+    finally:
+        shutil.rmtree(directory)
+
+    print('cache: ok')
@@ -0,0 +1,38 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(*arguments: str) -> subprocess.CompletedProcess:
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, '-m', 'rectapy', *arguments], capture_output=True, text=True,
+                          env=environment)
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+
+    try:
+        filename = os.path.join(directory, 'cli.recta')
+        with open(filename, 'w') as f:
+            f.write('fun square(x) { return x * x; }\nprint square(3) + square(3);\n')
+
+        for engine in ('tree', 'vm', 'closure', 'py'):
+            result = run('--backend', engine, '--no-cache', filename)
+            assert (result.returncode, result.stdout, result.stderr) == (0, '18\n', ''), (engine, result)
+
+        result = run('--memoize', '16', '--no-cache', filename)
+        assert result.returncode == 0 and result.stdout == '18\n', result
+        assert result.stderr == 'memo: 1 hits, 1 misses, 1/16 entries\n', result.stderr
+
+        for arguments in (('--memoize', '-1'), ('--backend', 'vm', '--memoize')):
+            result = run(*arguments, filename)
+            assert result.returncode == 2 and 'Traceback' not in result.stderr, result
+    finally:
+        shutil.rmtree(directory)
+
+    print('cli: ok')
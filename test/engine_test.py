@@ -0,0 +1,28 @@
+import glob
+import io
+import os
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+PROGRAMS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'programs')
+
+
+def run(engine: str, filename: str, optimize: bool = True) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        RectaPy(engine, optimize=optimize).run_file(filename)
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    for filename in sorted(glob.glob(os.path.join(PROGRAMS, '*.recta'))):
+        expected = run('tree', filename, optimize=False)
+
+        for engine in ENGINES:
+            actual = run(engine, filename)
+            assert actual == expected, f'{os.path.basename(filename)} ({engine}):\n{expected}!=\n{actual}'
+
+        print(f'{os.path.basename(filename)}: ok')
@@ -0,0 +1,75 @@
+import io
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, Interpreter, statement as stmt
+
+PROGRAM = """
+fun add(a, b) {
+  var c = a + b;
+  return c;
+}
+
+fun countdown(n) {
+  if n <= 0 {
+    return add(n, 1);
+  }
+  return countdown(n - 1);
+}
+
+print countdown(3);
+print nothing(1);
+"""
+
+
+def run(rectapy: RectaPy, code: str) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rectapy.run(code, 'hooks.recta')
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    rectapy = RectaPy(optimize=False)
+    interpreter = rectapy.interpreter
+    events = []
+
+    interpreter.listen('enter', lambda callee, arguments: events.append(('enter', str(callee), len(arguments))))
+    interpreter.listen('exit', lambda callee, value: events.append(('exit', str(callee), value)))
+    interpreter.listen('environment', lambda environment: events.append(('environment',)))
+    interpreter.listen('error', lambda error: events.append(('error', error.message)))
+
+    statements = []
+    interpreter.listen('statement', statements.append)
+
+    output = run(rectapy, PROGRAM.replace('print nothing(1);', 'var nothing = 1;\nprint nothing(1);'))
+    assert output == '1\nhooks.recta:16:16: Only functions are callable.\n', output
+
+    calls = [event for event in events if event[0] in ('enter', 'exit')]
+    assert calls == [('enter', '<fn countdown>', 1)] * 4 + [('enter', '<fn add>', 2), ('exit', '<fn add>', 1.0)] + \
+        [('exit', '<fn countdown>', 1.0)] * 4, calls
+    assert events.count(('environment',)) == 5
+    assert events[-1] == ('error', 'Only functions are callable.')
+    assert sum(isinstance(statement, stmt.Print) for statement in statements) == 2
+
+    assert interpreter.counters() == {'statements': len(statements), 'calls': 5, 'environments': 5, 'max_depth': 1}, \
+        interpreter.counters()
+
+    for event, listeners in interpreter.listeners.items():
+        for listener in list(listeners):
+            interpreter.unlisten(event, listener)
+
+    assert not set(interpreter.__dict__) & {'execute', 'execute_block', 'prepare_call', 'visit_call'}
+
+    count = len(events)
+    run(rectapy, 'print add(1, 2);')
+    assert len(events) == count
+    assert interpreter.counters()['calls'] == 1
+
+    try:
+        Interpreter().listen('statements', print)
+        assert False
+    except ValueError:
+        pass
+
+    print('instrumentation: ok')
@@ -1,7 +1,7 @@
 import sys, os
 sys.path.append(os.path.abspath('../'))
 
-from rectapy import Lexer, Parser, Interpreter
+from rectapy import Lexer, Parser, Interpreter, Resolver
 
 if __name__ == '__main__':
     lexer = Lexer("""
@@ -23,4 +23,7 @@ print fibonacci(10);
 
     interpreter = Interpreter()
 
+    resolver = Resolver(interpreter)
+    resolver.resolve(statements)
+
     interpreter.interpret(statements)
@@ -1,4 +1,39 @@
-from rectapy import Lexer
+import glob
+import os
+import random
+
+from rectapy import Lexer, RegexLexer, StreamLexer, RectaSyntaxError, TokenType
+
+PROGRAMS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'programs')
+
+FRAGMENTS = [
+    ' ', '\n', '\t', '(', ')', '{', '}', '[', ']', ',', '.', '-', '+', ';', '*', '/', '//', '!', '=', '<', '>',
+    '!=', '==', '<=', '>=', '1', '23', '4.5', '6.', 'x', 'name1', 'if', 'else', 'and', 'or', 'fun', 'var', 'true',
+    'false', 'null', 'for', 'while', 'in', 'return', 'print', 'iffy', '"str"', "'s'", '""', '"a\nb"', 'é', 'ñame',
+    '²', '_', '"', "'", '@', '#',
+]
+
+
+def lex(tokens):
+    try:
+        return [(token.type, token.lexeme, token.literal) for token in tokens()]
+    except RectaSyntaxError as error:
+        return str(error)
+
+
+def chunked(source: str, size: int):
+    return [source[i:i + size] for i in range(0, len(source), size)]
+
+
+def check(source: str):
+    expected = lex(Lexer(source).lex)
+    actual = lex(RegexLexer(source).lex)
+    assert actual == expected, f'{source!r}:\n{expected}\n!=\n{actual}'
+
+    for size in (1, 2, 3, 7):
+        actual = lex(lambda: StreamLexer(chunked(source, size), '<input>'))
+        assert actual == expected, f'{source!r} in chunks of {size}:\n{expected}\n!=\n{actual}'
+
 
 if __name__ == '__main__':
     lexer = Lexer("""
@@ -11,3 +46,21 @@ for i in range(10) {
     tokens = lexer.lex()
 
     print('\n'.join(map(str, tokens)))
+
+    assert [token.type for token in tokens] == [
+        TokenType.FOR, TokenType.IDENTIFIER, TokenType.IN, TokenType.IDENTIFIER, TokenType.LEFT_PAREN,
+        TokenType.NUMBER, TokenType.RIGHT_PAREN, TokenType.LEFT_BRACE, TokenType.IDENTIFIER, TokenType.DOT,
+        TokenType.IDENTIFIER, TokenType.LEFT_PAREN, TokenType.RIGHT_PAREN, TokenType.DOT, TokenType.PRINT,
+        TokenType.LEFT_PAREN, TokenType.RIGHT_PAREN, TokenType.RIGHT_BRACE, TokenType.EOF,
+    ]
+    check(lexer.source)
+
+    for filename in sorted(glob.glob(os.path.join(PROGRAMS, '*.recta'))):
+        with open(filename) as f:
+            check(f.read())
+
+    generator = random.Random(0)
+    for _ in range(5000):
+        check(''.join(generator.choice(FRAGMENTS) for _ in range(generator.randint(0, 20))))
+
+    print('lexer: ok')
@@ -0,0 +1,82 @@
+import io
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, Source, RegexLexer, RectaSyntaxError
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+
+CALL = """
+var x = 1;
+
+print x(2);
+"""
+
+NEGATE = """
+fun f(a) {
+  return -a;
+}
+f("text");
+"""
+
+SUBTRACT = """
+var a = "s";
+print 1 -
+  a;
+"""
+
+ARRAY = """
+var a = array(2);
+print a +
+  array(3);
+"""
+
+SELF = """
+var x =
+  x;
+"""
+
+FORWARD = """
+print y;
+var y = 1;
+"""
+
+PARSE = """
+var a = 1;
+var = 2;
+"""
+
+
+def run(engine: str, code: str, **options) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        RectaPy(engine, **options).run(code, 'test.recta')
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    source = Source('ab\ncd\n\nef', 'x')
+    assert [source.location(offset) for offset in (0, 1, 3, 6, 7)] == [(1, 1), (1, 2), (2, 1), (3, 1), (4, 1)]
+    assert source.describe(4) == 'x:2:2'
+
+    tokens = RegexLexer('var a\n  = 1;', 'y').lex()
+    assert [token.source.describe(token.offset) for token in tokens[:3]] == ['y:1:1', 'y:1:5', 'y:2:3']
+
+    try:
+        RegexLexer('var a = "open', 'z').lex()
+        assert False
+    except RectaSyntaxError as error:
+        assert str(error) == 'z:1:9: Unterminated string', str(error)
+
+    for engine in ENGINES:
+        assert run(engine, CALL) == 'test.recta:4:10: Only functions are callable.\n', engine
+        assert run(engine, NEGATE) == 'test.recta:3:10: Bad operand type for unary -\n', engine
+        assert run(engine, SUBTRACT, strict=True) == 'test.recta:3:9: Operands must be numbers.\n', engine
+        assert run(engine, ARRAY) == 'test.recta:3:9: Array lengths differ: 2 and 3.\n', engine
+        assert run(engine, ARRAY, strict=True) == 'test.recta:3:9: Array lengths differ: 2 and 3.\n', engine
+        assert run(engine, SELF) == 'test.recta:3:3: Undefined variable \'x\'.\n', engine
+        assert run(engine, FORWARD) == 'test.recta:2:7: Undefined variable \'y\'.\n', engine
+
+    assert run('tree', PARSE) == 'test.recta:3:5: Expect variable name.\n'
+
+    print('location: ok')
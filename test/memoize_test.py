@@ -0,0 +1,173 @@
+import io
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, MemoCache, statement as stmt
+
+FIBONACCI = """
+fun fibonacci(n) {
+  if n <= 1 {
+    return n;
+  }
+  return fibonacci(n - 2) + fibonacci(n - 1);
+}
+
+print fibonacci(60);
+"""
+
+PURITY = """
+var base = 2;
+
+fun square(x) {
+  return x * x;
+}
+
+fun hypotenuse(a, b) {
+  return sqrt(square(a) + square(b));
+}
+
+fun even(n) {
+  if n == 0 return true;
+  return odd(n - 1);
+}
+
+fun odd(n) {
+  if n == 0 return false;
+  return even(n - 1);
+}
+
+fun loud(x) {
+  print x;
+  return x;
+}
+
+fun scaled(x) {
+  return x * base;
+}
+
+fun counter() {
+  var count = 0;
+  fun increment() {
+    count = count + 1;
+    return count;
+  }
+  return increment;
+}
+
+fun bump(x) {
+  base = x;
+  return x;
+}
+
+fun apply(f, x) {
+  return f(x);
+}
+
+fun timed() {
+  return clock();
+}
+
+fun listed(x) {
+  return [x];
+}
+
+fun summed(n) {
+  var total = 0;
+  for i in range(n) total = total + square(i);
+  return total;
+}
+"""
+
+ANNOTATED = """
+var calls = 0;
+
+memoize fun slow(n) {
+  calls = calls + 1;
+  return n * 2;
+}
+
+print slow(1) + slow(1) + slow(2);
+print calls;
+"""
+
+
+def run(rectapy: RectaPy, code: str) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rectapy.run(code, 'memoize.recta')
+
+    return output.getvalue()
+
+
+def purity(rectapy: RectaPy):
+    return {name: function.pure for name, function in rectapy.resolver.functions.items()}
+
+
+if __name__ == '__main__':
+    rectapy = RectaPy(memoize=128)
+    assert run(rectapy, FIBONACCI) == '1.54801e+12\n'
+    assert rectapy.interpreter.memo.stats() == {'hits': 58, 'misses': 61, 'entries': 61, 'size': 128}, \
+        rectapy.interpreter.memo.stats()
+
+    rectapy = RectaPy()
+    assert rectapy.interpreter.memo is None
+    assert run(rectapy, FIBONACCI.replace('60', '15')) == '610\n'
+
+    rectapy = RectaPy()
+    run(rectapy, PURITY)
+    assert purity(rectapy) == {
+        'square': True, 'hypotenuse': True, 'even': True, 'odd': True, 'loud': False, 'scaled': False,
+        'counter': False, 'bump': False, 'apply': False, 'timed': False, 'listed': False, 'summed': True,
+    }, purity(rectapy)
+    assert 'base' in rectapy.resolver.rebound
+
+    run(rectapy, 'var square = 1;')
+    assert purity(rectapy) == {
+        'even': True, 'odd': True, 'loud': False, 'scaled': False, 'counter': False, 'bump': False, 'apply': False,
+        'timed': False, 'listed': False,
+    }, purity(rectapy)
+
+    rectapy = RectaPy(memoize=16)
+    assert run(rectapy, ANNOTATED) == '8\n2\n'
+    assert rectapy.interpreter.memo.stats()['hits'] == 1
+
+    rectapy = RectaPy(memoize=16)
+    run(rectapy, 'fun half(x) { return x / 2; }')
+    snapshot = rectapy.snapshot()
+    run(rectapy, 'fun half(x) { return x; }')
+    assert 'half' not in rectapy.resolver.functions and 'half' in rectapy.resolver.rebound
+    rectapy.reset(snapshot)
+    assert run(rectapy, 'fun twice(x) { return half(x) * 4; } print twice(3);') == '6\n'
+    assert rectapy.resolver.functions['twice'].pure
+
+    @rectapy.native(pure=True)
+    def triple(value):
+        return value * 3
+
+    run(rectapy, 'fun nine(x) { return triple(triple(x)); }')
+    assert rectapy.resolver.functions['nine'].pure
+
+    rectapy = RectaPy(memoize=4)
+    assert run(rectapy, 'fun id(x) { return x; } for i in range(10) id(i); print id(9) + id(true) + id([1]);') \
+        == 'null\n'
+    assert rectapy.interpreter.memo.stats() == {'hits': 1, 'misses': 11, 'entries': 4, 'size': 4}, \
+        rectapy.interpreter.memo.stats()
+
+    rectapy = RectaPy(memoize=16)
+    assert run(rectapy, 'fun f(x) { return -x; } print f(0); print f(-0); print f(0);') == '-0\n0\n-0\n'
+    assert rectapy.interpreter.memo.stats()['hits'] == 1
+
+    memo = MemoCache(2)
+    memo.hits = 3
+    memo.clear()
+    assert memo.stats() == {'hits': 0, 'misses': 0, 'entries': 0, 'size': 2}
+
+    for invalid in (lambda: RectaPy('vm', memoize=16), lambda: MemoCache(0)):
+        try:
+            invalid()
+            assert False
+        except ValueError:
+            pass
+
+    assert isinstance(rectapy.compile('memoize fun f() {}')[0], stmt.Function)
+
+    print('memoize: ok')
@@ -0,0 +1,82 @@
+import io
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, BUILTINS, VARIADIC, NativeFunction, native
+
+ENGINES = ('tree', 'vm', 'closure', 'py')
+
+PROGRAM = """
+print shout("hi");
+print join("-", "a", "b", "c");
+print join(",");
+print twice(21);
+shout("a", "b");
+"""
+
+
+def run(rectapy: RectaPy, code: str) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rectapy.run(code, 'native.recta')
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    @native
+    def twice(value):
+        return value * 2
+
+    assert twice(2) == 4
+    assert BUILTINS['twice'].arity() == 1
+
+    try:
+        for engine in ENGINES:
+            rectapy = RectaPy(engine)
+
+            @rectapy.native(name='shout')
+            def upper(text, suffix='!'):
+                return text.upper() + suffix
+
+            @rectapy.native
+            def join(separator, *parts):
+                return separator.join(parts)
+
+            assert isinstance(rectapy.interpreter.globals.values['join'], NativeFunction)
+            assert rectapy.interpreter.globals.values['join'].arity() == VARIADIC
+
+            expected = 'HI!\na-b-c\n\n42\nnative.recta:6:15: Expected 1 arguments but got 2.\n'
+            assert run(rectapy, PROGRAM) == expected, (engine, run(rectapy, PROGRAM))
+            assert 'shout' not in RectaPy(engine).interpreter.globals.values
+    finally:
+        del BUILTINS['twice']
+
+    callbacks = """
+fun fact(n) {
+  if n <= 1 return 1;
+  return n * fact(n - 1);
+}
+var offset = 10;
+fun shift(x) {
+  return x + offset;
+}
+print each(shift, 3);
+print apply(fact, 5);
+print apply(clock, 1);
+"""
+
+    for engine in ENGINES:
+        rectapy = RectaPy(engine)
+
+        @rectapy.native
+        def each(function, count):
+            return float(sum(rectapy.interpreter.call(function, [float(i)]) for i in range(int(count))))
+
+        @rectapy.native
+        def apply(function, value):
+            return rectapy.interpreter.call(function, [value])
+
+        assert run(rectapy, callbacks) == '33\n120\nnative.recta:12:21: Expected 0 arguments but got 1.\n', \
+            (engine, run(rectapy, callbacks))
+
+    print('native: ok')
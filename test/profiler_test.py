@@ -0,0 +1,57 @@
+import io
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy, Profiler
+from rectapy.profiler import MAIN, label
+
+PROGRAM = """
+fun fib(n) {
+  if n < 2 {
+    return n;
+  }
+  return fib(n - 1) + fib(n - 2);
+}
+
+fun countdown(n) {
+  if n <= 0 {
+    return fib(20);
+  }
+  return countdown(n - 1);
+}
+
+print countdown(100);
+"""
+
+
+def calls(profiler: Profiler):
+    return {label(key).split(' ')[0]: profile.calls for key, profile in profiler.functions.items()}
+
+
+if __name__ == '__main__':
+    profiler = Profiler()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        RectaPy(profiler=profiler).run(PROGRAM, 'profile.recta')
+
+    assert output.getvalue() == '6765\n', output.getvalue()
+    assert calls(profiler) == {MAIN: 1, 'countdown': 101, 'fib': 21891}, calls(profiler)
+    assert not profiler.stack
+
+    for profile in profiler.functions.values():
+        assert 0 <= profile.exclusive <= profile.inclusive + 1e-6
+
+    report = profiler.report()
+    assert 'fib (profile.recta:2:5)' in report
+    assert 'profile.recta:6  return fib(n - 1) + fib(n - 2);' in report
+
+    for line in profiler.collapsed().splitlines():
+        stack, samples = line.rsplit(' ', 1)
+        assert stack.startswith(MAIN) and int(samples) > 0
+
+    try:
+        RectaPy('vm', profiler=Profiler())
+        assert False
+    except ValueError:
+        pass
+
+    print('profiler: ok')
@@ -0,0 +1,125 @@
+import gc
+import io
+import sys
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+from rectapy.transpiler.interpreter import code_cache
+
+PRELUDE = """
+var base = 10;
+
+fun scale(value) {
+  var factor = 2;
+  return value * factor + base;
+}
+"""
+
+REQUEST = """
+var result;
+{
+  var value = scale(%d);
+  result = value + value + value;
+}
+fun square(x) {
+  return x * x;
+}
+print square(result);
+"""
+
+REQUESTS = 100000
+WARMUP = 1000
+
+
+class Discard:
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+if __name__ == '__main__':
+    for engine in ('tree', 'vm', 'closure', 'py'):
+        rectapy = RectaPy(engine)
+        rectapy.run(PRELUDE)
+        snapshot = rectapy.snapshot()
+
+        for i in range(3):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                rectapy.run(REQUEST % i)
+            assert output.getvalue() == f'{(3 * (i * 2 + 10)) ** 2:g}\n', (engine, output.getvalue())
+            assert 'square' in rectapy.interpreter.globals.values
+
+            rectapy.reset(snapshot)
+            assert 'square' not in rectapy.interpreter.globals.values and 'result' not in rectapy.resolver.globals
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rectapy.run('print square(2);')
+        assert output.getvalue() == '<input>:1:7: Undefined variable \'square\'.\n', (engine, output.getvalue())
+
+    for engine in ('tree', 'vm', 'closure', 'py'):
+        rectapy = RectaPy(engine)
+        rectapy.run('var seen = [0]; fun count() { seen[0] = seen[0] + 1; return seen[0]; }')
+        snapshot = rectapy.snapshot()
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for i in range(3):
+                rectapy.run('print count();')
+                rectapy.reset(snapshot)
+        assert output.getvalue() == '1\n2\n3\n', (engine, output.getvalue())
+
+    rectapy = RectaPy()
+    with redirect_stdout(Discard()):
+        for i in range(100):
+            rectapy.run('fun f(a) { var b = a; return b + %d; } { var c = f(1); print c; }' % i)
+    gc.collect()
+    assert len(rectapy.interpreter.locals) == 2, len(rectapy.interpreter.locals)
+
+    rectapy = RectaPy('py')
+    with redirect_stdout(Discard()):
+        rectapy.run('fun fail(x) { return -x; }')
+        names = len(rectapy.interpreter.globals.values)
+        for i in range(1000):
+            rectapy.run('var total = fail(%d) * 2; print -total;' % i)
+            rectapy.run('print total or 2; for i in range(2) { fun g() { return i; } g(); } { var v = 1; print v; }')
+    assert len(rectapy.interpreter.globals.values) == names + 1, len(rectapy.interpreter.globals.values)
+
+    code_cache.clear()
+    with redirect_stdout(Discard()):
+        for i in range(3):
+            rectapy.run('print total or 2; for i in range(2) { fun g() { return i; } g(); } { var v = 1; print v; }')
+    assert len(code_cache) == 1, list(code_cache)
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        rectapy.run('fail("text");')
+    assert output.getvalue() == '<input>:1:22: Bad operand type for unary -\n', output.getvalue()
+
+    rectapy = RectaPy()
+    rectapy.run(PRELUDE)
+    prelude_locals = len(rectapy.interpreter.locals)
+    snapshot = rectapy.snapshot()
+
+    with redirect_stdout(Discard()):
+        for i in range(WARMUP):
+            rectapy.run(REQUEST % i)
+            rectapy.reset(snapshot)
+
+        gc.collect()
+        before = sys.getallocatedblocks()
+
+        for i in range(REQUESTS):
+            rectapy.run(REQUEST % i)
+            rectapy.reset(snapshot)
+
+        gc.collect()
+        growth = sys.getallocatedblocks() - before
+
+    assert len(rectapy.interpreter.locals) == prelude_locals, len(rectapy.interpreter.locals)
+    assert growth < 1000, growth
+
+    print('session: ok')
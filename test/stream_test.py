@@ -0,0 +1,60 @@
+import glob
+import io
+import os
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+PROGRAMS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'programs')
+
+# Undefined globals are only reported before execution when the whole program is resolved at once.
+WHOLE_PROGRAM = {'undefined.recta'}
+
+
+def run(engine: str, source: str, size: int = 0) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        if size:
+            RectaPy(engine).run_stream(source[i:i + size] for i in range(0, len(source), size))
+        else:
+            RectaPy(engine).run(source, '<stream>')
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    for filename in sorted(glob.glob(os.path.join(PROGRAMS, '*.recta'))):
+        if os.path.basename(filename) in WHOLE_PROGRAM:
+            continue
+
+        with open(filename) as f:
+            source = f.read()
+
+        expected = run('tree', source)
+
+        for engine in ('tree', 'closure'):
+            for size in (1, 5, 4096):
+                actual = run(engine, source, size)
+                assert actual == expected, f'{os.path.basename(filename)} ({engine}, {size}):\n{expected}!=\n{actual}'
+
+        print(f'{os.path.basename(filename)}: ok')
+
+    for engine in ('tree', 'vm', 'closure', 'py'):
+        rectapy = RectaPy(engine)
+        sizes = []
+
+        def statements():
+            for i in range(50):
+                sizes.append(len(rectapy.interpreter.locals))
+                yield f'{{ var a = {i}; var b = a * 2; total = total + b; }}\n'
+            yield 'print total;\n'
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rectapy.run('var total = 0;')
+            rectapy.run_stream(statements())
+
+        assert output.getvalue() == '2450\n', (engine, output.getvalue())
+        assert max(sizes) <= 4 and not rectapy.interpreter.locals, (engine, sizes)
+
+    print('bounded locals: ok')
@@ -0,0 +1,50 @@
+import io
+from contextlib import redirect_stdout
+
+from rectapy import RectaPy
+
+COUNTDOWN = """
+fun countdown(n) {
+  if n <= 0 {
+    return "done";
+  }
+  return countdown(n - 1);
+}
+
+print countdown(100000);
+"""
+
+DEEP = """
+fun deep(n) {
+  if n <= 0 {
+    return 0;
+  }
+  return 1 + deep(n - 1);
+}
+
+print deep(100);
+print deep(1000);
+"""
+
+
+def run(engine: str, code: str, **options) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        RectaPy(engine, **options).run(code)
+
+    return output.getvalue()
+
+
+if __name__ == '__main__':
+    for engine in ('tree', 'vm', 'closure'):
+        assert run(engine, COUNTDOWN) == 'done\n', engine
+        print(f'{engine} tail call: ok')
+
+    for engine in ('tree', 'vm'):
+        assert run(engine, DEEP, max_depth=500).endswith(': Stack overflow.\n'), engine
+        print(f'{engine} stack overflow: ok')
+
+    for engine in ('tree', 'vm', 'closure', 'py'):
+        assert run(engine, DEEP, max_depth=101) == '100\n<input>:6:24: Stack overflow.\n', engine
+        assert run(engine, DEEP, max_depth=100) == '<input>:6:24: Stack overflow.\n', engine
+        print(f'{engine} exact depth: ok')